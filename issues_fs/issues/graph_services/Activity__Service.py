@@ -0,0 +1,177 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Activity__Service - Repository-wide "what changed recently" feed
+#
+# Write paths (Node__Service, Link__Service, Comments__Service) call
+# record_event(), which appends a raw event dict to the newest segment of the
+# event's UTC day (indexes/activity/{YYYY-MM-DD}/{seq}.json). Segments hold at
+# most ACTIVITY__SEGMENT_SIZE events, so a write rewrites one bounded file
+# rather than the whole day; the read-modify-write runs under ACTIVITY__LOCK.
+# Reading the feed walks segments newest first and stops as soon as a page is
+# full, so the cost is bounded by page size (plus whatever the filters skip)
+# instead of by the number of issues.
+#
+# Events carry the node's real folder (including nested .../issues/{Label}
+# folders), so subtree filters match hierarchical issues.
+#
+# Cursor format: "{day}:{offset}" - the position within the day of the last
+# event returned; the next page continues with older events.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import threading
+from datetime                                                                                           import datetime, timezone
+from typing                                                                                             import Iterator
+from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now                        import Timestamp_Now
+from issues_fs.schemas.enums.Enum__Activity__Event__Type                                                import Enum__Activity__Event__Type
+from issues_fs.schemas.graph.Schema__Activity__Event                                                    import Schema__Activity__Event
+from issues_fs.schemas.graph.Schema__Activity__Feed__Response                                           import Schema__Activity__Feed__Response
+from issues_fs.issues.graph_services.Graph__Repository                                                  import Graph__Repository
+
+DEFAULT_FEED_LIMIT      = 50
+ACTIVITY__SEGMENT_SIZE  = 100                                                    # events per segment file
+ACTIVITY__LOCK          = threading.Lock()                                       # segment read-modify-write is one step per process
+
+
+class Activity__Service(Type_Safe):                                              # Activity feed service
+    repository : Graph__Repository                                               # Data access layer
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Recording Events
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def record_event(self                                           ,            # Append event to its day's newest segment
+                     event_type : Enum__Activity__Event__Type       ,
+                     node_type  : str                               ,
+                     label      : str                               ,
+                     author     : str                        = ''   ,
+                     detail     : str                        = ''   ,
+                     timestamp  : Timestamp_Now              = None ,
+                     path       : str                        = ''                # Node folder, resolved from label when empty
+                ) -> Schema__Activity__Event:
+        event = Schema__Activity__Event(timestamp  = timestamp if timestamp else Timestamp_Now()              ,
+                                        event_type = event_type                                               ,
+                                        node_type  = node_type                                                ,
+                                        label      = label                                                    ,
+                                        path       = path or self.node_folder(node_type, label)               ,
+                                        author     = author                                                   ,
+                                        detail     = detail                                                   )
+        day = self.day_for_timestamp(int(event.timestamp))
+
+        with ACTIVITY__LOCK:
+            manifest = self.repository.activity_manifest_load()
+            count    = manifest['segments'].get(day, 0)
+            events   = self.repository.activity_segment_load(day, count - 1) if count else []
+            if count == 0 or len(events) >= ACTIVITY__SEGMENT_SIZE:              # start a new segment
+                seq    = count
+                events = []
+                if day not in manifest['days']:
+                    manifest['days'] = sorted(manifest['days'] + [day])
+                manifest['segments'][day] = count + 1
+            else:
+                seq      = count - 1
+                manifest = None
+
+            events.append(event.json())
+            self.repository.activity_segment_save(day, seq, events)
+            if manifest is not None:
+                self.repository.activity_manifest_save(manifest)
+        return event
+
+    def node_folder(self, node_type: str, label: str) -> str:                   # Real folder of the node (nested issues too)
+        folder = self.repository.path_handler.path_for_node_folder(node_type, label)
+        if self.repository.storage_fs.file__exists(f'{folder}/issue.json'):
+            return folder
+        found = self.repository.node_find_path_by_label(label)
+        return str(found) if found else folder
+
+    def day_for_timestamp(self, timestamp: int) -> str:                          # Partition key (UTC day) for timestamp
+        return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Reading the Feed
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def get_feed(self                                ,                           # Page backwards in time
+                 limit      : int = DEFAULT_FEED_LIMIT ,
+                 cursor     : str = ''                 ,
+                 author     : str = ''                 ,                         # Only events by this author
+                 event_type : str = ''                 ,                         # Only events of this type
+                 subtree    : str = ''                                           # Only events for nodes under this folder
+            ) -> Schema__Activity__Feed__Response:
+        manifest = self.repository.activity_manifest_load()
+        days     = manifest['days']
+
+        start_day, start_offset = None, None
+        if cursor:
+            start_day, start_offset = self.parse_cursor(cursor)
+            if start_day is None:
+                return Schema__Activity__Feed__Response(success = False                       ,
+                                                        message = f'Invalid cursor: {cursor}' )
+
+        page        = []
+        next_cursor = ''
+        for day in reversed(days):                                               # Newest partition first
+            if start_day is not None and day > start_day:
+                continue
+
+            before = start_offset if day == start_day else None
+            for offset, raw in self.iter_day_backwards(day, manifest['segments'].get(day, 0), before):
+                if self.matches(raw, author, event_type, subtree):
+                    page.append(raw)
+                    if len(page) == limit:
+                        next_cursor = f'{day}:{offset}'
+                        break
+
+            if next_cursor:
+                break
+
+        if next_cursor and self.is_last_event(days, next_cursor):                # Nothing older to page into
+            next_cursor = ''
+
+        return Schema__Activity__Feed__Response(success     = True                                              ,
+                                                events      = [Schema__Activity__Event.from_json(raw) for raw in page],
+                                                next_cursor = next_cursor                                       )
+
+    def iter_day_backwards(self, day      : str ,                                # (offset within day, raw event), newest first
+                                 segments : int ,
+                                 before   : int = None                           # only offsets below this
+                          ) -> Iterator[tuple]:
+        last_seq = segments - 1
+        if before is not None:
+            if before <= 0:
+                return
+            last_seq = min(last_seq, (before - 1) // ACTIVITY__SEGMENT_SIZE)
+        for seq in range(last_seq, -1, -1):                                      # segments are only loaded when reached
+            events = self.repository.activity_segment_load(day, seq)
+            for index in range(len(events) - 1, -1, -1):
+                offset = seq * ACTIVITY__SEGMENT_SIZE + index
+                if before is not None and offset >= before:
+                    continue
+                yield offset, events[index]
+
+    def matches(self                ,                                            # Apply feed filters to a raw event
+                raw        : dict   ,
+                author     : str    ,
+                event_type : str    ,
+                subtree    : str
+           ) -> bool:
+        if author and raw.get('author') != author:
+            return False
+        if event_type and raw.get('event_type') != event_type:
+            return False
+        if subtree:
+            path   = raw.get('path', '')
+            prefix = subtree.rstrip('/')
+            if path != prefix and path.startswith(f'{prefix}/') is False:
+                return False
+        return True
+
+    def parse_cursor(self, cursor: str) -> tuple:                                # "{day}:{offset}" -> (day, offset)
+        day, _, offset = cursor.rpartition(':')
+        if not day or offset.isdigit() is False:
+            return (None, None)
+        return (day, int(offset))
+
+    def is_last_event(self, days: list, cursor: str) -> bool:                    # Cursor points at the oldest event stored
+        day, offset = self.parse_cursor(cursor)
+        return offset == 0 and len(days) > 0 and days[0] == day
@@ -1,26 +1,37 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Comments__Service - Business logic for comment CRUD operations
+#
+# Comments are stored as raw dicts in node.properties['comments'] (oldest first).
+# A small per-issue id -> offset index avoids walking that list on every
+# get/update/delete, and list_comments only materializes the requested page.
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from typing                                                                                         import List
 from osbot_utils.type_safe.Type_Safe                                                                import Type_Safe
 from osbot_utils.type_safe.primitives.domains.identifiers.Obj_Id                                    import Obj_Id
 from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now                    import Timestamp_Now
+from issues_fs.schemas.enums.Enum__Activity__Event__Type          import Enum__Activity__Event__Type
 from issues_fs.schemas.graph.Safe_Str__Graph_Types                 import Safe_Str__Node_Type, Safe_Str__Node_Label
 from issues_fs.schemas.issues.Schema__Comment                      import Schema__Comment__List__Response, Schema__Comment__Create__Request, Schema__Comment__Response, Schema__Comment, Schema__Comment__Update__Request, Schema__Comment__Delete__Response
+from issues_fs.issues.graph_services.Activity__Service     import Activity__Service
 from issues_fs.issues.graph_services.Graph__Repository     import Graph__Repository
 
 
 class Comments__Service(Type_Safe):                                              # Comment business logic service
-    repository : Graph__Repository = None                                                   # Graph__Repository instance
+    repository       : Graph__Repository = None                                  # Graph__Repository instance
+    activity_service : Activity__Service = None                                  # Optional activity feed writer
+    comment_offsets  : dict                                                      # (node_type, label) -> {comment_id: offset}
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # List Comments
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def list_comments(self                              ,                        # List all comments on a node
-                      node_type : Safe_Str__Node_Type   ,
-                      label     : Safe_Str__Node_Label
+    def list_comments(self                              ,                        # List comments on a node (optionally paged)
+                      node_type    : Safe_Str__Node_Type   ,
+                      label        : Safe_Str__Node_Label  ,
+                      limit        : int                   = 0     ,             # 0 = no limit (all comments)
+                      cursor       : str                   = ''    ,             # Comment id to start after
+                      newest_first : bool                  = False
                  ) -> Schema__Comment__List__Response:
         node = self.repository.node_load(node_type = node_type ,
                                          label     = label     )
@@ -30,12 +41,31 @@ class Comments__Service(Type_Safe):
                                                    total    = 0                         ,
                                                    message  = f'Node not found: {label}')
 
-        raw_comments = node.properties.get('comments', []) if node.properties else []
-        comments     = self._parse_comments(raw_comments)
-
-        return Schema__Comment__List__Response(success  = True          ,
-                                               comments = comments      ,
-                                               total    = len(comments) )
+        raw_comments = self._raw_comments(node)
+        total        = len(raw_comments)
+        order        = range(total - 1, -1, -1) if newest_first else range(total)  # Offsets in iteration order
+
+        start = 0
+        if cursor:
+            offset = self._find_offset(node_type, label, raw_comments, cursor)
+            if offset < 0:
+                return Schema__Comment__List__Response(success  = False                            ,
+                                                       comments = []                               ,
+                                                       total    = total                            ,
+                                                       message  = f'Comment not found: {cursor}'   )
+            start = (total - offset) if newest_first else (offset + 1)           # Position right after the cursor
+
+        end         = total if limit <= 0 else min(total, start + limit)
+        page        = [raw_comments[i] for i in order[start:end]]                # Only the page is parsed
+        comments    = self._parse_comments(page)
+        next_cursor = ''
+        if end < total and page:
+            next_cursor = str(page[-1].get('id', ''))
+
+        return Schema__Comment__List__Response(success     = True        ,
+                                               comments    = comments    ,
+                                               total       = total       ,
+                                               next_cursor = next_cursor )
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Create Comment
@@ -79,11 +109,17 @@ class Comments__Service(Type_Safe):
         node.properties['comments'].append(comment.json())
         node.updated_at = now
 
+        offsets = self.comment_offsets.get(self._node_key(node_type, label))     # Keep the offset index warm
+        if offsets is not None and len(offsets) == len(node.properties['comments']) - 1:
+            offsets[str(comment.id)] = len(node.properties['comments']) - 1
+
         # Save node
         if self.repository.node_save(node) is False:
             return Schema__Comment__Response(success = False                  ,
                                              message = 'Failed to save node'  )
 
+        self._record_activity(Enum__Activity__Event__Type.COMMENT_CREATED, node_type, label, comment.author, now)
+
         return Schema__Comment__Response(success = True    ,
                                          comment = comment )
 
@@ -102,16 +138,16 @@ class Comments__Service(Type_Safe):
             return Schema__Comment__Response(success = False                     ,
                                              message = f'Node not found: {label}')
 
-        raw_comments = node.properties.get('comments', []) if node.properties else []
+        raw_comments = self._raw_comments(node)
+        offset       = self._find_offset(node_type, label, raw_comments, comment_id)
 
-        for raw in raw_comments:
-            if raw.get('id') == comment_id:
-                comment = self._parse_comment(raw)
-                return Schema__Comment__Response(success = True    ,
-                                                 comment = comment )
+        if offset < 0:
+            return Schema__Comment__Response(success = False                              ,
+                                             message = f'Comment not found: {comment_id}')
 
-        return Schema__Comment__Response(success = False                              ,
-                                         message = f'Comment not found: {comment_id}')
+        comment = self._parse_comment(raw_comments[offset])
+        return Schema__Comment__Response(success = True    ,
+                                         comment = comment )
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Update Comment
@@ -135,25 +171,20 @@ class Comments__Service(Type_Safe):
             return Schema__Comment__Response(success = False                     ,
                                              message = f'Node not found: {label}')
 
-        raw_comments = node.properties.get('comments', []) if node.properties else []
-
-        # Find and update comment
-        found   = False
-        updated = None
-        now     = Timestamp_Now()
+        raw_comments = self._raw_comments(node)
+        offset       = self._find_offset(node_type, label, raw_comments, comment_id)
 
-        for raw in raw_comments:
-            if raw.get('id') == comment_id:
-                raw['text']       = str(request.text)
-                raw['updated_at'] = int(now)
-                updated           = self._parse_comment(raw)
-                found             = True
-                break
-
-        if not found:
+        if offset < 0:
             return Schema__Comment__Response(success = False                              ,
                                              message = f'Comment not found: {comment_id}')
 
+        # Update comment in place
+        now               = Timestamp_Now()
+        raw               = raw_comments[offset]
+        raw['text']       = str(request.text)
+        raw['updated_at'] = int(now)
+        updated           = self._parse_comment(raw)
+
         # Save node
         node.properties['comments'] = raw_comments
         node.updated_at             = now
@@ -162,6 +193,8 @@ class Comments__Service(Type_Safe):
             return Schema__Comment__Response(success = False                 ,
                                              message = 'Failed to save node' )
 
+        self._record_activity(Enum__Activity__Event__Type.COMMENT_UPDATED, node_type, label, updated.author, now)
+
         return Schema__Comment__Response(success = True    ,
                                          comment = updated )
 
@@ -183,18 +216,18 @@ class Comments__Service(Type_Safe):
                                                      comment_id = comment_id                ,
                                                      message    = f'Node not found: {label}')
 
-        raw_comments = node.properties.get('comments', []) if node.properties else []
-        original_len = len(raw_comments)
+        raw_comments = self._raw_comments(node)
+        offset       = self._find_offset(node_type, label, raw_comments, comment_id)
 
-        # Filter out the comment to delete
-        raw_comments = [c for c in raw_comments if c.get('id') != comment_id]
-
-        if len(raw_comments) == original_len:
+        if offset < 0:
             return Schema__Comment__Delete__Response(success    = False                              ,
                                                      deleted    = False                              ,
                                                      comment_id = comment_id                         ,
                                                      message    = f'Comment not found: {comment_id}')
 
+        removed = raw_comments.pop(offset)                                       # Remove the comment
+        self.comment_offsets.pop(self._node_key(node_type, label), None)         # Later offsets shifted, rebuild on next use
+
         # Save node
         node.properties['comments'] = raw_comments
         node.updated_at             = Timestamp_Now()
@@ -205,6 +238,8 @@ class Comments__Service(Type_Safe):
                                                      comment_id = comment_id            ,
                                                      message    = 'Failed to save node' )
 
+        self._record_activity(Enum__Activity__Event__Type.COMMENT_DELETED, node_type, label, removed.get('author', ''), node.updated_at)
+
         return Schema__Comment__Delete__Response(success    = True       ,
                                                  deleted    = True       ,
                                                  comment_id = comment_id )
@@ -213,6 +248,61 @@ class Comments__Service(Type_Safe):
     # Helper Methods
     # ═══════════════════════════════════════════════════════════════════════════════
 
+    def _record_activity(self                                   ,                # Append comment event to activity feed
+                         event_type : Enum__Activity__Event__Type ,
+                         node_type  : Safe_Str__Node_Type         ,
+                         label      : Safe_Str__Node_Label        ,
+                         author     : str                         ,
+                         timestamp  : Timestamp_Now
+                    ) -> None:
+        if self.activity_service is None:
+            return
+        self.activity_service.record_event(event_type = event_type  ,
+                                           node_type  = node_type   ,
+                                           label      = label       ,
+                                           author     = str(author) ,
+                                           timestamp  = timestamp   )
+
+    def _raw_comments(self, node) -> list:                                       # Raw comment dicts stored on node
+        if node.properties is None:
+            node.properties = {}
+        return node.properties.get('comments', [])
+
+    def _node_key(self                              ,                            # Key for the per-issue offset index
+                  node_type : Safe_Str__Node_Type   ,
+                  label     : Safe_Str__Node_Label
+             ) -> tuple:
+        return (str(node_type), str(label))
+
+    def _build_offsets(self                              ,                       # Rebuild id -> offset index for a node
+                       node_type    : Safe_Str__Node_Type   ,
+                       label        : Safe_Str__Node_Label  ,
+                       raw_comments : list
+                  ) -> dict:
+        offsets = {}
+        for offset, raw in enumerate(raw_comments):
+            comment_id = raw.get('id') if raw else None
+            if comment_id and comment_id not in offsets:                         # First occurrence wins (matches old scan)
+                offsets[str(comment_id)] = offset
+        self.comment_offsets[self._node_key(node_type, label)] = offsets
+        return offsets
+
+    def _find_offset(self                              ,                         # Find position of a comment id (-1 if missing)
+                     node_type    : Safe_Str__Node_Type   ,
+                     label        : Safe_Str__Node_Label  ,
+                     raw_comments : list                  ,
+                     comment_id   : str
+                ) -> int:
+        comment_id = str(comment_id)
+        offsets    = self.comment_offsets.get(self._node_key(node_type, label))
+        if offsets is not None:
+            offset = offsets.get(comment_id)
+            if offset is not None and offset < len(raw_comments) and raw_comments[offset].get('id') == comment_id:
+                return offset                                                    # Index hit, verified against the stored list
+
+        offsets = self._build_offsets(node_type, label, raw_comments)            # Missing or stale (e.g. edited on disk)
+        return offsets.get(comment_id, -1)
+
     def _parse_comments(self, raw_comments: list) -> List[Schema__Comment]:      # Parse raw dicts to Schema__Comment
         comments = []
         for raw in raw_comments:
@@ -18,8 +18,32 @@
 #   - issues_files_load(): parses .issues files into Schema__Node list
 #   - nodes_list_all(): now includes nodes from .issues files
 #   - node_load_by_label(): searches .issues-sourced nodes too
+#   - issues_files_refresh(): re-parses only files whose fingerprint changed
+#   - issues_file_by_label / issues_file_by_type: lookup views over the cache
+#   - issues_file_compiled: optional JSON sidecars under indexes/issues_files/
+#     (sidecars of .issues files that no longer exist are deleted)
+#
+# Node Caches (opt-in, node_cache_enabled):
+#   - node_path_cache: label -> folder path for node_find_path_by_label()
+#   - node_type_cache: issue.json path -> node_type for nodes_list_all()
+#   - registry_cache: parsed node-types / type-index / global-index JSON
+#   - only safe when external edits are reported, e.g. by Graph__Repository__Watcher
+#
+# Path Index:
+#   - path_index: Path__Tree__Index (directory trie)
+#   - kept between calls only when node_cache_enabled (external edits are
+#     reported, e.g. by Graph__Repository__Watcher, which calls
+#     path_index_invalidate()); otherwise every path_index_get() lists storage
+#     fresh, so edits made by other processes are always seen
+#   - file_save() / file_delete() keep the kept index in sync; all writes should go through them
+#   - folder_rename() (local disk only) / folder_copy_delete() move whole subtrees
+#   - also the live file / byte counters behind Storage__Status__Service;
+#     write_failures counts failed file_save() calls
+#   - issue_paths_version: bumped whenever the issue.json set may have changed,
+#     so derived views (e.g. Node__Service root view) know when to rebuild
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
 from typing                                                                                             import List, Optional
 from memory_fs.Memory_FS                                                                                import Memory_FS
 from memory_fs.storage_fs.Storage_FS                                                                    import Storage_FS
@@ -27,7 +51,9 @@ from osbot_utils.type_safe.Type_Safe
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                                          import type_safe
 from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path                       import Safe_Str__File__Path
 from osbot_utils.utils.Json                                                                             import json_loads, json_dumps
+from osbot_utils.utils.Misc                                                                             import bytes_md5
 from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type, Safe_Str__Node_Label
+from issues_fs.schemas.graph.Schema__Children__Index                                                    import Schema__Children__Index
 from issues_fs.schemas.graph.Schema__Global__Index                                                      import Schema__Global__Index
 from issues_fs.schemas.graph.Schema__Node                                                               import Schema__Node
 from issues_fs.schemas.graph.Schema__Node__Info                                                         import Schema__Node__Info
@@ -35,10 +61,13 @@ from issues_fs.schemas.graph.Schema__Node__Type
 from issues_fs.schemas.graph.Schema__Link__Type                                                         import Schema__Link__Type
 from issues_fs.schemas.graph.Schema__Type__Index                                                        import Schema__Type__Index
 from issues_fs.issues.storage.Path__Handler__Graph_Node                                                 import Path__Handler__Graph_Node
+from issues_fs.issues.storage.Path__Tree__Index                                                         import Path__Tree__Index
+from issues_fs.issues.issues_file.Issues_File__Compiled                                                 import Issues_File__Compiled
 from issues_fs.issues.issues_file.Issues_File__Loader__Service                                          import Issues_File__Loader__Service
 
 # todo: find a better way to do this
 SKIP_LABELS  = {'config', 'data', 'issues', 'indexes', '.issues'}                # Phase 2: System folder names
+SIDECAR_SUFFIXES = ('.json.zlib', '.bin')                                        # .issues sidecars: current + pre-JSON format
 
 class Graph__Repository(Type_Safe):                                              # Memory-FS based graph repository
     memory_fs            : Memory_FS                                             # Storage abstraction
@@ -47,6 +76,18 @@ class Graph__Repository(Type_Safe):
     issues_file_loader   : Issues_File__Loader__Service  = None                  # .issues file loader
     issues_file_nodes    : list                          = None                  # cached nodes from .issues files
     issues_file_loaded   : bool                          = False                 # whether cache is populated
+    issues_file_cache    : dict                                                  # path -> (fingerprint, load result) per .issues file
+    issues_file_by_label : dict                          = None                  # label -> Schema__Node (first occurrence wins)
+    issues_file_by_type  : dict                          = None                  # node_type -> [Schema__Node]
+    issues_file_compiled : bool                          = False                 # read/write compiled sidecars (skip parsing at startup)
+    issues_file_stats    : dict                                                  # last refresh: parsed / memory_hits / compiled_hits
+    node_cache_enabled   : bool                          = False                 # cache label -> path and path -> node_type
+    node_path_cache      : dict                                                  # label -> folder path
+    node_type_cache      : dict                                                  # issue.json path -> node_type
+    registry_cache       : dict                                                  # config / index path -> parsed JSON (None = missing)
+    path_index           : Path__Tree__Index             = None                  # directory trie over storage paths (lazy)
+    issue_paths_version  : int                           = 0                     # bumped on issue.json writes / deletes / moves
+    write_failures       : int                           = 0                     # file_save() calls the backend rejected
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -66,10 +107,11 @@ class Graph__Repository(Type_Safe):
                                                            label     = node.label    )
         data       = node.json()
         content    = json_dumps(data, indent=2)
-        result     = self.storage_fs.file__save(path_issue, content.encode('utf-8'))
+        result     = self.file_save(path_issue, content.encode('utf-8'))
 
         if result is True:                                                       # Phase 2 (B12): Delete legacy file
             self.delete_legacy_node_json(node.node_type, node.label)
+            self.node_cache_invalidate(path_issue)
 
         return result
 
@@ -81,7 +123,7 @@ class Graph__Repository(Type_Safe):
         path_node = self.path_handler.path_for_node_json(node_type, label)
 
         if self.storage_fs.file__exists(path_node) is True:
-            return self.storage_fs.file__delete(path_node)
+            return self.file_delete(path_node)
 
         return False
 
@@ -114,13 +156,14 @@ class Graph__Repository(Type_Safe):
         path_node    = self.path_handler.path_for_node_json(node_type, label)
 
         if self.storage_fs.file__exists(path_issue):
-            self.storage_fs.file__delete(path_issue)
+            self.file_delete(path_issue)
             deleted_any = True
 
         if self.storage_fs.file__exists(path_node):                              # Also delete legacy node.json
-            self.storage_fs.file__delete(path_node)
+            self.file_delete(path_node)
             deleted_any = True
 
+        self.node_cache_invalidate(path_issue)
         return deleted_any
 
     @type_safe
@@ -173,7 +216,7 @@ class Graph__Repository(Type_Safe):
             if label in SKIP_LABELS:                                             # Skip system folders
                 continue
 
-            node_type = self.extract_node_type_from_file(path)
+            node_type = self.node_type_for_path(path)
 
             node_info = Schema__Node__Info(label     = label      ,
                                            path      = folder_path,
@@ -209,6 +252,16 @@ class Graph__Repository(Type_Safe):
 
         return file_str.startswith(f"{root_str}/")
 
+    def node_type_for_path(self, path: str) -> str:                              # node_type of an issue.json (cached when enabled)
+        if self.node_cache_enabled is False:
+            return self.extract_node_type_from_file(path)
+        path      = str(path)                                                    # Safe_Str paths don't hash like str
+        node_type = self.node_type_cache.get(path)
+        if node_type is None:
+            node_type                  = str(self.extract_node_type_from_file(path))
+            self.node_type_cache[path] = node_type
+        return node_type
+
     @type_safe
     def extract_node_type_from_file(self                              ,          # Get node_type from JSON file
                                     file_path : Safe_Str__File__Path
@@ -250,11 +303,18 @@ class Graph__Repository(Type_Safe):
                                 label : Safe_Str__Node_Label
                            ) -> Safe_Str__File__Path:
         label_str = str(label)
+        if self.node_cache_enabled is True:
+            folder_path = self.node_path_cache.get(label_str)
+            if folder_path is not None and self.storage_fs.file__exists(f'{folder_path}/issue.json'):
+                return folder_path
+
         all_paths = self.storage_fs.files__paths()
 
         for path in all_paths:
             if path.endswith(f'/{label_str}/issue.json'):
                 folder_path = path.rsplit('/issue.json', 1)[0]
+                if self.node_cache_enabled is True:
+                    self.node_path_cache[label_str] = folder_path
                 return folder_path
 
         return None
@@ -299,19 +359,15 @@ class Graph__Repository(Type_Safe):
                         node_type : Safe_Str__Node_Type
                    ) -> Schema__Type__Index:
         path = self.path_handler.path_for_type_index(node_type)
-        if self.storage_fs.file__exists(path) is False:
-            return Schema__Type__Index(node_type=node_type)
-
-        content = self.storage_fs.file__str(path)
-        if not content:
-            return Schema__Type__Index(node_type=node_type)
-
-        data = json_loads(content)
+        data = self.registry_json_load(path)
         if data is None:
             return Schema__Type__Index(node_type=node_type)
 
         return Schema__Type__Index.from_json(data)
 
+    def type_indexes_load(self, node_types: List[str]) -> dict:                  # node_type -> Schema__Type__Index, one pass
+        return {str(node_type): self.type_index_load(node_type) for node_type in node_types}
+
     @type_safe
     def type_index_save(self                              ,                      # Save per-type index
                         index : Schema__Type__Index
@@ -319,39 +375,88 @@ class Graph__Repository(Type_Safe):
         path    = self.path_handler.path_for_type_index(index.node_type)
         data    = index.json()
         content = json_dumps(data, indent=2)
-        return self.storage_fs.file__save(path, content.encode('utf-8'))
+        return self.file_save(path, content.encode('utf-8'))
 
     # ═══════════════════════════════════════════════════════════════════════════════
-    # Global Index Operations
+    # Children Index Operations (child label counters)
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def global_index_load(self) -> Schema__Global__Index:                        # Load global index
-        path = self.path_handler.path_for_global_index()
-        if self.storage_fs.file__exists(path) is False:
-            return Schema__Global__Index()
-
+    def children_index_load(self, issues_folder: str) -> Schema__Children__Index:  # None when missing or unreadable (caller rebuilds)
+        path    = self.path_handler.path_for_children_index(issues_folder)
         content = self.storage_fs.file__str(path)
         if not content:
-            return Schema__Global__Index()
+            return None
 
         data = json_loads(content)
+        if data is None:
+            return None
+
+        return Schema__Children__Index.from_json(data)
+
+    def children_index_save(self                                 ,               # Save child counters of an issues/ folder
+                            issues_folder : str                  ,
+                            index         : Schema__Children__Index
+                       ) -> bool:
+        path    = self.path_handler.path_for_children_index(issues_folder)
+        content = json_dumps(index.json(), indent=2)
+        return self.file_save(path, content.encode('utf-8'))
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Global Index Operations
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def global_index_load(self) -> Schema__Global__Index:                        # Load global index
+        path = self.path_handler.path_for_global_index()
+        data = self.registry_json_load(path)
         if data is None:
             return Schema__Global__Index()
 
         return Schema__Global__Index.from_json(data)
 
+    def registry_json_load(self, path: str) -> Optional[dict]:                   # Parsed config / index JSON (cached when node_cache_enabled)
+        path = str(path)
+        if self.node_cache_enabled and path in self.registry_cache:
+            return self.registry_cache[path]
+        data = None
+        if self.storage_fs.file__exists(path):
+            content = self.storage_fs.file__str(path)
+            data    = json_loads(content) if content else None
+        if self.node_cache_enabled:
+            self.registry_cache[path] = data                                     # loaders only read it (from_json), never mutate
+        return data
+
     def global_index_save(self, index: Schema__Global__Index) -> bool:           # Save global index
         path    = self.path_handler.path_for_global_index()
         data    = index.json()
         content = json_dumps(data, indent=2)
-        return self.storage_fs.file__save(path, content.encode('utf-8'))
+        return self.file_save(path, content.encode('utf-8'))
 
     # ═══════════════════════════════════════════════════════════════════════════════
-    # Config Operations - Node Types
+    # Activity Index Operations
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def node_types_load(self) -> List[Schema__Node__Type]:                       # Load all node types
-        path = self.path_handler.path_for_node_types()
+    def activity_manifest_load(self) -> dict:                                    # {'days': [...], 'segments': {day: count}}
+        path = self.path_handler.path_for_activity_partitions()
+        if self.storage_fs.file__exists(path) is False:
+            return {'days': [], 'segments': {}}
+
+        content = self.storage_fs.file__str(path)
+        data    = json_loads(content) if content else None
+        if data is None or 'days' not in data:
+            return {'days': [], 'segments': {}}
+        return {'days'    : list(data['days'])              ,
+                'segments': dict(data.get('segments') or {})}
+
+    def activity_manifest_save(self, manifest: dict) -> bool:                    # Save activity days + segment counts
+        path    = self.path_handler.path_for_activity_partitions()
+        content = json_dumps(manifest, indent=2)
+        return self.file_save(path, content.encode('utf-8'))
+
+    def activity_partitions_load(self) -> List[str]:                             # Days with activity (oldest first)
+        return self.activity_manifest_load()['days']
+
+    def activity_segment_load(self, day: str, seq: int) -> list:                 # Raw events in one segment (oldest first)
+        path = self.path_handler.path_for_activity_segment(day, seq)
         if self.storage_fs.file__exists(path) is False:
             return []
 
@@ -360,6 +465,83 @@ class Graph__Repository(Type_Safe):
             return []
 
         data = json_loads(content)
+        if data is None or 'events' not in data:
+            return []
+        return data['events']
+
+    def activity_segment_save(self, day: str, seq: int, events: list) -> bool:   # Save raw events for one segment
+        path    = self.path_handler.path_for_activity_segment(day, seq)
+        content = json_dumps({'events': events})
+        return self.file_save(path, content.encode('utf-8'))
+
+    def activity_partition_load(self, day: str) -> list:                         # All raw events for one day (oldest first)
+        count  = self.activity_manifest_load()['segments'].get(day, 0)
+        events = []
+        for seq in range(count):
+            events.extend(self.activity_segment_load(day, seq))
+        return events
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Retype Checkpoint Operations
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @type_safe
+    def retype_checkpoint_load(self                              ,               # Load in-flight retype state (None if absent)
+                               old_type : Safe_Str__Node_Type    ,
+                               new_type : Safe_Str__Node_Type
+                          ) -> Optional[dict]:                                   # plan merged with the latest progress
+        path = self.path_handler.path_for_retype_checkpoint(old_type, new_type)
+        if self.storage_fs.file__exists(path) is False:
+            return None
+
+        content = self.storage_fs.file__str(path)
+        if not content:
+            return None
+        checkpoint    = json_loads(content)
+        progress_path = self.path_handler.path_for_retype_progress(old_type, new_type)
+        if checkpoint is not None and self.storage_fs.file__exists(progress_path):
+            checkpoint.update(json_loads(self.storage_fs.file__str(progress_path)) or {})
+        return checkpoint
+
+    @type_safe
+    def retype_checkpoint_save(self                              ,               # Save in-flight retype state
+                               old_type   : Safe_Str__Node_Type  ,
+                               new_type   : Safe_Str__Node_Type  ,
+                               checkpoint : dict
+                          ) -> bool:
+        path    = self.path_handler.path_for_retype_checkpoint(old_type, new_type)
+        content = json_dumps(checkpoint)
+        return self.file_save(path, content.encode('utf-8'))
+
+    @type_safe
+    def retype_progress_save(self                              ,                 # Save per-batch progress (plan stays untouched)
+                             old_type : Safe_Str__Node_Type    ,
+                             new_type : Safe_Str__Node_Type    ,
+                             progress : dict
+                        ) -> bool:
+        path = self.path_handler.path_for_retype_progress(old_type, new_type)
+        return self.file_save(path, json_dumps(progress).encode('utf-8'))
+
+    @type_safe
+    def retype_checkpoint_delete(self                              ,             # Remove retype state once completed
+                                 old_type : Safe_Str__Node_Type    ,
+                                 new_type : Safe_Str__Node_Type
+                            ) -> bool:
+        progress_path = self.path_handler.path_for_retype_progress(old_type, new_type)
+        if self.storage_fs.file__exists(progress_path):
+            self.file_delete(progress_path)
+        path = self.path_handler.path_for_retype_checkpoint(old_type, new_type)
+        if self.storage_fs.file__exists(path):
+            return self.file_delete(path)
+        return False
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Config Operations - Node Types
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def node_types_load(self) -> List[Schema__Node__Type]:                       # Load all node types
+        path = self.path_handler.path_for_node_types()
+        data = self.registry_json_load(path)
         if data is None or 'types' not in data:
             return []
 
@@ -372,7 +554,7 @@ class Graph__Repository(Type_Safe):
         path = self.path_handler.path_for_node_types()
         data = {'types': [t.json() for t in types]}
         content = json_dumps(data, indent=2)
-        return self.storage_fs.file__save(path, content.encode('utf-8'))
+        return self.file_save(path, content.encode('utf-8'))
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Config Operations - Link Types
@@ -380,14 +562,7 @@ class Graph__Repository(Type_Safe):
 
     def link_types_load(self) -> List[Schema__Link__Type]:                       # Load all link types
         path = self.path_handler.path_for_link_types()
-        if self.storage_fs.file__exists(path) is False:
-            return []
-
-        content = self.storage_fs.file__str(path)
-        if not content:
-            return []
-
-        data = json_loads(content)
+        data = self.registry_json_load(path)
         if data is None or 'link_types' not in data:
             return []
 
@@ -400,7 +575,7 @@ class Graph__Repository(Type_Safe):
         path = self.path_handler.path_for_link_types()
         data = {'link_types': [t.json() for t in types]}
         content = json_dumps(data, indent=2)
-        return self.storage_fs.file__save(path, content.encode('utf-8'))
+        return self.file_save(path, content.encode('utf-8'))
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Attachment Operations
@@ -416,7 +591,7 @@ class Graph__Repository(Type_Safe):
         path = self.path_handler.path_for_attachment(node_type = node_type ,
                                                      label     = label     ,
                                                      filename  = filename  )
-        return self.storage_fs.file__save(path, data)
+        return self.file_save(path, data)
 
     @type_safe
     def attachment_load(self                              ,                      # Load attachment
@@ -441,7 +616,7 @@ class Graph__Repository(Type_Safe):
                                                      label     = label     ,
                                                      filename  = filename  )
         if self.storage_fs.file__exists(path):
-            return self.storage_fs.file__delete(path)
+            return self.file_delete(path)
         return False
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -453,25 +628,100 @@ class Graph__Repository(Type_Safe):
         return [str(p) for p in all_paths if str(p).endswith('.issues')]
 
     def issues_files_load(self) -> list:                                         # Parse .issues files into Schema__Node
+        self.issues_files_refresh()
+        return self.issues_file_nodes
+
+    def issues_files_refresh(self) -> List[str]:                                 # Re-parse changed files only, returns their paths
         if self.issues_file_loader is None:
             self.issues_file_loader = Issues_File__Loader__Service()
 
-        issues_paths = self.issues_files_discover()
-        if not issues_paths:
-            self.issues_file_nodes  = []
-            self.issues_file_loaded = True
-            return []
-
-        files = []
+        issues_paths  = self.issues_files_discover()
+        if self.issues_file_compiled and set(issues_paths) != set(self.issues_file_cache):
+            self.issues_file_compiled_prune(issues_paths)                        # first load, or files added / removed
+        cache         = {}
+        changed       = []                                                       # (content, path, fingerprint)
+        memory_hits   = 0
+        compiled_hits = 0
         for path in issues_paths:
-            content = self.storage_fs.file__str(path)
-            if content:
-                files.append((content, str(path)))
-
-        result = self.issues_file_loader.load_multiple(files)
-        self.issues_file_nodes  = result.nodes
-        self.issues_file_loaded = True
-        return result.nodes
+            data = self.storage_fs.file__bytes(path)
+            if not data:
+                continue
+            fingerprint = self.issues_file_fingerprint(data)
+            cached      = self.issues_file_cache.get(path)
+            if cached and cached[0] == fingerprint:                              # Unchanged: reuse parsed result
+                cache[path]  = cached
+                memory_hits += 1
+                continue
+            if self.issues_file_compiled:                                        # Fresh process: try the sidecar
+                result = self.issues_file_compiled_load(path, fingerprint)
+                if result is not None:
+                    cache[path]    = (fingerprint, result)
+                    compiled_hits += 1
+                    continue
+            changed.append((data.decode('utf-8'), path, fingerprint))
+
+        results = self.issues_file_loader.load_each([(content, path, self.issues_file_timestamp(path))
+                                                     for content, path, _ in changed])
+        for (_, path, fingerprint), result in zip(changed, results):
+            cache[path] = (fingerprint, result)
+            if self.issues_file_compiled:
+                self.issues_file_compiled_save(path, fingerprint, result)
+
+        nodes    = []
+        by_label = {}
+        by_type  = {}
+        for path in issues_paths:                                                # Keep discovery order
+            if path in cache:
+                for node in cache[path][1].nodes:
+                    nodes.append(node)
+                    by_label.setdefault(str(node.label), node)
+                    by_type .setdefault(str(node.node_type), []).append(node)
+
+        self.issues_file_cache    = {path: cache[path] for path in issues_paths if path in cache}   # discovery order (swap views together)
+        self.issues_file_nodes    = nodes
+        self.issues_file_by_label = by_label
+        self.issues_file_by_type  = by_type
+        self.issues_file_loaded   = True
+        self.issues_file_stats    = dict(parsed        = len(changed) ,
+                                         memory_hits   = memory_hits  ,
+                                         compiled_hits = compiled_hits)
+        return [path for _, path, _ in changed]
+
+    def issues_files_results(self) -> list:                                      # Cached load results, in discovery order
+        self.issues_files_refresh()
+        return [result for _, result in self.issues_file_cache.values()]
+
+    def issues_file_fingerprint(self, data: bytes) -> str:                       # Size + content hash
+        return f'{len(data)}:{bytes_md5(data)}'
+
+    def issues_file_timestamp(self, path: str) -> int:                           # File mtime in ms (0 when the backend has none)
+        root_path = getattr(self.storage_fs, 'root_path', None)                  # Local disk backends only
+        if root_path:
+            full_path = os.path.join(str(root_path), path)
+            if os.path.isfile(full_path):
+                return int(os.path.getmtime(full_path) * 1000)
+        return 0
+
+    def issues_file_compiled_load(self, source_path: str, fingerprint: str):     # Parsed result from sidecar (None if stale/missing)
+        path = self.path_handler.path_for_issues_file_compiled(source_path)
+        if self.storage_fs.file__exists(path) is False:
+            return None
+        return Issues_File__Compiled().decode(self.storage_fs.file__bytes(path), fingerprint)
+
+    def issues_file_compiled_save(self, source_path: str, fingerprint: str, result) -> bool:
+        path = self.path_handler.path_for_issues_file_compiled(source_path)
+        return self.file_save(path, Issues_File__Compiled().encode(result, fingerprint))
+
+    def issues_file_compiled_prune(self, issues_paths: List[str]) -> int:        # Delete sidecars whose .issues file is gone
+        folder   = self.path_handler.path_for_issues_files_index()
+        expected = {self.path_handler.path_for_issues_file_compiled(path) for path in issues_paths}
+        removed  = 0
+        for relative in self.path_index_get().files_under(folder):
+            path = f'{folder}/{relative}'
+            if path.endswith(SIDECAR_SUFFIXES) and path not in expected:
+                self.file_delete(path)
+                removed += 1
+        return removed
 
     def issues_files_get_cached_nodes(self) -> list:                             # Get cached .issues nodes (load if needed)
         if self.issues_file_loaded is False:
@@ -479,13 +729,157 @@ class Graph__Repository(Type_Safe):
         return self.issues_file_nodes or []
 
     def issues_files_find_node_by_label(self, label: str):                       # Find a node from .issues files by label
-        for node in self.issues_files_get_cached_nodes():
-            if str(node.label) == label:
-                return node
-        return None
+        if self.issues_file_loaded is False:
+            self.issues_files_load()
+        return self.issues_file_by_label.get(str(label))
 
-    def issues_files_invalidate_cache(self):                                     # Clear cached .issues nodes (force reload)
-        self.issues_file_loaded = False
+    def issues_files_nodes_for_type(self, node_type: str) -> list:               # Cached .issues nodes of one type
+        if self.issues_file_loaded is False:
+            self.issues_files_load()
+        return self.issues_file_by_type.get(str(node_type), [])
+
+    def issues_files_invalidate_cache(self, path: str = None):                  # Mark cache stale (next read refreshes changed files)
+        if path:
+            self.issues_file_cache.pop(path, None)                               # Force re-parse of this file
+        self.issues_file_loaded   = False
+        self.issue_paths_version += 1                                            # .issues nodes are part of nodes_list_all()
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Storage Writes + Path Index
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def file_save(self, path: str, data: bytes) -> bool:                         # Save through storage, keep path_index in sync
+        result = self.storage_fs.file__save(path, data)
+        self.registry_cache.pop(str(path), None)
+        if not result:
+            self.write_failures += 1
+        elif self.path_index is not None:
+            self.path_index.add_file(str(path), len(data))
+        if str(path).endswith('/issue.json'):
+            self.issue_paths_version += 1
+        return result
+
+    def file_delete(self, path: str) -> bool:                                    # Delete through storage, keep path_index in sync
+        result = self.storage_fs.file__delete(path)
+        self.registry_cache.pop(str(path), None)
+        if self.path_index is not None:
+            self.path_index.remove_file(str(path))
+        if str(path).endswith('/issue.json'):
+            self.issue_paths_version += 1
+        return result
+
+    def file_create_exclusive(self, path: str, data: bytes = b'') -> bool:       # Create only if absent (False = already there)
+        root_path = getattr(self.storage_fs, 'root_path', None)
+        if not root_path:                                                        # Memory, SQLite, ZIP: one process, callers hold a lock
+            if self.storage_fs.file__exists(path):
+                return False
+            return self.file_save(path, data)
+        full_path = os.path.join(str(root_path), path)                           # Local disk: O_EXCL is atomic across processes
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        try:
+            fd = os.open(full_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        self.registry_cache.pop(str(path), None)
+        if self.path_index is not None:
+            self.path_index.add_file(str(path), len(data))
+        return True
+
+    def path_index_get(self, sizes: bool = False) -> Path__Tree__Index:         # Kept index, or a fresh listing when nothing reports external edits
+        if self.node_cache_enabled is False:
+            self.path_index = None
+            return self.path_index_build(sizes)
+        if self.path_index is None:
+            self.path_index = self.path_index_build(sizes=True)                  # kept: sized once, then maintained by writes
+        return self.path_index
+
+    def path_index_build(self, sizes: bool) -> Path__Tree__Index:                # one files__paths() pass (+ sizes if asked)
+        return Path__Tree__Index().build((str(path) for path in self.storage_fs.files__paths()),
+                                         size_of = self.file_size if sizes else None)
+
+    def file_size(self, path: str) -> Optional[int]:                             # Size without reading, where the backend allows it
+        root_path = getattr(self.storage_fs, 'root_path', None)                  # Local disk: stat
+        if root_path:
+            try:
+                return os.path.getsize(os.path.join(str(root_path), path))
+            except OSError:
+                return None
+        if hasattr(self.storage_fs, 'content_data'):                             # Memory: bytes are already in memory
+            data = self.storage_fs.file__bytes(path)
+            return len(data) if data is not None else None
+        return None                                                              # SQLite, ZIP, S3: unknown until written here
+
+    def folder_rename(self, source: str, target: str) -> bool:                   # Native directory rename (False if unsupported / failed)
+        root_path = getattr(self.storage_fs, 'root_path', None)
+        if not root_path:
+            return False                                                         # Memory, SQLite, ZIP: no directories to rename
+        source_dir = os.path.join(str(root_path), source)
+        target_dir = os.path.join(str(root_path), target)
+        if os.path.isdir(source_dir) is False or os.path.exists(target_dir):
+            return False
+        try:
+            os.makedirs(os.path.dirname(target_dir), exist_ok=True)
+            os.rename(source_dir, target_dir)
+        except OSError:                                                          # e.g. cross-device, permissions
+            return False
+        index = self.path_index                                                  # only a kept index needs the bookkeeping
+        if index is not None:
+            for relative in index.files_under(source):
+                size = index.file_size(f'{source}/{relative}')
+                index.remove_file(f'{source}/{relative}')
+                index.add_file   (f'{target}/{relative}', size)
+        self.node_cache_invalidate(source)
+        self.node_cache_invalidate(target)
+        self.issue_paths_version += 1
+        return True
+
+    def folder_copy_delete(self, source     : str ,                              # Move every file under source, returns files moved
+                                 target     : str ,
+                                 batch_size : int = 100
+                          ) -> int:
+        files = self.path_index_get().files_under(source)
+        for start in range(0, len(files), batch_size):                           # read a batch, write it, then delete it
+            batch = [(relative, self.storage_fs.file__bytes(f'{source}/{relative}')) for relative in files[start:start + batch_size]]
+            for relative, data in batch:
+                if data is not None:
+                    self.file_save(f'{target}/{relative}', data)
+            for relative, _ in batch:
+                self.file_delete(f'{source}/{relative}')
+        self.node_cache_invalidate(source)
+        self.node_cache_invalidate(target)
+        return len(files)
+
+    def path_index_invalidate(self) -> None:                                     # Storage changed behind our back: rebuild on next use
+        self.path_index           = None
+        self.registry_cache       = {}
+        self.issue_paths_version += 1
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Node Cache Invalidation
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def node_cache_invalidate(self, path: str = None) -> int:                    # Drop cache entries for an issue.json or a folder (None = all)
+        if path is None:
+            removed = len(self.node_path_cache) + len(self.node_type_cache)
+            self.node_path_cache = {}
+            self.node_type_cache = {}
+            return removed
+
+        path   = str(path)
+        folder = path[:-len('/issue.json')] if path.endswith('/issue.json') else path.rstrip('/')
+        prefix = f'{folder}/'
+        stale_types  = [key   for key           in list(self.node_type_cache)         if key.startswith(prefix)]
+        stale_labels = [label for label, cached in list(self.node_path_cache.items()) if cached == folder or cached.startswith(prefix)]
+        label        = folder.rsplit('/', 1)[-1]                                 # a new file may shadow a cached label
+        if label in self.node_path_cache and label not in stale_labels:
+            stale_labels.append(label)
+        for key in stale_types:
+            self.node_type_cache.pop(key, None)
+        for label in stale_labels:
+            self.node_path_cache.pop(label, None)
+        return len(stale_types) + len(stale_labels)
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Utility Operations
@@ -494,3 +888,6 @@ class Graph__Repository(Type_Safe):
     def clear_storage(self) -> None:                                             # Clear all data (for tests)
         self.storage_fs.clear()
         self.issues_file_loaded = False
+        self.issues_file_cache  = {}
+        self.node_cache_invalidate()
+        self.path_index_invalidate()
@@ -0,0 +1,291 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Graph__Repository__Watcher - Keeps repository caches fresh on local disk
+# Picks up edits made outside the server (editor saves, git checkouts) and
+# applies targeted invalidations instead of full rescans:
+#   - *.issues            -> issues_files_invalidate_cache(path) (label/type views rebuild on next read)
+#   - .../issue.json      -> node_cache_invalidate(path)         (label -> path, path -> type)
+#   - directories         -> node_cache_invalidate(folder) + .issues re-check
+#   - other files (comments, attachments, ...) -> path_index only
+#   - anything but .issues -> path_index (and registry_cache) rebuilt on next use
+#   - queue overflow      -> everything
+#
+# Change sources:
+#   - inotify (Linux, via libc) with one watch per directory
+#   - mtime polling fallback: stat() of every file outside the ignored folders
+# Events are debounced: nothing is applied until debounce_ms pass without a new event.
+# Only Storage_FS backends with a root_path (local disk) can be watched.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import ctypes
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing                                                                     import Dict, List
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
+
+WATCH__MODE_INOTIFY  = 'inotify'
+WATCH__MODE_POLLING  = 'polling'
+WATCH__MODE_NONE     = 'none'                                                   # backend has no local root
+WATCH__DEBOUNCE_MS   = 200
+WATCH__POLL_MS       = 1000
+WATCH__ALL           = ''                                                       # pending key meaning "invalidate everything"
+WATCH__IGNORED_DIRS  = {'.git', 'indexes', '__pycache__'}                       # VCS internals, our own index/sidecar writes
+WATCH__ISSUE_JSON    = 'issue.json'
+WATCH__ISSUES_SUFFIX = '.issues'
+WATCH__REGISTRY      = {'_index.json', 'node-types.json', 'link-types.json'}    # files behind repository.registry_cache
+
+IN_MODIFY      = 0x00000002
+IN_ATTRIB      = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_Q_OVERFLOW  = 0x00004000
+IN_IGNORED     = 0x00008000
+IN_ISDIR       = 0x40000000
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+INOTIFY__MASK  = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY__EVENT = struct.Struct('iIII')                                          # wd, mask, cookie, name length
+
+
+def is_watched_file(name: str) -> bool:
+    return name == WATCH__ISSUE_JSON or name.endswith(WATCH__ISSUES_SUFFIX) or name in WATCH__REGISTRY
+
+
+class Inotify__Watch(Type_Safe):                                                # Recursive inotify watch over a directory tree
+    root_path : str
+    fd        : int         = -1
+    wd_paths  : dict                                                            # wd -> relative dir ('' for root)
+    libc      : ctypes.CDLL = None
+
+    def open(self) -> bool:
+        if sys.platform.startswith('linux') is False:
+            return False
+        try:
+            self.libc = ctypes.CDLL(None, use_errno=True)
+            fd        = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):                                       # no libc / no inotify symbols
+            return False
+        if fd < 0:
+            return False
+        self.fd = fd
+        self.add_tree('')
+        return True
+
+    def add_tree(self, rel_dir: str) -> None:                                   # watch a directory and everything below it
+        base = os.path.join(self.root_path, rel_dir) if rel_dir else self.root_path
+        for dir_path, dir_names, _ in os.walk(base):
+            dir_names[:] = [name for name in dir_names if name not in WATCH__IGNORED_DIRS]
+            rel_path     = os.path.relpath(dir_path, self.root_path).replace(os.sep, '/')
+            rel_path     = '' if rel_path == '.' else rel_path
+            wd           = self.libc.inotify_add_watch(self.fd, dir_path.encode(), INOTIFY__MASK)
+            if wd >= 0:
+                self.wd_paths[wd] = rel_path
+
+    def read(self, timeout: float) -> List[str]:                                # changed relative paths ('dir/' for directories)
+        if self.fd < 0:
+            return []
+        ready, _, _ = select.select([self.fd], [], [], max(timeout, 0))
+        if not ready:
+            return []
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed = []
+        offset  = 0
+        while offset + INOTIFY__EVENT.size <= len(buffer):
+            wd, mask, _, length = INOTIFY__EVENT.unpack_from(buffer, offset)
+            name    = buffer[offset + INOTIFY__EVENT.size : offset + INOTIFY__EVENT.size + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += INOTIFY__EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                changed.append(WATCH__ALL)
+                continue
+            if mask & IN_IGNORED:                                               # directory gone; its watch was removed
+                self.wd_paths.pop(wd, None)
+                continue
+            parent = self.wd_paths.get(wd)
+            if parent is None or name in WATCH__IGNORED_DIRS:
+                continue
+            path = f'{parent}/{name}' if parent else name
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):                            # e.g. git checkout adding folders
+                    self.add_tree(path)
+                changed.append(f'{path}/')
+            else:                                                               # every file: the path index counts them all
+                changed.append(path)
+        return changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+        self.fd       = -1
+        self.wd_paths = {}
+
+
+class Graph__Repository__Watcher(Type_Safe):
+    repository       : Graph__Repository
+    debounce_ms      : int              = WATCH__DEBOUNCE_MS
+    poll_interval_ms : int              = WATCH__POLL_MS
+    use_inotify      : bool             = True                                  # False forces mtime polling
+    mode             : str                                                      # set by open()
+    pending          : dict                                                     # relative path -> monotonic time of last event
+    last_event_at    : float
+    snapshot         : Dict[str, tuple]                                         # polling: relative path -> (mtime_ns, size), every file
+    stats            : dict                                                     # events / flushes / invalidations
+    inotify          : Inotify__Watch   = None
+    thread           : threading.Thread = None
+    stop_event       : threading.Event  = None
+
+    def root_path(self) -> str:                                                 # None when the backend is not on local disk
+        return getattr(self.repository.storage_fs, 'root_path', None)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Lifecycle
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def open(self) -> str:                                                      # choose the change source, returns mode
+        root_path = self.root_path()
+        self.stats   = dict(events=0, flushes=0, invalidations=0)
+        self.pending = {}
+        if not root_path or os.path.isdir(root_path) is False:
+            self.mode = WATCH__MODE_NONE
+            return self.mode
+        if self.use_inotify:
+            inotify = Inotify__Watch(root_path=str(root_path))
+            if inotify.open():
+                self.inotify = inotify
+                self.mode    = WATCH__MODE_INOTIFY
+        if self.inotify is None:
+            self.snapshot = self.scan()
+            self.mode     = WATCH__MODE_POLLING
+        self.repository.node_cache_enabled = True                               # safe now that external edits are reported
+        return self.mode
+
+    def close(self) -> None:
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+        self.repository.node_cache_enabled = False
+        self.repository.node_cache_invalidate()
+
+    def start(self) -> str:                                                     # open + background thread
+        mode = self.open()
+        if mode != WATCH__MODE_NONE:
+            self.stop_event = threading.Event()
+            self.thread     = threading.Thread(target=self.run, name='issues-fs-watcher', daemon=True)
+            self.thread.start()
+        return mode
+
+    def stop(self) -> None:
+        if self.stop_event is not None:
+            self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush()                                                            # don't drop events still in the debounce window
+        self.close()
+
+    def run(self) -> None:
+        interval = self.poll_interval_ms / 1000
+        while self.stop_event.is_set() is False:
+            self.poll(interval)
+            if self.mode == WATCH__MODE_POLLING:
+                self.stop_event.wait(min(interval, self.debounce_ms / 1000) if self.pending else interval)
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Change Detection
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def poll(self, timeout: float = 0) -> List[str]:                            # collect events; returns paths applied (after debounce)
+        if self.mode == WATCH__MODE_INOTIFY:
+            if self.pending:                                                    # wake up when the debounce window closes
+                timeout = min(timeout, self.debounce_remaining())
+            changed = self.inotify.read(timeout)
+        elif self.mode == WATCH__MODE_POLLING:
+            changed = self.scan_changes()
+        else:
+            return []
+
+        if changed:
+            now = time.monotonic()
+            for path in changed:
+                self.pending[path] = now
+            self.last_event_at   = now
+            self.stats['events'] += len(changed)
+
+        if self.pending and self.debounce_remaining() <= 0:
+            return self.flush()
+        return []
+
+    def debounce_remaining(self) -> float:
+        return self.debounce_ms / 1000 - (time.monotonic() - self.last_event_at)
+
+    def scan(self) -> Dict[str, tuple]:                                         # relative path -> (mtime_ns, size) of every file
+        root_path = self.root_path()
+        snapshot  = {}
+        stack     = ['']
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(os.path.join(root_path, rel_dir) if rel_dir else root_path)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in WATCH__IGNORED_DIRS:
+                            stack.append(rel_path)
+                    else:
+                        stat               = entry.stat()
+                        snapshot[rel_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def scan_changes(self) -> List[str]:                                        # added, removed or modified since last scan
+        current       = self.scan()
+        previous      = self.snapshot
+        self.snapshot = current
+        changed       = [path for path, stat in current.items() if previous.get(path) != stat]
+        changed      += [path for path in previous if path not in current]
+        return changed
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Invalidation
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def flush(self) -> List[str]:                                               # apply everything pending now
+        paths        = sorted(self.pending)
+        self.pending = {}
+        if paths:
+            self.apply_changes(paths)
+            self.stats['flushes'] = self.stats.get('flushes', 0) + 1
+        return paths
+
+    def apply_changes(self, paths: List[str]) -> int:                           # targeted cache invalidation, returns entries dropped
+        repository = self.repository
+        removed    = 0
+        if WATCH__ALL in paths:
+            removed += repository.node_cache_invalidate()
+            repository.issues_files_invalidate_cache()
+            repository.path_index_invalidate()
+            paths    = []
+        for path in paths:
+            if path.endswith(WATCH__ISSUES_SUFFIX):
+                repository.issues_files_invalidate_cache(path)
+                removed += 1
+            elif path.endswith('/'):                                            # directory created / removed / renamed
+                removed += repository.node_cache_invalidate(path)
+                repository.issues_files_invalidate_cache()                      # may hold .issues files; refresh re-checks fingerprints
+            elif is_watched_file(path.rsplit('/', 1)[-1]):
+                removed += repository.node_cache_invalidate(path)
+            if path.endswith(WATCH__ISSUES_SUFFIX) is False:                    # files appeared / went away under the trie
+                repository.path_index_invalidate()
+        self.stats['invalidations'] = self.stats.get('invalidations', 0) + removed
+        return removed
@@ -8,6 +8,7 @@ from osbot_utils.type_safe.Type_Safe
 from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now                        import Timestamp_Now
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe import type_safe
 
+from issues_fs.schemas.enums.Enum__Activity__Event__Type              import Enum__Activity__Event__Type
 from issues_fs.schemas.graph.Safe_Str__Graph_Types                     import Safe_Str__Node_Type, Safe_Str__Node_Label, Safe_Str__Link_Verb
 from issues_fs.schemas.graph.Schema__Link__Create__Request             import Schema__Link__Create__Request
 from issues_fs.schemas.graph.Schema__Link__Create__Response            import Schema__Link__Create__Response
@@ -15,11 +16,13 @@ from issues_fs.schemas.graph.Schema__Link__Delete__Response            import Sc
 from issues_fs.schemas.graph.Schema__Link__List__Response              import Schema__Link__List__Response
 from issues_fs.schemas.graph.Schema__Node__Link                        import Schema__Node__Link
 from issues_fs.schemas.graph.Schema__Link__Type                        import Schema__Link__Type
+from issues_fs.issues.graph_services.Activity__Service         import Activity__Service
 from issues_fs.issues.graph_services.Graph__Repository         import Graph__Repository
 
 
 class Link__Service(Type_Safe):                                                  # Link business logic service
-    repository : Graph__Repository                                               # Data access layer
+    repository       : Graph__Repository                                         # Data access layer
+    activity_service : Activity__Service = None                                  # Optional activity feed writer
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Query Operations
@@ -46,7 +49,8 @@ class Link__Service(Type_Safe):
     def create_link(self                              ,                          # Create bidirectional link
                     source_type  : Safe_Str__Node_Type   ,
                     source_label : Safe_Str__Node_Label  ,
-                    request      : Schema__Link__Create__Request                # todo: see if the source_type and source_label should not be defined inside the Schema__Link__Create__Request class
+                    request      : Schema__Link__Create__Request ,              # todo: see if the source_type and source_label should not be defined inside the Schema__Link__Create__Request class
+                    author       : str = ''                                     # Who made the change (activity feed)
                ) -> Schema__Link__Create__Response:
         # Load source node
         source_node = self.repository.node_load(node_type = source_type  ,
@@ -124,6 +128,14 @@ class Link__Service(Type_Safe):
             return Schema__Link__Create__Response(success = False                   ,
                                                   message = 'Failed to save target' )
 
+        if self.activity_service:
+            self.activity_service.record_event(event_type = Enum__Activity__Event__Type.LINK_CREATED ,
+                                               node_type  = source_type                              ,
+                                               label      = source_label                             ,
+                                               author     = author                                   ,
+                                               detail     = f'{request.verb} {target_label}'         ,
+                                               timestamp  = now                                      )
+
         return Schema__Link__Create__Response(success     = True        ,
                                               source_link = source_link ,
                                               target_link = target_link )
@@ -135,7 +147,8 @@ class Link__Service(Type_Safe):
     def delete_link(self                              ,                          # Delete bidirectional link
                     source_type  : Safe_Str__Node_Type   ,
                     source_label : Safe_Str__Node_Label  ,
-                    target_label : Safe_Str__Node_Label
+                    target_label : Safe_Str__Node_Label  ,
+                    author       : str = ''                                     # Who made the change (activity feed)
                ) -> Schema__Link__Delete__Response:
         # Load source node
         source_node = self.repository.node_load(node_type = source_type  ,
@@ -192,6 +205,14 @@ class Link__Service(Type_Safe):
         if inverse_to_remove:
             self.repository.node_save(target_node)
 
+        if self.activity_service:
+            self.activity_service.record_event(event_type = Enum__Activity__Event__Type.LINK_DELETED ,
+                                               node_type  = source_type                              ,
+                                               label      = source_label                             ,
+                                               author     = author                                   ,
+                                               detail     = f'{link_to_remove.verb} {target_label}'  ,
+                                               timestamp  = source_node.updated_at                   )
+
         return Schema__Link__Delete__Response(success      = True         ,
                                               deleted      = True         ,
                                               source_label = source_label ,
@@ -7,6 +7,17 @@
 #   - B14: resolve_hierarchical_path(), get_node_by_hierarchical_path()
 #   - B17: list_nodes() respects root scoping via root_selection_service
 #   - B22: parse_label_to_type(), type_to_label_prefix() for hyphenated labels
+#
+# Root View: scoped listings read a materialized node set for the current root
+# (root_view) instead of re-filtering every storage path per request. It is
+# rebuilt when Root__Selection__Service.set_current_root() changes the root,
+# patched by create/delete here, and rebuilt lazily when the repository's
+# issue_paths_version shows other writers changed the issue.json set. Only
+# in-process writes bump that version, so the view is only used while
+# repository.node_cache_enabled is set (e.g. by Graph__Repository__Watcher);
+# otherwise scoped listings read storage on every call.
+#
+# Activity: create/update/delete append events via the optional activity_service
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from typing                                                                                             import List, Optional
@@ -16,6 +27,7 @@ from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Pat
 from osbot_utils.type_safe.primitives.domains.identifiers.Obj_Id                                        import Obj_Id
 from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now                        import Timestamp_Now
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                                          import type_safe
+from issues_fs.schemas.enums.Enum__Activity__Event__Type                                                import Enum__Activity__Event__Type
 from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type, Safe_Str__Node_Label
 from issues_fs.schemas.graph.Schema__Global__Index                                                      import Schema__Global__Index
 from issues_fs.schemas.graph.Schema__Graph__Link                                                        import Schema__Graph__Link
@@ -26,12 +38,15 @@ from issues_fs.schemas.graph.Schema__Node__Create__Request
 from issues_fs.schemas.graph.Schema__Node__Create__Response                                             import Schema__Node__Create__Response
 from issues_fs.schemas.graph.Schema__Node__Delete__Response                                             import Schema__Node__Delete__Response
 from issues_fs.schemas.graph.Schema__Node__Link                                                         import Schema__Node__Link
+from issues_fs.schemas.graph.Schema__Node__Info                                                         import Schema__Node__Info
 from issues_fs.schemas.graph.Schema__Node__List__Response                                               import Schema__Node__List__Response
+from issues_fs.schemas.graph.Schema__Node__Root__View                                                   import Schema__Node__Root__View
 from issues_fs.schemas.graph.Schema__Node__Response                                                     import Schema__Node__Response
 from issues_fs.schemas.graph.Schema__Node__Summary                                                      import Schema__Node__Summary
 from issues_fs.schemas.graph.Schema__Node__Update__Request                                              import Schema__Node__Update__Request
 from issues_fs.schemas.graph.Schema__Node__Update__Response                                             import Schema__Node__Update__Response
 from issues_fs.schemas.graph.Schema__Type__Summary                                                      import Schema__Type__Summary
+from issues_fs.issues.graph_services.Activity__Service                                                   import Activity__Service
 from issues_fs.issues.graph_services.Graph__Repository                                                  import Graph__Repository
 
 
@@ -40,6 +55,14 @@ from issues_fs.issues.graph_services.Graph__Repository
 class Node__Service(Type_Safe):                                                  # Node business logic service
     repository             : Graph__Repository                                   # Data access layer
     root_selection_service : object            = None                             # Phase 2 (B14/B17): Root context
+    activity_service       : Activity__Service = None                             # Optional activity feed writer
+    root_view              : Schema__Node__Root__View = None                      # Node set under the current root (lazy)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        listeners = getattr(self.root_selection_service, 'root_change_listeners', None)
+        if listeners is not None:                                                # Rebuild the view when the root is switched
+            listeners.append(self.root_view_rebuild)
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Query Operations
@@ -68,7 +91,7 @@ class Node__Service(Type_Safe):
         if node_type:
             summaries = self.list_nodes_for_type(node_type, current_root)
         else:
-            all_nodes  = self.repository.nodes_list_all(root_path=current_root)
+            all_nodes  = self.nodes_under_root(current_root)
             seen_types = set()
 
             node_types = self.repository.node_types_load()                       # Registered types
@@ -92,8 +115,17 @@ class Node__Service(Type_Safe):
                             node_type    : Safe_Str__Node_Type         ,
                             root_path    : Safe_Str__File__Path = None
                        ) -> List[Schema__Node__Summary]:
-        summaries = []
-        all_nodes = self.repository.nodes_list_all(root_path=root_path)          # Phase 2 (B10/B17): Recursive with filter
+        summaries   = []
+        issues_file = []                                                         # .issues nodes not shadowed by an issue.json
+        root_view   = self.root_view_get(root_path)
+        if root_view is not None:                                                # Scoped: already filtered and grouped by type
+            all_nodes = root_view.by_type.get(str(node_type), [])
+        else:
+            all_nodes = self.repository.nodes_list_all(root_path            = root_path ,   # Phase 2 (B10/B17): Recursive with filter
+                                                       include_issues_files = False     )
+            labels    = {str(node_info.label) for node_info in all_nodes}
+            issues_file = [node for node in self.repository.issues_files_nodes_for_type(node_type)   # by-type index, no full scan
+                           if str(node.label) not in labels]
 
         for node_info in all_nodes:
             if node_info.node_type != node_type:
@@ -105,14 +137,19 @@ class Node__Service(Type_Safe):
                 node = self.repository.issues_files_find_node_by_label(node_info.label)
 
             if node:
-                summary = Schema__Node__Summary(label     = node.label     ,
-                                                node_type = node.node_type ,
-                                                title     = node.title     ,
-                                                status    = node.status    )
-                summaries.append(summary)
+                summaries.append(self.node_summary(node))
+
+        for node in issues_file:
+            summaries.append(self.node_summary(node))
 
         return summaries
 
+    def node_summary(self, node: Schema__Node) -> Schema__Node__Summary:
+        return Schema__Node__Summary(label     = node.label     ,
+                                     node_type = node.node_type ,
+                                     title     = node.title     ,
+                                     status    = node.status    )
+
     def get_current_root_path(self) -> Safe_Str__File__Path:                     # Phase 2 (B17): Get current root
         if self.root_selection_service is None:
             return None
@@ -123,6 +160,69 @@ class Node__Service(Type_Safe):
 
         return None
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Root View
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def nodes_under_root(self, root_path: Safe_Str__File__Path = None) -> List[Schema__Node__Info]:
+        root_view = self.root_view_get(root_path)
+        if root_view is not None:
+            return root_view.nodes
+        return self.repository.nodes_list_all(root_path=root_path)
+
+    def root_view_get(self, root_path: Safe_Str__File__Path = None) -> Optional[Schema__Node__Root__View]:
+        if not root_path:                                                        # Unscoped listings read storage directly
+            return None
+        if self.repository.node_cache_enabled is False:                         # no watcher: external edits would go unseen
+            return None
+        root_view = self.root_view
+        if (root_view is None                                             or
+            root_view.root_path != str(root_path)                         or
+            root_view.version   != self.repository.issue_paths_version    ):     # root switched or issue.json set changed elsewhere
+            root_view = self.root_view_rebuild(root_path)
+        return root_view
+
+    def root_view_rebuild(self, root_path: Safe_Str__File__Path = None) -> Optional[Schema__Node__Root__View]:
+        if not root_path or self.repository.node_cache_enabled is False:
+            self.root_view = None
+            return None
+        version   = self.repository.issue_paths_version                          # read first: a concurrent write forces a rebuild
+        nodes     = self.repository.nodes_list_all(root_path=root_path)          # the only filter pass for this root
+        root_view = Schema__Node__Root__View(root_path = str(root_path),
+                                             version   = version        )
+        for node_info in nodes:
+            self.root_view_add(root_view, node_info)
+        self.root_view = root_view
+        return root_view
+
+    def root_view_add(self, root_view: Schema__Node__Root__View, node_info: Schema__Node__Info) -> None:
+        root_view.nodes.append(node_info)
+        root_view.by_type.setdefault(str(node_info.node_type), []).append(node_info)
+
+    def root_view_patch(self                             ,                       # Apply one of our own writes to the view
+                        version_before : int             ,
+                        node_type      : str             ,
+                        label          : str             ,
+                        deleted        : bool = False    ,
+                        folder         : str  = None                             # Real node folder (nested issues), flat when None
+                   ) -> None:
+        root_view = self.root_view
+        if root_view is None:
+            return
+        if root_view.version != version_before:                                  # already stale: leave it for a rebuild
+            return
+        folder = folder or str(self.repository.path_handler.path_for_node_folder(node_type, label))
+        path   = f'{folder}/issue.json'
+        if self.repository.is_path_under_root(path, root_view.root_path):
+            if deleted:
+                root_view.nodes = [info for info in root_view.nodes if str(info.path) != folder]
+                root_view.by_type[str(node_type)] = [info for info in root_view.by_type.get(str(node_type), []) if str(info.path) != folder]
+            elif all(str(info.path) != folder for info in root_view.by_type.get(str(node_type), [])):
+                self.root_view_add(root_view, Schema__Node__Info(label     = label     ,
+                                                                 path      = folder    ,
+                                                                 node_type = node_type ))
+        root_view.version = self.repository.issue_paths_version
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Path-Based Loading - Phase 2 (B11)
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -145,7 +245,8 @@ class Node__Service(Type_Safe):
     # ═══════════════════════════════════════════════════════════════════════════════
 
     def create_node(self                                       ,                 # Create new node
-                    request : Schema__Node__Create__Request
+                    request : Schema__Node__Create__Request    ,
+                    author  : str = ''                                           # Who made the change (activity feed)
                ) -> Schema__Node__Create__Response:
         # Validate title is not empty
         if request.title.strip() == '':
@@ -195,9 +296,11 @@ class Node__Service(Type_Safe):
                             properties  = dict(request.properties) if request.properties else {})
 
         # Save node
+        version_before = self.repository.issue_paths_version
         if self.repository.node_save(node) is False:
             return Schema__Node__Create__Response(success = False               ,
                                                   message = 'Failed to save node')
+        self.root_view_patch(version_before, node.node_type, node.label)
 
         # Update type index
         type_index.next_index   = Safe_UInt(next_num + 1)
@@ -208,6 +311,14 @@ class Node__Service(Type_Safe):
         # Update global index
         self.update_global_index()
 
+        if self.activity_service:
+            self.activity_service.record_event(event_type = Enum__Activity__Event__Type.NODE_CREATED ,
+                                               node_type  = node.node_type                           ,
+                                               label      = node.label                               ,
+                                               author     = author                                   ,
+                                               detail     = node.title                               ,
+                                               timestamp  = now                                      )
+
         return Schema__Node__Create__Response(success = True ,
                                               node    = node )
 
@@ -218,7 +329,8 @@ class Node__Service(Type_Safe):
     def update_node(self                              ,                          # Update existing node
                     node_type : Safe_Str__Node_Type   ,
                     label     : Safe_Str__Node_Label  ,
-                    request   : Schema__Node__Update__Request
+                    request   : Schema__Node__Update__Request ,
+                    author    : str = ''                                         # Who made the change (activity feed)
                ) -> Schema__Node__Update__Response:
         node = self.repository.node_load(node_type = node_type ,
                                          label     = label     )
@@ -226,6 +338,8 @@ class Node__Service(Type_Safe):
             return Schema__Node__Update__Response(success = False                    ,
                                                   message = f'Node not found: {label}')
 
+        previous_status = str(node.status)
+
         # Apply updates - use truthiness check because Type_Safe auto-initializes
         # empty strings for Safe_Str types (so `is not None` doesn't work)
         if request.title:                                                        # Only update if non-empty
@@ -242,9 +356,23 @@ class Node__Service(Type_Safe):
         node.updated_at = Timestamp_Now()
 
         # Save
+        version_before = self.repository.issue_paths_version
         if self.repository.node_save(node) is False:
             return Schema__Node__Update__Response(success = False                 ,
                                                   message = 'Failed to save node' )
+        self.root_view_patch(version_before, node.node_type, node.label)          # same path: only re-syncs the version
+
+        if self.activity_service:
+            if str(node.status) != previous_status:
+                event_type, detail = Enum__Activity__Event__Type.STATUS_CHANGED, f'{previous_status} to {node.status}'
+            else:
+                event_type, detail = Enum__Activity__Event__Type.NODE_UPDATED  , ''
+            self.activity_service.record_event(event_type = event_type      ,
+                                               node_type  = node.node_type  ,
+                                               label      = node.label      ,
+                                               author     = author          ,
+                                               detail     = detail          ,
+                                               timestamp  = node.updated_at )
 
         return Schema__Node__Update__Response(success = True ,
                                               node    = node )
@@ -269,9 +397,11 @@ class Node__Service(Type_Safe):
 
     def delete_node(self                              ,                          # Delete node
                     node_type : Safe_Str__Node_Type   ,
-                    label     : Safe_Str__Node_Label
+                    label     : Safe_Str__Node_Label  ,
+                    author    : str = ''                                         # Who made the change (activity feed)
                ) -> Schema__Node__Delete__Response:
-        if self.repository.node_exists(node_type, label) is False:
+        folder = self.node_folder(node_type, label)                              # resolve before the files are gone
+        if folder is None:
             return Schema__Node__Delete__Response(success = False                     ,
                                                   deleted = False                     ,
                                                   label   = label                     ,
@@ -280,11 +410,18 @@ class Node__Service(Type_Safe):
         # TODO: Remove links from other nodes pointing to this one
 
         # Delete node
-        if self.repository.node_delete(node_type, label) is False:
+        version_before = self.repository.issue_paths_version
+        if folder == str(self.repository.path_handler.path_for_node_folder(node_type, label)):
+            deleted = self.repository.node_delete(node_type, label)
+        else:                                                                    # nested .../issues/{Label} node
+            deleted = self.repository.file_delete(f'{folder}/issue.json')
+            self.repository.node_cache_invalidate(folder)
+        if deleted is False:
             return Schema__Node__Delete__Response(success = False                   ,
                                                   deleted = False                   ,
                                                   label   = label                   ,
                                                   message = 'Failed to delete node' )
+        self.root_view_patch(version_before, node_type, label, deleted=True, folder=folder)
 
         # Update type index
         type_index = self.repository.type_index_load(node_type)
@@ -295,10 +432,29 @@ class Node__Service(Type_Safe):
         # Update global index
         self.update_global_index()
 
+        if self.activity_service:
+            self.activity_service.record_event(event_type = Enum__Activity__Event__Type.NODE_DELETED                ,
+                                               node_type  = node_type                                               ,
+                                               label      = label                                                   ,
+                                               author     = author                                                  ,
+                                               path       = folder                                                  )
+
         return Schema__Node__Delete__Response(success = True  ,
                                               deleted = True  ,
                                               label   = label )
 
+    def node_folder(self                              ,                          # Real folder of the node (nested issues too), None when missing
+                    node_type : Safe_Str__Node_Type   ,
+                    label     : Safe_Str__Node_Label
+               ) -> Optional[str]:
+        folder = str(self.repository.path_handler.path_for_node_folder(node_type, label))
+        if self.repository.storage_fs.file__exists(f'{folder}/issue.json'):
+            return folder
+        found = self.repository.node_find_path_by_label(label)
+        if found and str(self.repository.node_type_for_path(f'{found}/issue.json')) == str(node_type):
+            return str(found)
+        return None
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Label Generation - Phase 2 (B22): Hyphenated Labels
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,363 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Type__Retype__Service - Streaming rename / merge of a node type
+# Used by Type__Service.update_node_type when the type name changes
+#
+# Moves data/{old_type}/{Label}/... to data/{new_type}/{NewLabel}/..., rewrites
+# node_type/label/node_index in every moved issue.json and fixes target_label on
+# the other end of every link. Links are stored on both nodes, so a node's own
+# links are the index of who points at it: no global scan of issue.json files.
+# Link targets are written back in their real folder (nested children too).
+#
+# Memory stays bounded: only the label map (strings) is kept for the whole run,
+# nodes are loaded, rewritten and flushed batch_size at a time. The plan (labels
+# + label map) is saved once under indexes/retype/ and only the small progress
+# record is rewritten after each batch, so an interrupted run can resume.
+# dry_run walks the same path without writing.
+#
+# Scope: top-level nodes in data/{old_type}/. The old type leaves the config,
+# so a retype is refused while nested {old_type} children exist.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                                             import Callable, Dict, List
+from osbot_utils.utils.Json                                                                             import json_dumps
+from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                                    import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now                        import Timestamp_Now
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type
+from issues_fs.schemas.graph.Schema__Node                                                               import Schema__Node
+from issues_fs.schemas.graph.Schema__Node__Type__Retype__Request                                        import Schema__Node__Type__Retype__Request
+from issues_fs.schemas.graph.Schema__Node__Type__Retype__Response                                       import Schema__Node__Type__Retype__Response
+from issues_fs.issues.graph_services.Graph__Repository                                                  import Graph__Repository
+from issues_fs.issues.graph_services.Node__Service                                                      import Node__Service
+from issues_fs.issues.storage.Path__Handler__Graph_Node                                                 import FILE_NAME__ISSUE_JSON
+
+
+class Type__Retype__Service(Type_Safe):                                          # Bulk relabel / retype engine
+    repository   : Graph__Repository                                             # Data access layer
+    node_service : Node__Service       = None                                    # Label helpers + global index
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.node_service is None:
+            self.node_service = Node__Service(repository=self.repository)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Main Operation
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def retype(self                                                   ,          # Rename / merge old_type into new_type
+               request     : Schema__Node__Type__Retype__Request      ,
+               on_progress : Callable                          = None            # Called with the response after each batch
+          ) -> Schema__Node__Type__Retype__Response:
+        old_type = str(request.old_type)
+        new_type = str(request.new_type)
+        response = Schema__Node__Type__Retype__Response(old_type = old_type        ,
+                                                        new_type = new_type        ,
+                                                        dry_run  = request.dry_run )
+
+        if not old_type or not new_type or old_type == new_type:
+            response.message = 'old_type and new_type must be set and different'
+            return response
+
+        node_types = [str(nt.name) for nt in self.repository.node_types_load()]
+        if old_type not in node_types:
+            response.message = f'Node type not found: {old_type}'
+            return response
+
+        nested = self.nested_folders_of_type(old_type)
+        if nested:                                                               # would keep a type that no longer exists
+            response.message = (f'{len(nested)} nested {old_type} node(s) would keep an undefined type '
+                                f'(e.g. {nested[0]}); move or retype them first')
+            return response
+
+        folder_files = self.scan_type_folder(old_type)                           # {old_label: [extra relative files]}
+        checkpoint   = None
+        if request.resume:
+            checkpoint = self.repository.retype_checkpoint_load(old_type, new_type)
+
+        if checkpoint:                                                           # Resume: reuse the original plan
+            label_map   = checkpoint.get('label_map', {})
+            old_labels  = checkpoint.get('old_labels', [])
+            position    = checkpoint.get('position', 0)
+            next_index  = checkpoint.get('next_index', 1)
+            files_total = checkpoint.get('files_moved', 0)
+        else:
+            old_labels             = self.order_labels(list(folder_files.keys()))
+            label_map, next_index  = self.plan_labels(old_labels, new_type)
+            position, files_total  = 0, 0
+            if request.dry_run is False:                                         # the plan is written once per run
+                self.repository.retype_checkpoint_save(old_type, new_type, dict(old_labels = old_labels,
+                                                                                label_map  = label_map ))
+
+        response.total       = Safe_UInt(len(old_labels))
+        response.processed   = Safe_UInt(position)
+        response.files_moved = Safe_UInt(files_total)
+        response.relabelled  = Safe_UInt(sum(1 for old_label in old_labels
+                                             if self.index_of(old_label) != self.index_of(label_map[old_label])))
+        prefix_types         = self.prefix_types(node_types + [new_type])
+        batch_size           = max(1, int(request.batch_size))
+
+        while position < len(old_labels):
+            batch   = old_labels[position:position + batch_size]
+            pending = {}                                                         # folder -> node to save
+            moves   = []                                                         # (old_label, new_label)
+            for old_label in batch:
+                if self.retype_node(old_type, new_type, old_label, label_map, prefix_types, pending, response):
+                    moves.append((old_label, label_map[old_label]))
+
+            if request.dry_run is False:
+                files_total += self.flush_batch(old_type, new_type, pending, moves, folder_files)
+                position    += len(batch)
+                self.repository.retype_progress_save(old_type, new_type,
+                                                     dict(position    = position    ,
+                                                          next_index  = next_index  ,
+                                                          files_moved = files_total ))
+                response.batches_written = Safe_UInt(int(response.batches_written) + 1)
+            else:
+                files_total += sum(len(folder_files.get(old, [])) for old, _ in moves)
+                position    += len(batch)
+
+            response.processed   = Safe_UInt(position)
+            response.files_moved = Safe_UInt(files_total)
+            if on_progress:
+                on_progress(response)
+
+        if request.dry_run is False:
+            self.update_config(old_type, new_type)
+            self.update_type_indexes(old_type, new_type, len(old_labels), next_index)
+            self.repository.retype_checkpoint_delete(old_type, new_type)
+            self.repository.issues_files_invalidate_cache()
+
+        response.success   = True
+        response.completed = request.dry_run is False
+        response.message   = f'{"Would retype" if request.dry_run else "Retyped"} {len(old_labels)} nodes from {old_type} to {new_type}'
+        return response
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Planning
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def scan_type_folder(self, node_type: str) -> Dict[str, List[str]]:          # One listing: labels + their extra files
+        prefix       = f'data/{node_type}/'
+        folder_files = {}
+        for path in self.repository.storage_fs.files__paths():
+            path = str(path)
+            if path.startswith(prefix) is False:
+                continue
+            parts = path[len(prefix):].split('/', 1)
+            if len(parts) < 2:                                                   # e.g. data/{type}/_index.json
+                continue
+            label, relative = parts
+            files = folder_files.setdefault(label, [])
+            if relative != FILE_NAME__ISSUE_JSON:
+                files.append(relative)
+        return {label: files for label, files in folder_files.items()
+                if self.repository.storage_fs.file__exists(f'{prefix}{label}/{FILE_NAME__ISSUE_JSON}')}
+
+    def nested_folders_of_type(self, node_type: str) -> List[str]:               # child issue folders (…/issues/{Label}) of node_type
+        label_prefix = f'{self.node_service.type_to_label_prefix(node_type)}-'
+        folders      = []
+        for path in self.repository.storage_fs.files__paths():
+            path = str(path)
+            if path.endswith(f'/{FILE_NAME__ISSUE_JSON}') is False:
+                continue
+            folder           = path[:-len(FILE_NAME__ISSUE_JSON) - 1]
+            parent, _, label = folder.rpartition('/')
+            if parent != 'issues' and parent.endswith('/issues') is False:       # top-level (or not an issue folder)
+                continue
+            if label.startswith(label_prefix) and str(self.repository.node_type_for_path(path)) == node_type:
+                folders.append(folder)
+        return sorted(folders)
+
+    def order_labels(self, labels: List[str]) -> List[str]:                      # Stable processing order
+        return sorted(labels, key=lambda label: (self.index_of(label), label))
+
+    def plan_labels(self                 ,                                       # Map every old label to its new label
+                    old_labels : List[str],
+                    new_type   : str
+               ) -> tuple:
+        type_index = self.repository.type_index_load(new_type)
+        next_index = int(type_index.next_index)
+        label_map  = {}
+        taken      = set()
+
+        for old_label in old_labels:                                             # Keep the index when it is free
+            index     = self.index_of(old_label)
+            new_label = str(self.node_service.label_from_type_and_index(new_type, index)) if index else None
+            if new_label is None or new_label in taken or self.repository.node_exists(new_type, new_label):
+                new_label = None
+            if new_label:
+                label_map[old_label] = new_label
+                taken.add(new_label)
+                next_index = max(next_index, index + 1)
+
+        for old_label in old_labels:                                             # Collisions (merges) get fresh indices
+            if old_label in label_map:
+                continue
+            while True:
+                new_label   = str(self.node_service.label_from_type_and_index(new_type, next_index))
+                next_index += 1
+                if new_label not in taken and self.repository.node_exists(new_type, new_label) is False:
+                    break
+            label_map[old_label] = new_label
+            taken.add(new_label)
+
+        return (label_map, next_index)
+
+    def index_of(self, label: str) -> int:                                       # "Bug-27" -> 27
+        tail = label.rsplit('-', 1)[-1]
+        return int(tail) if tail.isdigit() else 0
+
+    def prefix_types(self, node_types: List[str]) -> List[tuple]:                # [(label prefix, type)] longest first
+        pairs = [(f'{self.node_service.type_to_label_prefix(t)}-', t) for t in set(node_types)]
+        return sorted(pairs, key=lambda pair: len(pair[0]), reverse=True)
+
+    def type_for_label(self, label: str, prefix_types: List[tuple]) -> str:     # Resolve label -> type without reloading config
+        for prefix, node_type in prefix_types:
+            if label.startswith(prefix):
+                return node_type
+        return None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Per-Node Rewrite
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def retype_node(self                          ,                              # Rewrite one node + the other end of its links
+                    old_type     : str            ,
+                    new_type     : str            ,
+                    old_label    : str            ,
+                    label_map    : dict           ,
+                    prefix_types : List[tuple]    ,
+                    pending      : dict           ,
+                    response     : Schema__Node__Type__Retype__Response
+               ) -> bool:
+        new_label  = label_map[old_label]
+        new_folder = self.repository.path_handler.path_for_node_folder(new_type, new_label)
+        node       = pending.get(new_folder) or self.repository.node_load(old_type, old_label)
+        if node is None:                                                         # Already moved by an interrupted run
+            return False
+
+        now             = Timestamp_Now()
+        node.node_type  = new_type
+        node.label      = new_label
+        node.node_index = Safe_UInt(self.index_of(new_label))
+        node.updated_at = now
+
+        for link in node.links:
+            target_label = str(link.target_label)
+            if target_label in label_map:                                        # Target is being retyped too
+                if label_map[target_label] != target_label:
+                    link.target_label = label_map[target_label]
+                    response.links_updated = Safe_UInt(int(response.links_updated) + 1)
+                continue
+
+            target_type = self.type_for_label(target_label, prefix_types)        # Fix the inverse link on the target
+            if target_type is None:
+                continue
+            target_folder = self.target_folder(target_type, target_label, pending)
+            target        = (pending.get(target_folder) or self.repository.node_load_by_path(target_folder)) if target_folder else None
+            if target is None:
+                continue
+            changed = False
+            for inverse in target.links:
+                if str(inverse.target_label) == old_label:
+                    inverse.target_label = new_label
+                    changed              = True
+                    response.links_updated = Safe_UInt(int(response.links_updated) + 1)
+            if changed:
+                target.updated_at = now
+                pending[target_folder] = target
+
+        pending[new_folder] = node
+        return True
+
+    def target_folder(self, target_type: str, target_label: str, pending: dict) -> str:    # Real folder of a link target (None if missing)
+        folder = self.repository.path_handler.path_for_node_folder(target_type, target_label)
+        if folder in pending or self.repository.storage_fs.file__exists(f'{folder}/{FILE_NAME__ISSUE_JSON}'):
+            return folder
+        found = self.repository.node_find_path_by_label(target_label)            # nested child issue
+        return str(found) if found else None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Batch Writes
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def flush_batch(self                          ,                              # Write one batch, returns files moved
+                    old_type     : str            ,
+                    new_type     : str            ,
+                    pending      : Dict[str, Schema__Node],
+                    moves        : List[tuple]    ,
+                    folder_files : dict
+               ) -> int:
+        storage = self.repository.storage_fs
+        for folder, node in pending.items():                                     # New issue.json files + fixed targets
+            if folder == self.repository.path_handler.path_for_node_folder(node.node_type, node.label):
+                self.repository.node_save(node)
+            else:                                                                # nested target: rewrite it where it lives
+                path = f'{folder}/{FILE_NAME__ISSUE_JSON}'
+                self.repository.file_save(path, json_dumps(node.json(), indent=2).encode('utf-8'))
+                self.repository.node_cache_invalidate(path)
+
+        files_moved = 0
+        for old_label, new_label in moves:                                       # Attachments, children, legacy files
+            old_folder = f'data/{old_type}/{old_label}'
+            new_folder = f'data/{new_type}/{new_label}'
+            for relative in folder_files.get(old_label, []):
+                data = storage.file__bytes(f'{old_folder}/{relative}')
+                if data is not None:
+                    self.repository.file_save(f'{new_folder}/{relative}', data)
+                    self.repository.file_delete(f'{old_folder}/{relative}')
+                    files_moved += 1
+            self.repository.file_delete(f'{old_folder}/{FILE_NAME__ISSUE_JSON}')
+            files_moved += 1
+        return files_moved
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Config + Index Updates
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def update_config(self, old_type: str, new_type: str) -> None:               # Rename (or drop, on merge) the type definition
+        types    = self.repository.node_types_load()
+        is_merge = any(str(t.name) == new_type for t in types)
+        if is_merge:
+            types = [t for t in types if str(t.name) != old_type]
+        else:
+            for t in types:
+                if str(t.name) == old_type:
+                    t.name = Safe_Str__Node_Type(new_type)
+        self.repository.node_types_save(types)
+
+        link_types = self.repository.link_types_load()                           # Keep link type constraints valid
+        for lt in link_types:
+            lt.source_types = self.replace_type(lt.source_types, old_type, new_type)
+            lt.target_types = self.replace_type(lt.target_types, old_type, new_type)
+        self.repository.link_types_save(link_types)
+
+    def replace_type(self, types: list, old_type: str, new_type: str) -> list:   # Swap type name, keep order, no duplicates
+        result = []
+        for t in types:
+            name = new_type if str(t) == old_type else str(t)
+            if name not in result:
+                result.append(name)
+        return result
+
+    def update_type_indexes(self                  ,                              # Rebuild per-type and global indexes
+                            old_type   : str      ,
+                            new_type   : str      ,
+                            moved      : int      ,
+                            next_index : int
+                       ) -> None:
+        now       = Timestamp_Now()
+        old_index = self.repository.type_index_load(old_type)
+        new_index = self.repository.type_index_load(new_type)
+
+        new_index.count        = Safe_UInt(int(new_index.count) + moved)
+        new_index.next_index   = Safe_UInt(max(int(new_index.next_index), next_index))
+        new_index.last_updated = now
+        self.repository.type_index_save(new_index)
+
+        old_index_path = self.repository.path_handler.path_for_type_index(old_type)
+        if self.repository.storage_fs.file__exists(old_index_path):
+            self.repository.file_delete(old_index_path)
+
+        self.node_service.update_global_index()
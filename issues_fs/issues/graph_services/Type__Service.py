@@ -3,9 +3,10 @@
 # Manages node types (bug, task, feature) and link types (blocks, has-task)
 # Phase 1: Added git-repo type for root issue support
 # Phase 2: B15 (update_node_type), B16 (update_link_type)
+# Renaming a type (updates.name) streams its nodes through Type__Retype__Service
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing                                                                                             import List, Optional
+from typing                                                                                             import Callable, List, Optional
 from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                            import Safe_Str__Text
 from osbot_utils.type_safe.primitives.domains.identifiers.Obj_Id                                        import Obj_Id
@@ -14,11 +15,14 @@ from issues_fs.schemas.graph.Safe_Str__Graph_Types
 from issues_fs.schemas.graph.Schema__Node__Type                                                         import Schema__Node__Type
 from issues_fs.schemas.graph.Schema__Node__Type__Update                                                 import Schema__Node__Type__Update
 from issues_fs.schemas.graph.Schema__Node__Type__Update__Response                                       import Schema__Node__Type__Update__Response
+from issues_fs.schemas.graph.Schema__Node__Type__Retype__Request                                        import Schema__Node__Type__Retype__Request
+from issues_fs.schemas.graph.Schema__Node__Type__Retype__Response                                       import Schema__Node__Type__Retype__Response
 from issues_fs.schemas.graph.Schema__Link__Type                                                         import Schema__Link__Type
 from issues_fs.schemas.graph.Schema__Link__Type__Update                                                 import Schema__Link__Type__Update
 from issues_fs.schemas.graph.Schema__Link__Type__Update__Response                                       import Schema__Link__Type__Update__Response
 from issues_fs.schemas.safe_str.Safe_Str__Hex_Color                                                     import Safe_Str__Hex_Color
 from issues_fs.issues.graph_services.Graph__Repository                                                  import Graph__Repository
+from issues_fs.issues.graph_services.Type__Retype__Service                                              import Type__Retype__Service
 
 
 class Type__Service(Type_Safe):                                                  # Type definition service
@@ -118,10 +122,32 @@ class Type__Service(Type_Safe):
         types[found_idx] = found_type                                            # Replace in list
         self.repository.node_types_save(types)                                   # Persist changes
 
+        new_name = str(updates.name) if updates.name is not None else ''
+        if new_name and new_name != str(name):                                   # Rename / merge: move every node
+            request = Schema__Node__Type__Retype__Request(old_type = name     ,
+                                                          new_type = new_name )
+            retype  = self.retype_node_type(request)
+            if retype.success is False:
+                return Schema__Node__Type__Update__Response(success   = False          ,
+                                                             node_type = found_type     ,
+                                                             retype    = retype         ,
+                                                             message   = retype.message )
+            return Schema__Node__Type__Update__Response(success   = True                          ,
+                                                         node_type = self.get_node_type(new_name)  ,
+                                                         retype    = retype                        ,
+                                                         message   = f'Node type renamed: {name} to {new_name}')
+
         return Schema__Node__Type__Update__Response(success   = True       ,
                                                      node_type = found_type ,
                                                      message   = f'Node type updated: {name}')
 
+    def retype_node_type(self                                               ,    # Move all nodes of old_type into new_type
+                         request     : Schema__Node__Type__Retype__Request  ,
+                         on_progress : Callable                      = None      # Called after each batch is written
+                    ) -> Schema__Node__Type__Retype__Response:
+        retype_service = Type__Retype__Service(repository=self.repository)
+        return retype_service.retype(request, on_progress=on_progress)
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Link Type Operations
     # ═══════════════════════════════════════════════════════════════════════════════
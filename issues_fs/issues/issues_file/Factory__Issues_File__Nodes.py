@@ -1,6 +1,9 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Factory__Issues_File__Nodes - Converts parsed .issues lines into Schema__Node
 # Maps the 3-field flat format to the full 14-field Schema__Node structure
+# Accepts Schema__Issues_File__Line or Issues_File__Record (same attributes)
+# Ids are seeded from source file + label and timestamps come from the caller
+# (file mtime), so reloading unchanged content yields identical nodes
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import re
@@ -22,7 +25,9 @@ LABEL_INDEX_PATTERN = re.compile(r'-(\d{1,5})$')
 
 class Factory__Issues_File__Nodes(Type_Safe):
 
-    def create_nodes(self, parsed_lines: List[Schema__Issues_File__Line]
+    def create_nodes(self, parsed_lines : List[Schema__Issues_File__Line],
+                           source_file  : str = ''                       ,
+                           timestamp    : int = 0                               # ms since epoch (file mtime), 0 if unknown
                     ) -> Tuple[List[Schema__Node], List[Schema__Issues_File__Error]]:
         nodes  : List[Schema__Node]              = []
         errors : List[Schema__Issues_File__Error] = []
@@ -30,7 +35,7 @@ class Factory__Issues_File__Nodes(Type_Safe):
         node_map = {}                                                           # label -> Schema__Node for link wiring
 
         for line in parsed_lines:
-            node, error = self.create_node(line)
+            node, error = self.create_node(line, source_file, timestamp)
             if error is not None:
                 errors.append(error)
                 continue
@@ -45,50 +50,64 @@ class Factory__Issues_File__Nodes(Type_Safe):
 
             if line.parent_label and line.parent_label in node_map:             # parent-child link
                 parent = node_map[line.parent_label]
-                link   = Schema__Node__Link(link_type_id = Obj_Id()                                     ,
+                link   = Schema__Node__Link(link_type_id = self.link_type_id('has-task')                  ,
                                             verb         = Safe_Str__Link_Verb('has-task')               ,
                                             target_id    = Obj_Id(str(node.node_id))                     ,
                                             target_label = Safe_Str__Node_Label(line.label)              ,
-                                            created_at   = Timestamp_Now()                               )
+                                            created_at   = Timestamp_Now(timestamp)                      )
                 parent.links.append(link)
 
             for ref_label in line.cross_refs:                                   # cross-reference links
                 if ref_label in node_map:
                     target = node_map[ref_label]
-                    link   = Schema__Node__Link(link_type_id = Obj_Id()                                  ,
+                    link   = Schema__Node__Link(link_type_id = self.link_type_id('relates-to')           ,
                                                 verb         = Safe_Str__Link_Verb('relates-to')          ,
                                                 target_id    = Obj_Id(str(target.node_id))                ,
                                                 target_label = Safe_Str__Node_Label(ref_label)            ,
-                                                created_at   = Timestamp_Now()                            )
+                                                created_at   = Timestamp_Now(timestamp)                   )
                     node.links.append(link)
 
         return (nodes, errors)
 
-    def create_node(self, line: Schema__Issues_File__Line
+    def create_node(self, line        : Schema__Issues_File__Line,
+                          source_file : str = ''                 ,
+                          timestamp   : int = 0
                    ) -> Tuple[Schema__Node, Schema__Issues_File__Error]:
         try:
-            node_index = self.extract_index(line.label)
-            now        = Timestamp_Now()
-
-            node = Schema__Node(node_id     = Obj_Id()                                               ,
-                                node_type   = Safe_Str__Node_Type(line.issue_type)                    ,
-                                node_index  = Safe_UInt(node_index)                                   ,
-                                label       = Safe_Str__Node_Label(line.label)                        ,
-                                title       = Safe_Str__Text(line.description)                        ,
-                                description = Safe_Str__Issue__Node__Description(line.description)    ,
-                                status      = Safe_Str__Status(line.status)                           ,
+            now  = Timestamp_Now(timestamp)
+            node = Schema__Node(node_id     = self.node_id(source_file, line.label)                  ,
                                 created_at  = now                                                     ,
                                 updated_at  = now                                                     ,
-                                created_by  = Obj_Id()                                                ,
+                                created_by  = self.created_by(source_file)                            ,
                                 tags        = []                                                      ,
                                 links       = []                                                      ,
-                                properties  = {}                                                      )
+                                properties  = {}                                                      ,
+                                **self.line_fields(line)                                              )
             return (node, None)
         except Exception as e:
-            error = Schema__Issues_File__Error(line_number = line.line_number ,
-                                               raw_line    = f'{line.label} | {line.status} | {line.description}',
-                                               message     = str(e)          )
-            return (None, error)
+            return (None, self.line_error(line, e))
+
+    def line_fields(self, line: Schema__Issues_File__Line) -> dict:             # validated node fields; raises on what create_node rejects
+        return dict(node_type   = Safe_Str__Node_Type(line.issue_type)                       ,
+                    node_index  = Safe_UInt(self.extract_index(line.label))                  ,
+                    label       = Safe_Str__Node_Label(line.label)                           ,
+                    title       = Safe_Str__Text(line.description)                           ,
+                    description = Safe_Str__Issue__Node__Description(line.description)       ,
+                    status      = Safe_Str__Status(line.status)                              )
+
+    def line_error(self, line: Schema__Issues_File__Line, error: Exception) -> Schema__Issues_File__Error:
+        return Schema__Issues_File__Error(line_number = line.line_number ,
+                                          raw_line    = f'{line.label} | {line.status} | {line.description}',
+                                          message     = str(error)       )
+
+    def node_id(self, source_file: str, label: str) -> Obj_Id:                  # stable per (file, label)
+        return Obj_Id.from_seed(f'issues-file:{source_file}:{label}')
+
+    def created_by(self, source_file: str) -> Obj_Id:                           # the .issues file is the author
+        return Obj_Id.from_seed(f'issues-file:{source_file}')
+
+    def link_type_id(self, verb: str) -> Obj_Id:                                # stable per verb
+        return Obj_Id.from_seed(f'issues-file-link:{verb}')
 
     def extract_index(self, label: str) -> int:                                 # Extract number from label tail
         match = LABEL_INDEX_PATTERN.search(label)
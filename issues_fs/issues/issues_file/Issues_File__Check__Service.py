@@ -1,13 +1,16 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Issues_File__Check__Service - Validates .issues files and reports problems
 # Implements the `issues-fs check` logic: parse, validate, summarise
+# Each file is parsed once; counts, cross-refs and indent mode come from that pass
+# Content is checked through the loader's records-only path (no Schema__Node);
+# check_repository reuses the repository's cached load results instead
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from typing                                                                     import Dict, List, Set
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
 from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Schema__Issues_File__Load__Result
-from issues_fs.issues.issues_file.Schema__Issues_File__Error                    import Schema__Issues_File__Error
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Schema__Issues_File__Records__Result
 
 
 class Schema__Issues_File__Check__Summary(Type_Safe):
@@ -31,73 +34,55 @@ class Issues_File__Check__Service(Type_Safe):
 
     def check_multiple(self, files: List[tuple]
                       ) -> Schema__Issues_File__Check__Summary:
-        load_result = self.loader.load_multiple(files)
+        return self.check_results([self.loader.load_records(*file[:2]) for file in files])     # one parse per file, no nodes built
 
-        duplicate_labels = self.find_duplicate_labels(load_result)
-        broken_refs      = self.find_broken_refs(files)
-        mixed_indent     = self.find_mixed_indent(files)
+    def check_repository(self, repository : object                              # Graph__Repository: reuses its cached parses
+                        ) -> Schema__Issues_File__Check__Summary:
+        return self.check_results(repository.issues_files_results())            # only changed files are re-parsed
 
+    def check_results(self, results: List[Schema__Issues_File__Load__Result]     # or Schema__Issues_File__Records__Result
+                     ) -> Schema__Issues_File__Check__Summary:
+        label_counts     : Dict[str, int] = {}
+        all_refs         : Set[str]       = set()
         issues_by_type   = {}
         issues_by_status = {}
-        for node in load_result.nodes:
-            t = str(node.node_type)
-            s = str(node.status)
-            issues_by_type[t]   = issues_by_type.get(t, 0) + 1
-            issues_by_status[s] = issues_by_status.get(s, 0) + 1
-
-        all_errors = list(load_result.errors)
-        is_valid   = (len(all_errors) == 0 and
-                      len(duplicate_labels) == 0 and
-                      len(broken_refs) == 0)
+        total_issues     = 0
+        total_errors     = 0
+        files_checked    = []
+        mixed_indent     = []
+
+        for result in results:                                                  # single pass over per-file results
+            for label, t, s in self.result_items(result):
+                label_counts[label] = label_counts.get(label, 0) + 1
+                issues_by_type[t]   = issues_by_type.get(t, 0) + 1
+                issues_by_status[s] = issues_by_status.get(s, 0) + 1
+            all_refs.update(result.cross_refs)
+            total_issues += result.total_issues
+            total_errors += len(result.errors)
+            files_checked.extend(result.files_loaded)
+            mixed_indent .extend(result.mixed_indent)
+
+        duplicate_labels = sorted([label for label, count in label_counts.items() if count > 1])
+        broken_refs      = sorted([ref   for ref in all_refs if ref not in label_counts])
+        is_valid         = (total_errors == 0 and
+                            len(duplicate_labels) == 0 and
+                            len(broken_refs) == 0)
 
         return Schema__Issues_File__Check__Summary(
-            total_issues     = load_result.total_issues                          ,
-            total_errors     = len(all_errors)                                   ,
+            total_issues     = total_issues                                      ,
+            total_errors     = total_errors                                      ,
             issues_by_type   = issues_by_type                                    ,
             issues_by_status = issues_by_status                                  ,
-            files_checked    = load_result.files_loaded                           ,
+            files_checked    = files_checked                                     ,
             duplicate_labels = duplicate_labels                                   ,
             broken_refs      = broken_refs                                        ,
             mixed_indent     = mixed_indent                                       ,
             is_valid         = is_valid                                           )
 
-    def find_duplicate_labels(self, load_result: Schema__Issues_File__Load__Result
-                             ) -> List[str]:
-        seen : Dict[str, int] = {}
-        for node in load_result.nodes:
-            label = str(node.label)
-            seen[label] = seen.get(label, 0) + 1
-        return sorted([label for label, count in seen.items() if count > 1])
-
-    def find_broken_refs(self, files: List[tuple]) -> List[str]:
-        from issues_fs.issues.issues_file.Parser__Issues_File import Parser__Issues_File
-        parser    = Parser__Issues_File()
-        all_labels : Set[str] = set()
-        all_refs   : Set[str] = set()
-
-        for content, source_file in files:
-            result = parser.parse(content, source_file)
-            for issue in result.issues:
-                all_labels.add(issue.label)
-                for ref in issue.cross_refs:
-                    all_refs.add(ref)
-
-        return sorted([ref for ref in all_refs if ref not in all_labels])
-
-    def find_mixed_indent(self, files: List[tuple]) -> List[str]:
-        mixed = []
-        for content, source_file in files:
-            has_tab   = False
-            has_space = False
-            for line in content.split('\n'):
-                if line and not line.strip().startswith('#'):
-                    if line[0] == '\t':
-                        has_tab = True
-                    elif line[0] == ' ' and line.strip():
-                        has_space = True
-            if has_tab and has_space:
-                mixed.append(source_file)
-        return mixed
+    def result_items(self, result) -> list:                                      # (label, node_type, status) per issue
+        if isinstance(result, Schema__Issues_File__Records__Result):
+            return result.items
+        return [(str(node.label), str(node.node_type), str(node.status)) for node in result.nodes]
 
     def format_report(self, summary: Schema__Issues_File__Check__Summary) -> str:
         lines = []
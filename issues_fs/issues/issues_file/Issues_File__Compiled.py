@@ -0,0 +1,98 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Issues_File__Compiled - JSON encoding of parsed .issues load results
+# Used for the compiled sidecar cache (indexes/issues_files/) and to ship
+# results back from loader worker processes.
+#
+# Layout:  b'{PARSER_VERSION}\n{fingerprint}\n' + zlib(json(result.json()))
+# The header is checked before anything is decompressed. Decoding is driven
+# by the annotations of Schema__Issues_File__Load__Result and the schemas it
+# nests, never by the data: a sidecar only supplies JSON values, and each one
+# goes through its declared Safe_* / Enum type before it is placed on the
+# object. That keeps a tampered (or git-shared) sidecar from building anything
+# but those schemas, while skipping Type_Safe's generic from_json, which costs
+# more than re-parsing the .issues file.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import zlib
+from enum                                                                       import Enum
+from typing                                                                     import Any, get_args, get_origin, get_type_hints
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.type_safe.Type_Safe__Primitive                                 import Type_Safe__Primitive
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__Dict           import Type_Safe__Dict
+from osbot_utils.type_safe.type_safe_core.collections.Type_Safe__List           import Type_Safe__List
+from issues_fs.issues.issues_file.Parser__Issues_File                           import PARSER_VERSION
+
+COMPILED__JSON_TYPES = (str, int, float, bool)                                  # plain annotations accepted as-is (exact type)
+COMPILED__FIELDS     = {}                                                       # schema class -> {field: annotation}, from code only
+
+
+class Issues_File__Compiled(Type_Safe):
+
+    def dumps(self, result) -> bytes:                                           # compact JSON of a load result
+        return json.dumps(result.json(), separators=(',', ':')).encode()
+
+    def loads(self, data: bytes):                                               # Schema__Issues_File__Load__Result
+        from issues_fs.issues.issues_file.Issues_File__Loader__Service import Schema__Issues_File__Load__Result     # loader imports this module
+        return self.from_data(Schema__Issues_File__Load__Result, json.loads(data))
+
+    def encode(self, result, fingerprint: str) -> bytes:                        # sidecar bytes for one source file
+        header = f'{PARSER_VERSION}\n{fingerprint}\n'.encode()
+        return header + zlib.compress(self.dumps(result))
+
+    def decode(self, data: bytes, fingerprint: str):                            # None when stale, from another parser version or corrupt
+        header = f'{PARSER_VERSION}\n{fingerprint}\n'.encode()
+        if not data or data.startswith(header) is False:
+            return None
+        try:
+            return self.loads(zlib.decompress(data[len(header):]))
+        except (zlib.error, ValueError, TypeError, KeyError):                   # ValueError covers bad JSON and rejected Safe_* values
+            return None
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Schema-Driven Decoding
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def from_data(self, cls: type, data: dict):                                 # every declared field must be present
+        if type(data) is not dict:
+            raise TypeError(f'expected an object for {cls.__name__}')
+        target = cls.__new__(cls)
+        values = {name: self.value_for(annotation, data[name]) for name, annotation in self.fields_for(cls).items()}
+        target.__dict__.update(values)                                          # values are already converted to the declared types
+        return target
+
+    def fields_for(self, cls: type) -> dict:
+        fields = COMPILED__FIELDS.get(cls)
+        if fields is None:
+            fields = {name: annotation for name, annotation in get_type_hints(cls).items() if name.startswith('_') is False}
+            COMPILED__FIELDS[cls] = fields
+        return fields
+
+    def value_for(self, annotation, raw):
+        if raw is None:
+            return None
+        origin = get_origin(annotation)
+        if origin is list:
+            if type(raw) is not list:
+                raise TypeError('expected a list')
+            item_type = get_args(annotation)[0]
+            items     = Type_Safe__List(expected_type=item_type)
+            list.extend(items, [self.value_for(item_type, item) for item in raw])
+            return items
+        if origin is dict:
+            if type(raw) is not dict:
+                raise TypeError('expected an object')
+            key_type, value_type = get_args(annotation)
+            items = Type_Safe__Dict(expected_key_type=key_type, expected_value_type=value_type)
+            dict.update(items, {self.value_for(key_type, key): self.value_for(value_type, value) for key, value in raw.items()})
+            return items
+        if annotation is Any:                                                   # JSON values only (str, number, bool, list, dict)
+            return raw
+        if isinstance(annotation, type):
+            if issubclass(annotation, Type_Safe):
+                return self.from_data(annotation, raw)
+            if issubclass(annotation, (Type_Safe__Primitive, Enum)):            # validates / sanitises the value
+                return annotation(raw)
+            if annotation in COMPILED__JSON_TYPES and type(raw) is annotation:
+                return raw
+        raise TypeError(f'unsupported value for {annotation}')
@@ -0,0 +1,125 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Issues_File__Export__Service - Exports the JSON issue tree as .issues text
+# Reverse of Issues_File__Normalise__Service: walks data/{type}/{Label}/ and
+# nested issues/ folders depth-first, emitting one "label | status | title"
+# line per issue, indented by depth, with "-> Label" for links to anything
+# that is not a direct child.
+#
+# An empty or unparseable issue.json becomes a "# unreadable" comment plus a
+# placeholder line (folder label, status "unreadable"), so the issue and its
+# subtree stay in the export under the right parent instead of vanishing.
+#
+# Memory: one pass over files__paths() builds a folder -> children index
+# (strings only); issue.json files are read one at a time while walking, and
+# lines are yielded as they are produced.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                     import Dict, Iterator, List, TextIO
+from memory_fs.storage_fs.Storage_FS                                            import Storage_FS
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Json                                                     import json_loads
+from issues_fs.issues.issues_file.Parser__Issues_File__Line                     import CROSS_REF_PATTERN
+
+EXPORT__ISSUE_JSON   = 'issue.json'
+EXPORT__DATA_PREFIX  = 'data/'
+EXPORT__CHILD_FOLDER = 'issues'
+EXPORT__ROOT         = ''                                                       # children key for top-level issues
+EXPORT__UNREADABLE   = 'unreadable'                                             # placeholder status for a broken issue.json
+
+
+class Issues_File__Export__Service(Type_Safe):
+
+    def export_to_str(self, storage_fs: Storage_FS) -> str:                     # whole snapshot as one string
+        return '\n'.join(self.iter_lines(storage_fs))
+
+    def export_to_stream(self, storage_fs : Storage_FS,                         # write lines as they are produced
+                               stream     : TextIO
+                        ) -> int:
+        count = 0
+        for line in self.iter_lines(storage_fs):
+            stream.write(line + '\n')
+            count += 1
+        return count
+
+    def iter_lines(self, storage_fs: Storage_FS) -> Iterator[str]:
+        children = self.children_index(storage_fs)
+        stack    = [(0, iter(children.get(EXPORT__ROOT, [])))]                  # (depth, iterator over sibling folders)
+        while stack:
+            depth, siblings = stack[-1]
+            folder          = next(siblings, None)
+            if folder is None:
+                stack.pop()
+                continue
+            issue         = self.load_issue(storage_fs, folder)
+            child_folders = children.get(folder, [])
+            if issue is None:                                                   # keep the slot so children stay under it
+                yield '\t' * depth + f'# {EXPORT__UNREADABLE}: {folder}/{EXPORT__ISSUE_JSON}'
+                issue = dict(label=folder.rsplit('/', 1)[-1], status=EXPORT__UNREADABLE)
+            yield self.issue_to_line(issue, depth, self.child_labels(child_folders))
+            if child_folders:
+                stack.append((depth + 1, iter(child_folders)))
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Tree Index
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def children_index(self, storage_fs: Storage_FS) -> Dict[str, List[str]]:   # parent folder -> sorted child folders
+        children = {}
+        suffix   = f'/{EXPORT__ISSUE_JSON}'
+        for path in storage_fs.files__paths():
+            path = str(path)
+            if path.startswith(EXPORT__DATA_PREFIX) is False or path.endswith(suffix) is False:
+                continue
+            folder = path[:-len(suffix)]
+            parts  = folder.split('/')
+            if len(parts) == 3:                                                 # data/{type}/{Label}
+                parent = EXPORT__ROOT
+            elif len(parts) > 3 and parts[-2] == EXPORT__CHILD_FOLDER:          # .../issues/{Label}
+                parent = '/'.join(parts[:-2])
+            else:
+                continue
+            children.setdefault(parent, []).append(folder)
+
+        for folders in children.values():
+            folders.sort(key=self.folder_sort_key)
+        return children
+
+    def folder_sort_key(self, folder: str) -> tuple:                            # Task-2 before Task-10
+        label        = folder.rsplit('/', 1)[-1]
+        prefix, _, n = label.rpartition('-')
+        return (prefix, int(n) if n.isdigit() else 0, label)
+
+    def child_labels(self, child_folders: List[str]) -> set:
+        return {folder.rsplit('/', 1)[-1] for folder in child_folders}
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Line Formatting
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def load_issue(self, storage_fs: Storage_FS, folder: str) -> dict:          # None when empty or not a JSON object
+        content = storage_fs.file__str(f'{folder}/{EXPORT__ISSUE_JSON}')
+        if not content:
+            return None
+        issue = json_loads(content)                                             # {} on a parse error
+        return issue if isinstance(issue, dict) and issue else None
+
+    def issue_to_line(self, issue        : dict ,
+                            depth        : int  ,
+                            child_labels : set
+                     ) -> str:
+        label  = str(issue.get('label' , '')).strip()
+        status = str(issue.get('status', '')).strip() or 'backlog'
+        title  = ' '.join(str(issue.get('title', '')).split())                  # one line, collapsed whitespace
+        known  = set(CROSS_REF_PATTERN.findall(title))                          # refs already written in the title
+        refs   = []
+        for link in issue.get('links') or []:
+            target = str(link.get('target_label', ''))
+            if not target or target in child_labels or target in known:        # children are expressed by indentation
+                continue
+            if CROSS_REF_PATTERN.fullmatch(f'-> {target}'):                    # only labels the parser can read back
+                refs.append(target)
+                known.add(target)
+        line = '\t' * depth + f'{label} | {status} | {title}'
+        for ref in refs:
+            line += f' -> {ref}'
+        return line
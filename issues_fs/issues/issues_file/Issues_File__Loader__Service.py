@@ -1,10 +1,31 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Issues_File__Loader__Service - Top-level orchestrator for .issues file loading
 # Parses .issues files and converts them into Schema__Node instances
+#
+# Parallel mode (opt-in, parallel_workers != 1): with parallel_threshold or
+# more files, each file's parse + create_nodes runs in a process pool. The pool
+# uses forkserver/spawn (never fork: the host process may be running watcher
+# or status threads) and each worker gets a pickled copy of this loader, so a
+# customised parser or node_factory behaves the same as in serial mode. Workers
+# ship results back as compact JSON (Issues_File__Compiled, schema-driven
+# decode) and results are merged in input order, so output matches the serial
+# path. If the loader can't be pickled or the pool breaks, loading falls back
+# to serial.
+# Link wiring is per file (parent/child and -> refs within the same file).
+#
+# load_records() is the records-only path for callers that only need counts
+# and cross-refs (e.g. `issues-fs check`): each line gets the same field
+# validation as create_node, but no Schema__Node or link is built.
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import multiprocessing
+import os
+import pickle
+from concurrent.futures                                                         import ProcessPoolExecutor
+from concurrent.futures.process                                                 import BrokenProcessPool
 from typing                                                                     import List, Tuple
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs.issues.issues_file.Issues_File__Compiled                         import Issues_File__Compiled
 from issues_fs.issues.issues_file.Parser__Issues_File                           import Parser__Issues_File
 from issues_fs.issues.issues_file.Factory__Issues_File__Nodes                   import Factory__Issues_File__Nodes
 from issues_fs.issues.issues_file.Schema__Issues_File__Error                    import Schema__Issues_File__Error
@@ -17,37 +38,126 @@ class Schema__Issues_File__Load__Result(Type_Safe):
     errors      : List[Schema__Issues_File__Error]                              # all errors from parsing + creation
     files_loaded: List[str]                                                     # which .issues files were processed
     total_issues: int                                                           # total issue count
+    cross_refs  : List[str]                                                     # every -> reference seen (for broken ref checks)
+    mixed_indent: List[str]                                                     # files mixing tab and space indentation
+
+
+class Schema__Issues_File__Records__Result(Type_Safe):
+    items       : list                                                          # (label, node_type, status) per valid line
+    errors      : List[Schema__Issues_File__Error]                              # same errors load_content reports
+    files_loaded: List[str]
+    total_issues: int
+    cross_refs  : List[str]
+    mixed_indent: List[str]
+
+
+PARALLEL__MIN_FILES     = 32                                                    # below this, process start-up costs more than it saves
+PARALLEL__START_METHOD  = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+worker__loader = None                                                           # set in each pool process by load_content__worker_init
+
+
+def load_content__worker_init(loader_bytes: bytes) -> None:                     # runs once per pool process
+    global worker__loader
+    worker__loader = pickle.loads(loader_bytes)
+
+def load_content__in_worker(file: tuple) -> bytes:                              # runs in a pool process
+    result = worker__loader.load_content(*file)
+    return Issues_File__Compiled().dumps(result)
 
 
 class Issues_File__Loader__Service(Type_Safe):
-    parser       : Parser__Issues_File
-    node_factory : Factory__Issues_File__Nodes
+    parser             : Parser__Issues_File
+    node_factory       : Factory__Issues_File__Nodes
+    parallel_workers   : int = 1                                                # 1 = serial (default), 0 = os.cpu_count(), N = N processes
+    parallel_threshold : int = PARALLEL__MIN_FILES                              # min number of files before using the pool
 
-    def load_content(self, content: str, source_file: str = ''
+    def load_content(self, content     : str     ,
+                           source_file : str = '',
+                           timestamp   : int = 0                                # file mtime (ms) used for created_at/updated_at
                     ) -> Schema__Issues_File__Load__Result:
-        parse_result = self.parser.parse(content, source_file)
-        nodes, create_errors = self.node_factory.create_nodes(parse_result.issues)
+        indent_seen           = set()
+        records, parse_errors = self.parser.parse_records(content, indent_seen) # records only; no Schema__Issues_File__Line
+        nodes, create_errors  = self.node_factory.create_nodes(records, source_file, timestamp)
 
-        all_errors = list(parse_result.errors) + list(create_errors)
+        all_errors   = list(parse_errors) + list(create_errors)
+        cross_refs   = [ref for record in records for ref in record.cross_refs]
+        mixed_indent = [source_file] if len(indent_seen) > 1 else []
 
         return Schema__Issues_File__Load__Result(nodes        = nodes                ,
                                                   errors       = all_errors           ,
                                                   files_loaded = [source_file]        ,
-                                                  total_issues = len(nodes)           )
+                                                  total_issues = len(nodes)           ,
+                                                  cross_refs   = cross_refs           ,
+                                                  mixed_indent = mixed_indent         )
+
+    def load_records(self, content     : str     ,
+                           source_file : str = ''
+                    ) -> Schema__Issues_File__Records__Result:
+        indent_seen           = set()
+        records, parse_errors = self.parser.parse_records(content, indent_seen)
+        line_fields           = self.node_factory.line_fields                   # same checks as create_node, no Schema__Node
+        items                 = []
+        errors                = list(parse_errors)
+        for record in records:
+            try:
+                fields = line_fields(record)
+            except Exception as e:
+                errors.append(self.node_factory.line_error(record, e))
+                continue
+            items.append((str(fields['label']), str(fields['node_type']), str(fields['status'])))
+
+        return Schema__Issues_File__Records__Result(items        = items                                                  ,
+                                                     errors       = errors                                                 ,
+                                                     files_loaded = [source_file]                                          ,
+                                                     total_issues = len(items)                                             ,
+                                                     cross_refs   = [ref for record in records for ref in record.cross_refs],
+                                                     mixed_indent = [source_file] if len(indent_seen) > 1 else []         )
+
+    def load_each(self, files: List[tuple]                                      # one result per (content, source_file[, timestamp]), input order
+                 ) -> List[Schema__Issues_File__Load__Result]:
+        workers = min(self.parallel_workers or os.cpu_count() or 1, len(files))
+        if workers > 1 and len(files) >= self.parallel_threshold:
+            try:
+                return self.load_each__parallel(files, workers)
+            except (OSError, BrokenProcessPool, pickle.PicklingError,           # no process support, a worker died,
+                    AttributeError, TypeError):                                 # or the loader/results can't be pickled
+                pass
+        return [self.load_content(*file) for file in files]
+
+    def load_each__parallel(self, files   : List[tuple]          ,
+                                  workers : int
+                           ) -> List[Schema__Issues_File__Load__Result]:
+        loader_bytes = pickle.dumps(self)                                       # carries the configured parser / node_factory
+        chunksize    = max(1, len(files) // (workers * 4))
+        context      = multiprocessing.get_context(PARALLEL__START_METHOD)
+        with ProcessPoolExecutor(max_workers = workers                   ,
+                                 mp_context  = context                   ,
+                                 initializer = load_content__worker_init ,
+                                 initargs    = (loader_bytes,)           ) as pool:
+            blobs = list(pool.map(load_content__in_worker, files, chunksize=chunksize))   # map keeps input order
+        compiled = Issues_File__Compiled()
+        return [compiled.loads(blob) for blob in blobs]
 
     def load_multiple(self, files: List[Tuple[str, str]]
                      ) -> Schema__Issues_File__Load__Result:
         all_nodes  : List[Schema__Node]              = []
         all_errors : List[Schema__Issues_File__Error] = []
         all_files  : List[str]                        = []
+        all_refs   : List[str]                        = []
+        all_mixed  : List[str]                        = []
 
-        for content, source_file in files:
-            result = self.load_content(content, source_file)
+        for file, result in zip(files, self.load_each(files)):
+            source_file = file[1]
             all_nodes.extend(result.nodes)
             all_errors.extend(result.errors)
             all_files.append(source_file)
+            all_refs.extend(result.cross_refs)
+            all_mixed.extend(result.mixed_indent)
 
         return Schema__Issues_File__Load__Result(nodes        = all_nodes     ,
                                                   errors       = all_errors    ,
                                                   files_loaded = all_files     ,
-                                                  total_issues = len(all_nodes))
+                                                  total_issues = len(all_nodes),
+                                                  cross_refs   = all_refs      ,
+                                                  mixed_indent = all_mixed     )
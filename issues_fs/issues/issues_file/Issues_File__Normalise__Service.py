@@ -1,11 +1,24 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Issues_File__Normalise__Service - Exports .issues to JSON issue structure
 # Converts the flat .issues format into data/{type}/{label}/issue.json files
+#
+# normalise_to_storage: incremental mode. Streams file by file, compares each
+# generated issue.json with what is in storage (content hash) and only writes
+# new / changed files, flushing every batch_size writes. A manifest of the
+# files produced last time (path -> hash) lets it delete files whose issue
+# disappeared from the .issues sources - only while they still hold what was
+# written; files edited since (UI, links, comments) are kept and reported as
+# conflicts.
+# Pass repository= to write through Graph__Repository.file_save / file_delete,
+# so its path index and caches see the new files; with a bare storage_fs, call
+# repository.path_index_invalidate() afterwards if a repository shares it.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing                                                                     import Dict, List, Tuple
+from typing                                                                     import Callable, Dict, Iterator, List, Tuple
+from memory_fs.storage_fs.Storage_FS                                            import Storage_FS
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
-from osbot_utils.utils.Json                                                     import json_dumps
+from osbot_utils.utils.Json                                                     import json_dumps, json_loads
+from osbot_utils.utils.Misc                                                     import bytes_md5
 from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
 from issues_fs.schemas.graph.Schema__Node                                       import Schema__Node
 
@@ -16,6 +29,20 @@ class Schema__Normalise__Result(Type_Safe):
     errors        : List[str]                                                   # any export errors
 
 
+class Schema__Normalise__Sync__Result(Type_Safe):
+    created   : int                                                             # issue.json files that did not exist
+    updated   : int                                                             # existing files whose content changed
+    unchanged : int                                                             # files skipped (same content hash)
+    removed   : int                                                             # previously normalised files no longer produced
+    conflicts : List[str]                                                       # no longer produced but edited since: left in place
+    batches   : int                                                             # write batches flushed
+    errors    : List[str]                                                       # parse / create errors
+
+
+NORMALISE__MANIFEST_PATH = 'indexes/issues_files/_normalised.json'             # path -> content hash of files we produced
+NORMALISE__BATCH_SIZE    = 100
+
+
 class Issues_File__Normalise__Service(Type_Safe):
     loader : Issues_File__Loader__Service
 
@@ -44,6 +71,81 @@ class Issues_File__Normalise__Service(Type_Safe):
 
         return (all_files, all_errors)
 
+    def iter_normalised(self, files  : List[tuple]                               ,   # (content, source_file[, timestamp])
+                              errors : List[str]  = None
+                       ) -> Iterator[Tuple[str, str]]:                          # yields (path, json) one file at a time
+        for file in files:
+            load_result = self.loader.load_content(*file)
+            if errors is not None:
+                errors.extend(f'line {e.line_number}: {e.message}' for e in load_result.errors)
+            for node in load_result.nodes:
+                yield (self.node_to_path(node), self.node_to_json(node))
+
+    def normalise_to_storage(self, files         : List[tuple]                         ,
+                                   storage_fs    : Storage_FS = None                   ,   # defaults to repository.storage_fs
+                                   batch_size    : int = NORMALISE__BATCH_SIZE         ,
+                                   manifest_path : str = NORMALISE__MANIFEST_PATH      ,
+                                   repository    : object     = None                       # Graph__Repository: writes go through it
+                            ) -> Schema__Normalise__Sync__Result:
+        if storage_fs is None and repository is None:
+            return Schema__Normalise__Sync__Result(errors=['normalise_to_storage needs a storage_fs or a repository'])
+        storage_fs   = storage_fs or repository.storage_fs
+        save         = repository.file_save   if repository is not None else storage_fs.file__save
+        delete       = repository.file_delete if repository is not None else storage_fs.file__delete
+        result       = Schema__Normalise__Sync__Result()
+        errors       = []
+        previous     = self.manifest_load(storage_fs, manifest_path)
+        manifest     = {}
+        pending      = []                                                       # (path, bytes) waiting to be written
+
+        for path, content in self.iter_normalised(files, errors):
+            data          = content.encode()
+            content_hash  = bytes_md5(data)
+            manifest[path] = content_hash
+            existing      = storage_fs.file__bytes(path) if storage_fs.file__exists(path) else None
+            if existing is None:
+                result.created   += 1
+            elif bytes_md5(existing) == content_hash:
+                result.unchanged += 1
+                continue
+            else:
+                result.updated   += 1
+            pending.append((path, data))
+            if len(pending) >= batch_size:
+                self.flush_batch(save, pending, result)
+
+        self.flush_batch(save, pending, result)
+
+        for path, written_hash in previous.items():                             # gone from the .issues sources
+            if path in manifest or storage_fs.file__exists(path) is False:
+                continue
+            if bytes_md5(storage_fs.file__bytes(path)) != written_hash:         # edited since we wrote it: not ours to delete
+                result.conflicts.append(path)
+                continue
+            delete(path)
+            result.removed += 1
+
+        if manifest != previous:
+            save(manifest_path, json_dumps(manifest).encode())
+        result.errors = errors
+        return result
+
+    def flush_batch(self, save    : Callable                        ,             # storage_fs.file__save or repository.file_save
+                          pending : List[Tuple[str, bytes]]         ,
+                          result  : Schema__Normalise__Sync__Result
+                   ) -> None:
+        if not pending:
+            return
+        for path, data in pending:
+            save(path, data)
+        pending.clear()
+        result.batches += 1
+
+    def manifest_load(self, storage_fs: Storage_FS, manifest_path: str) -> Dict[str, str]:
+        if storage_fs.file__exists(manifest_path) is False:
+            return {}
+        return json_loads(storage_fs.file__str(manifest_path)) or {}
+
     def node_to_path(self, node: Schema__Node) -> str:                          # data/{type}/{label}/issue.json
         node_type = str(node.node_type)
         label     = str(node.label)
@@ -0,0 +1,38 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Issues_File__Record - Low-allocation form of a parsed .issues line
+# Same fields as Schema__Issues_File__Line, but a plain __slots__ object with
+# no Type_Safe validation. The parse stage produces these; Type_Safe lines and
+# Schema__Node instances are only built when a caller asks for them.
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                     import List
+from issues_fs.issues.issues_file.Schema__Issues_File__Line                     import Schema__Issues_File__Line
+
+
+class Issues_File__Record:
+    __slots__ = ('label', 'status', 'description', 'indent_level', 'parent_label', 'cross_refs', 'line_number', 'issue_type')
+
+    def __init__(self, label       : str      ,
+                       status      : str      ,
+                       description : str      ,
+                       cross_refs  : List[str],
+                       line_number : int      ,
+                       issue_type  : str      ):
+        self.label        = label
+        self.status       = status
+        self.description  = description
+        self.indent_level = 0                                                   # set by file parser
+        self.parent_label = ''                                                  # set by file parser
+        self.cross_refs   = cross_refs
+        self.line_number  = line_number
+        self.issue_type   = issue_type
+
+    def to_line(self) -> Schema__Issues_File__Line:                             # materialize the Type_Safe form
+        return Schema__Issues_File__Line(label        = self.label        ,
+                                         status       = self.status       ,
+                                         description  = self.description  ,
+                                         indent_level = self.indent_level ,
+                                         parent_label = self.parent_label ,
+                                         cross_refs   = self.cross_refs   ,
+                                         line_number  = self.line_number  ,
+                                         issue_type   = self.issue_type   )
@@ -2,11 +2,16 @@
 # Issues_File__Schema__Service - Type auto-detection and schema validation
 # Validates that labels and statuses in .issues files conform to predefined
 # type schemas (Task, Bug, Workstream, Feature, Question, etc.)
+#
+# Validation runs over (label, type, status, source) tuples, so it works on
+# already-loaded nodes, cached repository parses or parser records streamed
+# straight from a file. Valid statuses are compiled once into frozensets.
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing                                                                     import Dict, List, Tuple
+from typing                                                                     import Dict, Iterable, List, Tuple
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Schema__Issues_File__Load__Result
 
 
 class Schema__Issues_Type__Definition(Type_Safe):
@@ -71,63 +76,118 @@ PREDEFINED_SCHEMAS = {
 
 
 class Issues_File__Schema__Service(Type_Safe):
-    loader  : Issues_File__Loader__Service
-    schemas : Dict[str, Schema__Issues_Type__Definition] = None
+    loader      : Issues_File__Loader__Service
+    schemas     : Dict[str, Schema__Issues_Type__Definition] = None
+    status_sets : dict                                       = None             # {type_name: frozenset(statuses)}, compiled on first check
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if self.schemas is None:
             self.schemas = dict(PREDEFINED_SCHEMAS)
 
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Entry Points
+    # ═══════════════════════════════════════════════════════════════════════════
+
     def check_content(self, content: str, source_file: str = ''
                      ) -> Schema__Issues_Schema__Summary:
-        load_result  = self.loader.load_content(content, source_file)
-        errors       = []
-        unknown_types = set()
+        return self.check_stream(content.split('\n'), source_file)
 
-        for node in load_result.nodes:
-            node_type = str(node.node_type)
-            status    = str(node.status)
-            label     = str(node.label)
+    def check_stream(self, lines       : Iterable ,                             # str/bytes lines or an open .issues file
+                           source_file : str = ''
+                    ) -> Schema__Issues_Schema__Summary:
+        records = self.loader.parser.iter_records(lines)                        # no Schema__Node is built
+        return self.check_records(records, source_file)
 
-            if node_type not in self.schemas:
-                unknown_types.add(node_type)
-                continue
+    def check_multiple(self, files: List[Tuple[str, str]]                       # (content, source_file[, timestamp])
+                      ) -> Schema__Issues_Schema__Summary:
+        def items():
+            for file in files:
+                source_file = file[1] if len(file) > 1 else ''
+                records     = self.loader.parser.iter_records(file[0].split('\n'))
+                yield from self.record_items(records, source_file)
+        return self.check_items(items())
+
+    def check_records(self, records     : Iterable ,                            # Issues_File__Record from Parser__Issues_File
+                            source_file : str = ''
+                     ) -> Schema__Issues_Schema__Summary:
+        return self.check_items(self.record_items(records, source_file))
 
-            schema = self.schemas[node_type]
-            if status not in schema.valid_statuses:
-                errors.append(Schema__Issues_Schema__Error(
-                    label   = label                                                ,
-                    field   = 'status'                                             ,
-                    message = f"Invalid status '{status}' for type '{node_type}'. "
-                              f"Valid: {', '.join(schema.valid_statuses)}"         ,
-                    source  = source_file                                          ))
+    def check_nodes(self, nodes       : Iterable ,                              # already-loaded Schema__Node objects
+                          source_file : str = ''
+                   ) -> Schema__Issues_Schema__Summary:
+        return self.check_items((str(node.label), str(node.node_type), str(node.status), source_file) for node in nodes)
 
-        return Schema__Issues_Schema__Summary(
-            total_checked  = len(load_result.nodes)      ,
-            total_errors   = len(errors)                 ,
-            errors         = errors                      ,
-            unknown_types  = sorted(unknown_types)       ,
-            is_valid       = len(errors) == 0            )
-
-    def check_multiple(self, files: List[Tuple[str, str]]
-                      ) -> Schema__Issues_Schema__Summary:
-        all_errors      = []
-        all_unknown      = set()
-        total_checked   = 0
+    def check_results(self, results: Iterable[Schema__Issues_File__Load__Result]
+                     ) -> Schema__Issues_Schema__Summary:
+        def items():
+            for result in results:
+                source_file = result.files_loaded[0] if result.files_loaded else ''
+                for node in result.nodes:
+                    yield (str(node.label), str(node.node_type), str(node.status), source_file)
+        return self.check_items(items())
+
+    def check_repository(self, repository : object                              # Graph__Repository: reuses its cached parses
+                        ) -> Schema__Issues_Schema__Summary:
+        return self.check_results(repository.issues_files_results())            # discovery order, changed files re-parsed
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Batch Validation
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def check_items(self, items: Iterable[tuple]                                # (label, node_type, status, source_file)
+                   ) -> Schema__Issues_Schema__Summary:
+        status_sets   = self.status_sets or self.compile_status_sets()
+        errors        = []
+        unknown_types = set()
+        total_checked = 0
 
-        for content, source_file in files:
-            summary = self.check_content(content, source_file)
-            all_errors.extend(summary.errors)
-            all_unknown.update(summary.unknown_types)
-            total_checked += summary.total_checked
+        for label, node_type, status, source_file in items:
+            total_checked += 1
+            valid_statuses = status_sets.get(node_type)
+            if valid_statuses is None:
+                unknown_types.add(node_type)
+            elif status not in valid_statuses:
+                errors.append(self.status_error(label, node_type, status, source_file))
 
         return Schema__Issues_Schema__Summary(
             total_checked  = total_checked             ,
-            total_errors   = len(all_errors)           ,
-            errors         = all_errors                ,
-            unknown_types  = sorted(all_unknown)       ,
-            is_valid       = len(all_errors) == 0      )
+            total_errors   = len(errors)               ,
+            errors         = errors                    ,
+            unknown_types  = sorted(unknown_types)     ,
+            is_valid       = len(errors) == 0          )
+
+    def record_items(self, records     : Iterable ,
+                           source_file : str
+                    ) -> Iterable[tuple]:
+        line_fields = self.loader.node_factory.line_fields                        # same label/type/status checks as create_node
+        for record in records:
+            try:
+                fields = line_fields(record)
+            except Exception:                                                   # the loader reports these as errors, not nodes
+                continue
+            yield (str(fields['label']), str(fields['node_type']), str(fields['status']), source_file)
+
+    def status_error(self, label       : str ,
+                           node_type   : str ,
+                           status      : str ,
+                           source_file : str
+                    ) -> Schema__Issues_Schema__Error:
+        schema = self.schemas[node_type]
+        return Schema__Issues_Schema__Error(
+            label   = label                                                ,
+            field   = 'status'                                             ,
+            message = f"Invalid status '{status}' for type '{node_type}'. "
+                      f"Valid: {', '.join(schema.valid_statuses)}"         ,
+            source  = source_file                                          )
+
+    def compile_status_sets(self) -> dict:
+        self.status_sets = {name: frozenset(schema.valid_statuses) for name, schema in self.schemas.items()}
+        return self.status_sets
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Schemas
+    # ═══════════════════════════════════════════════════════════════════════════
 
     def get_schema(self, type_name: str) -> Schema__Issues_Type__Definition:
         return self.schemas.get(type_name)
@@ -137,6 +197,20 @@ class Issues_File__Schema__Service(Type_Safe):
 
     def register_schema(self, schema: Schema__Issues_Type__Definition) -> None:
         self.schemas[schema.name] = schema
+        self.status_sets = None
+
+    def register_node_types(self, node_types : Iterable                         # Schema__Node__Type list (e.g. Type__Service.list_node_types())
+                           ) -> None:
+        for node_type in node_types:
+            self.register_schema(Schema__Issues_Type__Definition(
+                name           = str(node_type.name)                             ,
+                display_name   = str(node_type.display_name)                     ,
+                valid_statuses = [str(status) for status in node_type.statuses]  ,
+                description    = str(node_type.description)                      ))
+
+    def register_type_service(self, type_service : object                       # Type__Service: repository-registered types
+                             ) -> None:
+        self.register_node_types(type_service.list_node_types())
 
     def format_report(self, summary: Schema__Issues_Schema__Summary) -> str:
         lines = []
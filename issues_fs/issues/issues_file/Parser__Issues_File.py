@@ -1,40 +1,73 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Parser__Issues_File - Parses a complete .issues file
 # Handles indentation-based hierarchy, comments, blank lines
+# iter_parse streams records from any line iterable (or file object)
+# iter_records / parse_records are the low-allocation path (Issues_File__Record)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing                                                                     import List
+from typing                                                                     import Iterable, Iterator, List, Tuple
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs.issues.issues_file.Issues_File__Record                           import Issues_File__Record
 from issues_fs.issues.issues_file.Parser__Issues_File__Line                     import Parser__Issues_File__Line
 from issues_fs.issues.issues_file.Schema__Issues_File__Line                     import Schema__Issues_File__Line
 from issues_fs.issues.issues_file.Schema__Issues_File__Error                    import Schema__Issues_File__Error
 from issues_fs.issues.issues_file.Schema__Issues_File__Result                   import Schema__Issues_File__Result
 
 SPACES_PER_INDENT = 4                                                          # 4 spaces = 1 indent level
+PARSER_VERSION    = '2'                                                        # bump when parse/create_nodes output changes (invalidates compiled caches)
 
 
 class Parser__Issues_File(Type_Safe):
     line_parser : Parser__Issues_File__Line
 
     def parse(self, content: str, source_file: str = '') -> Schema__Issues_File__Result:
-        issues : List[Schema__Issues_File__Line] = []
         errors : List[Schema__Issues_File__Error] = []
-        parent_stack : List[str]                  = []                          # stack of labels at each indent level
+        issues : List[Schema__Issues_File__Line]  = list(self.iter_parse(content.split('\n'), errors))
 
-        lines = content.split('\n')
+        return Schema__Issues_File__Result(source_file = source_file ,
+                                           issues      = issues      ,
+                                           errors      = errors      )
+
+    def parse_records(self, content     : str       ,
+                            indent_seen : set = None                           # collects '\t' / ' ' leading chars (mixed indent check)
+                     ) -> Tuple[List[Issues_File__Record], List[Schema__Issues_File__Error]]:
+        errors  : List[Schema__Issues_File__Error] = []
+        records : List[Issues_File__Record]        = list(self.iter_records(content.split('\n'), errors, indent_seen))
+        return (records, errors)
+
+    def iter_parse(self, lines  : Iterable                                ,    # str/bytes lines, or a binary/text file object
+                         errors : List[Schema__Issues_File__Error] = None      # parse errors are appended here as they happen
+                  ) -> Iterator[Schema__Issues_File__Line]:
+        for record in self.iter_records(lines, errors):
+            yield record.to_line()
+
+    def iter_records(self, lines       : Iterable                                ,  # same as iter_parse, yields Issues_File__Record
+                           errors      : List[Schema__Issues_File__Error] = None ,
+                           indent_seen : set                              = None
+                    ) -> Iterator[Issues_File__Record]:
+        line_parser  = self.line_parser
+        parent_stack : List[str] = []                                           # stack of labels at each indent level
 
         for line_number_0, raw_line in enumerate(lines):
             line_number = line_number_0 + 1                                     # 1-based line numbers
 
+            if isinstance(raw_line, bytes):                                     # binary file objects yield bytes
+                raw_line = raw_line.decode('utf-8')
+            raw_line = raw_line.rstrip('\n')                                   # file iteration keeps the terminator
+
             if self.is_skip_line(raw_line):                                     # skip blank and comment lines
                 continue
 
+            if indent_seen is not None and raw_line[0] in ' \t':
+                indent_seen.add(raw_line[0])
+
             indent_level       = self.measure_indent(raw_line)
             stripped_line      = raw_line.strip()
-            parsed, error      = self.line_parser.parse(stripped_line, line_number)
+            parsed, error      = line_parser.parse_record(stripped_line, line_number)
 
             if error is not None:
-                errors.append(error)
+                if errors is not None:
+                    errors.append(error)
                 continue
 
             parsed.indent_level = indent_level
@@ -52,11 +85,7 @@ class Parser__Issues_File(Type_Safe):
             else:
                 parent_stack[indent_level] = parsed.label                       # replace at existing level
 
-            issues.append(parsed)
-
-        return Schema__Issues_File__Result(source_file = source_file ,
-                                           issues      = issues      ,
-                                           errors      = errors      )
+            yield parsed
 
     def is_skip_line(self, line: str) -> bool:                                  # blank or comment line
         stripped = line.strip()
@@ -6,6 +6,7 @@
 import re
 from typing                                                                     import Optional, Tuple
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from issues_fs.issues.issues_file.Issues_File__Record                           import Issues_File__Record
 from issues_fs.issues.issues_file.Schema__Issues_File__Line                     import Schema__Issues_File__Line
 from issues_fs.issues.issues_file.Schema__Issues_File__Error                    import Schema__Issues_File__Error
 
@@ -17,6 +18,13 @@ class Parser__Issues_File__Line(Type_Safe):
 
     def parse(self, line: str, line_number: int = 0) -> Tuple[Optional[Schema__Issues_File__Line],
                                                                Optional[Schema__Issues_File__Error]]:
+        record, error = self.parse_record(line, line_number)
+        if error is not None:
+            return (None, error)
+        return (record.to_line(), None)
+
+    def parse_record(self, line: str, line_number: int = 0) -> Tuple[Optional[Issues_File__Record],
+                                                                      Optional[Schema__Issues_File__Error]]:
         parts = line.split('|', 2)                                              # split on first two pipes only
 
         if len(parts) < 3:
@@ -44,15 +52,13 @@ class Parser__Issues_File__Line(Type_Safe):
         cross_refs = CROSS_REF_PATTERN.findall(description)                     # extract -> TargetLabel references
         issue_type = self.infer_type_from_label(label)
 
-        parsed = Schema__Issues_File__Line(label        = label        ,
-                                           status       = status       ,
-                                           description  = description  ,
-                                           indent_level = 0            ,        # set by file parser
-                                           parent_label = ''           ,        # set by file parser
-                                           cross_refs   = cross_refs   ,
-                                           line_number  = line_number  ,
-                                           issue_type   = issue_type   )
-        return (parsed, None)
+        record = Issues_File__Record(label        = label        ,
+                                     status       = status       ,
+                                     description  = description  ,
+                                     cross_refs   = cross_refs   ,
+                                     line_number  = line_number  ,
+                                     issue_type   = issue_type   )
+        return (record, None)
 
     def infer_type_from_label(self, label: str) -> str:                         # Extract type from label prefix
         match = LABEL_TYPE_PATTERN.match(label)                                 # e.g. "Task-1" -> "Task"
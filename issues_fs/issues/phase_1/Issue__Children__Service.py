@@ -6,8 +6,23 @@
 #   - add_child_issue: Create a child issue in parent's issues/ folder
 #   - convert_to_new_structure: Create issues/ folder for an existing issue
 #   - list_children: List all children in an issue's issues/ folder
+#   - move_subtree: Move an issue and its descendants under another parent
+#   - load_subtree: Nested hierarchy from one path-index walk + one batched read
+#
+# Child labels come from a counter file per issues/ folder ({folder}/_index.json),
+# so allocation is O(1) regardless of subtree size. A missing counter is rebuilt
+# from the folder's children; allocations are serialised per process and skip
+# any label whose issue.json already exists (another writer got there first).
+# Across processes the counter can be read stale, so each label is reserved by
+# exclusive-creating {folder}/{Label}.lock (O_EXCL on local disk) and released
+# once the child's issue.json is written; a label held by a marker is skipped.
+#
+# A move that has to relabel (collision in the new folder) also repoints the
+# other end of every link at the new label. Links are stored on both nodes, so
+# the moved issue's own links list every node that refers to it.
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import threading
 from typing                                                                                             import List
 from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
 from osbot_utils.type_safe.primitives.core.Safe_UInt                                                    import Safe_UInt
@@ -18,11 +33,15 @@ from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                                          import type_safe
 from osbot_utils.utils.Json                                                                             import json_dumps, json_loads
 from issues_fs.schemas.graph.Safe_Str__Graph_Types                     import Safe_Str__Node_Type, Safe_Str__Node_Label, Safe_Str__Status
+from issues_fs.schemas.graph.Schema__Children__Index                   import Schema__Children__Index
 from issues_fs.schemas.graph.Schema__Node                              import Schema__Node
-from issues_fs.schemas.issues.phase_1.Schema__Issue__Children          import Schema__Issue__Child__Create, Schema__Issue__Child__Response, Schema__Issue__Convert__Response, Schema__Issue__Children__List__Response
+from issues_fs.schemas.issues.phase_1.Schema__Issue__Children          import Schema__Issue__Child__Create, Schema__Issue__Child__Response, Schema__Issue__Convert__Response, Schema__Issue__Children__List__Response, Schema__Issue__Move__Response, Schema__Issue__Subtree__Response
 from issues_fs.issues.graph_services.Graph__Repository         import Graph__Repository
 from issues_fs.issues.storage.Path__Handler__Graph_Node        import Path__Handler__Graph_Node, FILE_NAME__ISSUE_JSON
 
+CHILD_LABEL__LOCK      = threading.Lock()                                        # counter read-bump-save is one step per process
+SUBTREE__SUMMARY_FIELDS = ['label', 'title', 'node_type', 'status']             # load_subtree default fields
+
 
 # todo: fix casting to types (like str(..) ) , which is not needed since Type_Safe handles that well (as long are we go into a Type_Safe class, primitive of decorator)
 #       create vulns for path transversal issues (i.e. all places where are are doing a path combine using strings
@@ -75,7 +94,8 @@ class Issue__Children__Service(Type_Safe):
         child_path = f"{child_folder}/{FILE_NAME__ISSUE_JSON}"                   # Save child issue
         data       = child_issue.json()
         content    = json_dumps(data, indent=2)
-        saved      = self.repository.storage_fs.file__save(child_path, content.encode('utf-8'))
+        saved      = self.repository.file_save(child_path, content.encode('utf-8'))
+        self.release_child_label(issues_folder, child_label)                     # issue.json (or the failure) now speaks for the label
 
         if saved is False:
             return Schema__Issue__Child__Response(success = False                          ,
@@ -114,7 +134,7 @@ class Issue__Children__Service(Type_Safe):
         self.ensure_folder_exists(issues_folder)                                 # Create the issues/ folder
 
         placeholder_path = f"{issues_folder}/.gitkeep"                           # Create placeholder to ensure folder persists
-        self.repository.storage_fs.file__save(placeholder_path, b'')
+        self.repository.file_save(placeholder_path, b'')
 
         return Schema__Issue__Convert__Response(success     = True                                   ,
                                                 converted   = True                                   ,
@@ -149,6 +169,181 @@ class Issue__Children__Service(Type_Safe):
                                                        children = children          ,
                                                        total    = Safe_UInt(len(children)))
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Load Subtree
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def load_subtree(self                            ,                           # Nested hierarchy under root_path in one pass
+                     root_path : str       = ''      ,                           # '' = every top-level issue
+                     max_depth : int       = -1      ,                           # levels below root (-1 = unlimited)
+                     fields    : List[str] = None                                # issue.json fields per node (None = summary fields)
+                ) -> Schema__Issue__Subtree__Response:
+        full_root = self.resolve_full_path(str(root_path))
+        fields    = list(fields) if fields else SUBTREE__SUMMARY_FIELDS
+        index     = self.repository.path_index_get()                             # one listing (shared, kept in sync by writes)
+        is_root   = self.is_root_path(full_root)
+
+        if is_root is False and index.file_exists(f"{full_root}/{FILE_NAME__ISSUE_JSON}") is False:
+            return Schema__Issue__Subtree__Response(success = False                               ,
+                                                    message = f'Issue not found: {root_path}'    )
+
+        folders  = [] if is_root else [full_root]                                # every folder to read, parents before children
+        children = {}                                                            # folder -> child folders (sorted)
+        level    = [full_root]
+        depth    = 0
+        while level and (max_depth < 0 or depth < max_depth):
+            next_level = []
+            for folder in level:
+                child_folders = self.subtree_child_folders(index, folder, is_root and folder == full_root)
+                if child_folders:
+                    children[folder] = child_folders
+                    next_level.extend(child_folders)
+            folders.extend(next_level)
+            level  = next_level
+            depth += 1
+
+        summaries = self.load_issue_fields(folders, fields)                      # one batched read
+
+        def build(folder):
+            node             = summaries.get(folder) or {}
+            node['path']     = self.make_relative_path(folder) if folder != full_root or is_root is False else ''
+            node['children'] = [build(child) for child in children.get(folder, [])]
+            return node
+
+        tree = build(full_root)
+        if is_root:
+            tree.update(label='Root', node_type='root')
+
+        return Schema__Issue__Subtree__Response(success = True                  ,
+                                                tree    = tree                  ,
+                                                total   = Safe_UInt(len(folders)))
+
+    def subtree_child_folders(self, index, folder: str, top_level: bool) -> List[str]:   # Sorted child issue folders of one node
+        if top_level:                                                            # root: data/{type}/{Label}
+            data_folder = f"{folder}/data" if folder and folder != '.' else 'data'
+            return [f"{data_folder}/{node_type}/{label}"
+                    for node_type in sorted(index.child_names(data_folder))
+                    for label     in sorted(index.child_folders_with(f"{data_folder}/{node_type}", FILE_NAME__ISSUE_JSON))]
+        issues_folder = f"{folder}/issues"
+        return [f"{issues_folder}/{label}" for label in sorted(index.child_folders_with(issues_folder, FILE_NAME__ISSUE_JSON))]
+
+    def load_issue_fields(self, folders: List[str], fields: List[str]) -> dict:  # folder -> {field: value} for the requested fields only
+        storage   = self.repository.storage_fs
+        summaries = {}
+        for folder in folders:
+            content = storage.file__str(f"{folder}/{FILE_NAME__ISSUE_JSON}")
+            data    = json_loads(content) if content else None
+            if data:
+                summaries[folder] = {field: data.get(field) for field in fields if field in data}
+        return summaries
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Move Subtree
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    @type_safe
+    def move_subtree(self                                ,                       # Move issue + descendants to a new parent
+                     source_path     : Safe_Str__File__Path ,
+                     new_parent_path : Safe_Str__File__Path                      # '' = top level (data/{type}/{Label})
+                ) -> Schema__Issue__Move__Response:
+        full_source = self.resolve_full_path(str(source_path))
+        full_parent = self.resolve_full_path(str(new_parent_path))
+        issue       = self.load_issue_from_path(f"{full_source}/{FILE_NAME__ISSUE_JSON}")
+
+        if issue is None:
+            return Schema__Issue__Move__Response(success = False, message = f'Issue not found: {source_path}')
+        if self.parent_exists(full_parent) is False:
+            return Schema__Issue__Move__Response(success = False, message = f'Parent not found: {new_parent_path}')
+        if full_parent == full_source or full_parent.startswith(f"{full_source}/"):
+            return Schema__Issue__Move__Response(success = False, message = 'Cannot move an issue into its own subtree')
+
+        node_type = str(issue.get('node_type', ''))
+        label     = str(issue.get('label') or full_source.rsplit('/', 1)[-1])
+        to_root   = self.is_root_path(full_parent)
+        if to_root and not node_type:
+            return Schema__Issue__Move__Response(success = False, message = 'Issue has no node_type for a top level folder')
+
+        target_folder = self.resolve_full_path(f"data/{node_type}") if to_root else f"{full_parent}/issues"
+        target        = f"{target_folder}/{label}"
+
+        if target == full_source:                                                # Already there
+            return Schema__Issue__Move__Response(success       = True                               ,
+                                                 path          = self.make_relative_path(target)    ,
+                                                 previous_path = self.make_relative_path(full_source),
+                                                 label         = label                              ,
+                                                 message       = 'Already under this parent'        )
+
+        relabel = self.repository.path_index_get().folder_exists(target)
+        if relabel:
+            if to_root:
+                return Schema__Issue__Move__Response(success = False, message = f'Label already exists at top level: {label}')
+            label  = self.generate_child_label(target_folder, node_type)         # Collision: next free label in the new folder
+            target = f"{target_folder}/{label}"
+        elif to_root is False:
+            self.reserve_child_index(target_folder, node_type, label)            # Keep the counter ahead of the moved label
+
+        renamed     = self.repository.folder_rename(full_source, target)         # Native rename when the backend has one
+        files_moved = len(self.repository.path_index_get().files_under(target)) if renamed else \
+                      self.repository.folder_copy_delete(full_source, target)
+
+        links_updated = 0
+        if relabel:                                                              # Moved issue.json carries the new label
+            old_label           = str(issue.get('label') or full_source.rsplit('/', 1)[-1])
+            issue['label']      = label
+            issue['node_index'] = int(self.extract_index_from_label(label))
+            self.repository.file_save(f"{target}/{FILE_NAME__ISSUE_JSON}", json_dumps(issue, indent=2).encode('utf-8'))
+            self.release_child_label(target_folder, label)
+            links_updated       = self.relink_counterparts(issue, old_label, label)
+
+        return Schema__Issue__Move__Response(success       = True                                ,
+                                             path          = self.make_relative_path(target)     ,
+                                             previous_path = self.make_relative_path(full_source),
+                                             label         = label                               ,
+                                             files_moved   = Safe_UInt(files_moved)              ,
+                                             links_updated = Safe_UInt(links_updated)            ,
+                                             renamed       = renamed                             )
+
+    def relink_counterparts(self, issue: dict, old_label: str, new_label: str) -> int:   # Repoint inverse links at a relabelled issue
+        node_id = str(issue.get('node_id') or '')
+        updated = 0
+        seen    = set()
+        for link in issue.get('links') or []:
+            target_label = str(link.get('target_label') or '')
+            folder       = self.repository.node_find_path_by_label(target_label) if target_label else None
+            if not folder or str(folder) in seen:
+                continue
+            seen.add(str(folder))
+            target = self.load_issue_from_path(f"{folder}/{FILE_NAME__ISSUE_JSON}")
+            if not target or (link.get('target_id') and target.get('node_id') and
+                              str(target['node_id']) != str(link['target_id'])):  # same label, different node
+                continue
+            changed = 0
+            for inverse in target.get('links') or []:
+                if node_id and inverse.get('target_id'):                         # ids survive relabelling; labels may repeat across folders
+                    points_here = str(inverse['target_id']) == node_id
+                else:
+                    points_here = str(inverse.get('target_label', '')) == old_label
+                if points_here and inverse.get('target_label') != new_label:
+                    inverse['target_label'] = new_label
+                    changed                += 1
+            if changed:
+                self.repository.file_save(f"{folder}/{FILE_NAME__ISSUE_JSON}", json_dumps(target, indent=2).encode('utf-8'))
+                updated += changed
+        return updated
+
+    def reserve_child_index(self, issues_folder: str, child_type: str, label: str) -> None:   # Counter must not hand out a moved-in label
+        with CHILD_LABEL__LOCK:
+            counters = self.repository.children_index_load(issues_folder)
+            if counters is None or child_type not in counters.next_index:
+                return                                                           # Rebuilt from the folder contents on next add
+            prefix = f"{self.child_type_display(child_type)}-"
+            if label.startswith(prefix) and label[len(prefix):].isdigit():
+                index = int(label[len(prefix):])
+                if index >= counters.next_index[child_type]:
+                    counters.next_index[child_type] = index + 1
+                    counters.last_updated           = Timestamp_Now()
+                    self.repository.children_index_save(issues_folder, counters)
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Path Resolution Helpers
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -186,23 +381,19 @@ class Issue__Children__Service(Type_Safe):
     # Folder Operations
     # ═══════════════════════════════════════════════════════════════════════════════
 
+    def is_root_path(self, folder_path: str) -> bool:                            # '' / '.' / base_path all mean the root
+        base_path = str(self.path_handler.base_path)
+        return not folder_path or folder_path == base_path or folder_path == '.'
+
     def parent_exists(self, folder_path: str) -> bool:                           # Check if parent issue exists
-        base_path = str(self.path_handler.base_path)                             # Root is always valid parent
-        if not folder_path or folder_path == base_path or folder_path == '.' or folder_path == '':
+        if self.is_root_path(folder_path):                                       # Root is always valid parent
             return True
 
         issue_path = f"{folder_path}/{FILE_NAME__ISSUE_JSON}"
         return self.repository.storage_fs.file__exists(issue_path)               # Phase 2: issue.json only
 
     def folder_exists(self, folder_path: str) -> bool:                           # Check if folder exists (has any files)
-        all_paths = self.repository.storage_fs.files__paths()
-        prefix    = f"{folder_path}/"
-
-        for path in all_paths:
-            if path.startswith(prefix):
-                return True
-
-        return False
+        return self.repository.path_index_get().folder_exists(folder_path)
 
     def ensure_folder_exists(self, folder_path: str) -> None:                           # Ensure folder exists in storage
         # todo: see if we need this method
@@ -214,25 +405,9 @@ class Issue__Children__Service(Type_Safe):
     def scan_child_folders(self,                                                        # Find all child folders in issues/
                            issues_folder: Safe_Str__File__Path
                       ) -> List[Safe_Str__File__Path]:
-        folders   = set()
-        all_paths = self.repository.storage_fs.files__paths()
-        prefix    = f"{issues_folder}/"
-
-        for path in all_paths:
-            if path.startswith(prefix) is False:
-                continue
-
-            relative = path[len(prefix):]                                        # Remove prefix
-            parts    = relative.split('/')
-
-            if len(parts) >= 2:
-                child_folder = parts[0]                                          # First segment is child folder
-                filename     = parts[1]
-
-                if filename == FILE_NAME__ISSUE_JSON:                            # Phase 2: issue.json only
-                    folders.add(f"{issues_folder}/{child_folder}")
-
-        return list(folders)
+        index = self.repository.path_index_get()                                 # O(depth) lookup + O(children) listing
+        return [f"{issues_folder}/{child_folder}"
+                for child_folder in index.child_folders_with(str(issues_folder), FILE_NAME__ISSUE_JSON)]   # Phase 2: issue.json only
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Label Generation
@@ -242,53 +417,70 @@ class Issue__Children__Service(Type_Safe):
                              issues_folder : Safe_Str__File__Path      ,
                              child_type    : str
                         ) -> str:
-        existing_indices = self.get_existing_indices(issues_folder, child_type)  # Find highest existing index
-
-        next_index = 1
-        if existing_indices:
-            next_index = max(existing_indices) + 1
+        with CHILD_LABEL__LOCK:
+            next_index = self.allocate_child_index(issues_folder, child_type)
 
-        display_type = child_type.capitalize()                                   # Generate label: "Task" + "-" + "1"
+        return f"{self.child_type_display(child_type)}-{next_index}"             # Generate label: "Task" + "-" + "1"
 
+    def allocate_child_index(self                     ,                          # Reserve the next index in the counter file
+                             issues_folder : Safe_Str__File__Path      ,
+                             child_type    : str
+                        ) -> int:
+        issues_folder = str(issues_folder)
+        child_type    = str(child_type)
+        counters      = self.repository.children_index_load(issues_folder)
+        if counters is None:
+            counters = Schema__Children__Index()
+
+        next_index = counters.next_index.get(child_type)
+        if next_index is None:                                                   # No counter yet: rebuild from the folder's children
+            existing_indices = self.get_existing_indices(issues_folder, child_type)
+            next_index       = max(existing_indices) + 1 if existing_indices else 1
+
+        display_type = self.child_type_display(child_type)
+        while self.reserve_child_label(issues_folder, f"{display_type}-{next_index}") is False:
+            next_index += 1                                                      # Taken by another writer / external edit
+
+        counters.next_index[child_type] = next_index + 1
+        counters.last_updated           = Timestamp_Now()
+        self.repository.children_index_save(issues_folder, counters)
+        return next_index
+
+    def reserve_child_label(self, issues_folder: str, label: str) -> bool:       # Claim a label (False = in use or held by another writer)
+        if self.repository.storage_fs.file__exists(f"{issues_folder}/{label}/{FILE_NAME__ISSUE_JSON}"):
+            return False
+        lock_path = self.repository.path_handler.path_for_child_label_lock(issues_folder, label)
+        if self.repository.file_create_exclusive(lock_path) is False:
+            return False
+        if self.repository.storage_fs.file__exists(f"{issues_folder}/{label}/{FILE_NAME__ISSUE_JSON}"):
+            self.repository.file_delete(lock_path)                               # Written (and released) between the two checks
+            return False
+        return True
+
+    def release_child_label(self, issues_folder: str, label: str) -> None:      # Drop the marker once issue.json exists
+        self.repository.file_delete(self.repository.path_handler.path_for_child_label_lock(issues_folder, label))
+
+    def child_type_display(self, child_type: str) -> str:                        # "task" -> "Task", "git-repo" -> "GitRepo"
         if '-' in child_type:                                                    # Handle types like "git-repo"
-            parts = child_type.split('-')
-            display_type = ''.join(p.capitalize() for p in parts)
-
-        return f"{display_type}-{next_index}"
+            return ''.join(p.capitalize() for p in child_type.split('-'))
+        return child_type.capitalize()
 
     # todo: these str should be type_safe primitives
     def get_existing_indices(self                     ,                          # Get all existing indices for type
                              issues_folder : Safe_Str__File__Path      ,
                              child_type    : str
                         ) -> List[int]:
-        indices   = []
-        all_paths = self.repository.storage_fs.files__paths()
-        prefix    = f"{issues_folder}/"
-
-        display_type = child_type.capitalize()
-        if '-' in child_type:
-            parts = child_type.split('-')
-            display_type = ''.join(p.capitalize() for p in parts)
-
-        label_prefix = f"{display_type}-"
-
-        for path in all_paths:
-            if path.startswith(prefix) is False:
-                continue
-
-            relative = path[len(prefix):]
-            parts    = relative.split('/')
-
-            if len(parts) >= 1:
-                folder_name = parts[0]
-
-                if folder_name.startswith(label_prefix):
-                    try:
-                        index_str = folder_name[len(label_prefix):]
-                        index     = int(index_str)
-                        indices.append(index)
-                    except ValueError:
-                        pass
+        indices      = []
+        index        = self.repository.path_index_get()
+        label_prefix = f"{self.child_type_display(child_type)}-"
+
+        for folder_name in index.child_names(str(issues_folder)):
+            if folder_name.startswith(label_prefix):
+                try:
+                    index_str = folder_name[len(label_prefix):]
+                    indices.append(int(index_str))
+                except ValueError:
+                    pass
 
         return indices
 
@@ -76,7 +76,7 @@ class Root__Issue__Service(Type_Safe):
         path    = self.path_handler.path_for_root_issue()
         data    = root_issue.json()
         content = json_dumps(data, indent=2)
-        return self.repository.storage_fs.file__save(path, content.encode('utf-8'))
+        return self.repository.file_save(path, content.encode('utf-8'))
 
     def root_issue_exists(self) -> bool:                                         # Check if root issue.json exists
         path = self.path_handler.path_for_root_issue()
@@ -133,5 +133,5 @@ class Root__Issue__Service(Type_Safe):
     def delete_root_issue(self) -> bool:                                         # Delete root issue (for tests)
         path = self.path_handler.path_for_root_issue()
         if self.repository.storage_fs.file__exists(path):
-            return self.repository.storage_fs.file__delete(path)
+            return self.repository.file_delete(path)
         return False
\ No newline at end of file
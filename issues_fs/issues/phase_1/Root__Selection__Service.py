@@ -2,6 +2,10 @@
 # Root__Selection__Service - Service for managing which folder is the current root
 # Phase 1: Enables selecting any folder with issue.json/node.json as the root
 # Phase 2 (B13): Removed node.json fallback - issue.json only
+#
+# get_available_roots() walks the path set once (scan_folder_stats) to get
+# issue folders, has-issues flags and child counts for every folder, then
+# reads all issue summaries in one batch.
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from typing                                                                                             import List
@@ -15,10 +19,18 @@ from issues_fs.issues.graph_services.Graph__Repository         import Graph__Rep
 from issues_fs.issues.storage.Path__Handler__Graph_Node        import Path__Handler__Graph_Node, FILE_NAME__ISSUE_JSON
 
 
+class Root__Folder__Stats(Type_Safe):                                            # Result of one pass over storage paths
+    issue_folders   : List[str]                                                  # folders under data/ holding issue.json
+    has_issues      : set                                                        # folders with at least one file under {folder}/issues/
+    child_counts    : dict                                                       # folder -> issue.json folders anywhere under {folder}/issues/
+    top_level_count : int                                                        # issue.json folders under data/
+
+
 class Root__Selection__Service(Type_Safe):                                       # Service for root folder selection
-    repository   : Graph__Repository                                             # Data access layer
-    path_handler : Path__Handler__Graph_Node                                     # Path generation
-    current_root : Safe_Str__File__Path                                          # Currently selected root path
+    repository            : Graph__Repository                                    # Data access layer
+    path_handler          : Path__Handler__Graph_Node                            # Path generation
+    current_root          : Safe_Str__File__Path                                 # Currently selected root path
+    root_change_listeners : list                                                 # callables(new_root) run after set_current_root()
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Get Available Roots
@@ -26,13 +38,15 @@ class Root__Selection__Service(Type_Safe):
 
     def get_available_roots(self) -> Schema__Root__List__Response:               # Find all folders that could serve as roots
         candidates = []
+        stats      = self.scan_folder_stats()                                    # One pass over storage paths
 
-        root_candidate = self.create_issues_root_candidate()                     # The .issues/ folder itself is always first
+        root_candidate = self.create_issues_root_candidate(stats)                # The .issues/ folder itself is always first
         candidates.append(root_candidate)
 
-        issue_folders = self.scan_for_issue_folders()                            # Find all folders with issue.json or node.json
-        for folder_path in sorted(issue_folders):
-            candidate = self.create_candidate_from_folder(folder_path)
+        issue_folders = sorted(stats.issue_folders)
+        summaries     = self.load_issue_summaries(issue_folders)                 # Batch read of every issue.json
+        for folder_path in issue_folders:
+            candidate = self.create_candidate_from_folder(folder_path, stats, summaries.get(folder_path))
             if candidate:
                 candidates.append(candidate)
 
@@ -91,6 +105,9 @@ class Root__Selection__Service(Type_Safe):
                                                   message  = f'Invalid root path: {new_path}')
 
         self.current_root = new_path                                             # Set new root
+        if new_path != previous_root:
+            for listener in self.root_change_listeners:                          # e.g. Node__Service.root_view_rebuild
+                listener(new_path)
 
         return Schema__Root__Select__Response(success  = True          ,
                                               path     = new_path      ,
@@ -123,14 +140,18 @@ class Root__Selection__Service(Type_Safe):
     # Candidate Creation Helpers
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def create_issues_root_candidate(self) -> Schema__Root__Candidate:           # Create candidate for .issues/ root
+    def create_issues_root_candidate(self                                ,       # Create candidate for .issues/ root
+                                     stats : Root__Folder__Stats = None          # from scan_folder_stats (None = scan now)
+                                ) -> Schema__Root__Candidate:
         base_path  = str(self.path_handler.base_path)
         root_path  = self.path_handler.path_for_root_issue()
         root_issue = self.load_issue_from_path(root_path)
 
         effective_base = base_path if base_path and base_path != '.' else ''     # Normalize empty/dot to ''
-        has_issues     = self.has_issues_folder(effective_base)
-        child_count    = self.count_top_level_issues()
+        if stats is None:
+            stats = self.scan_folder_stats()
+        has_issues     = effective_base in stats.has_issues
+        child_count    = stats.top_level_count
 
         if root_issue:                                                           # If root issue.json exists
             return Schema__Root__Candidate(path         = ''                                          ,
@@ -149,8 +170,13 @@ class Root__Selection__Service(Type_Safe):
                                        has_issues   = has_issues             ,
                                        has_children = Safe_UInt(child_count) )
 
-    def create_candidate_from_folder(self, folder_path: str) -> Schema__Root__Candidate:  # Create candidate from folder
-        issue_data = self.load_issue_summary(folder_path)
+    def create_candidate_from_folder(self                                ,       # Create candidate from folder
+                                     folder_path : str                         ,
+                                     stats       : Root__Folder__Stats = None  ,   # precomputed has-issues / child counts
+                                     issue_data  : dict                = None      # precomputed summary
+                                ) -> Schema__Root__Candidate:
+        if issue_data is None:
+            issue_data = self.load_issue_summary(folder_path)
         if issue_data is None:
             return None
 
@@ -163,8 +189,12 @@ class Root__Selection__Service(Type_Safe):
                 relative_path = folder_path[len(prefix):]
 
         depth        = self.calculate_depth(folder_path)
-        has_issues   = self.has_issues_folder(folder_path)
-        child_count  = self.count_children_in_folder(folder_path)
+        if stats is None:                                                        # single candidate: direct checks
+            has_issues  = self.has_issues_folder(folder_path)
+            child_count = self.count_children_in_folder(folder_path)
+        else:
+            has_issues  = folder_path in stats.has_issues
+            child_count = stats.child_counts.get(folder_path, 0)
 
         return Schema__Root__Candidate(path         = relative_path                           ,
                                        label        = issue_data.get('label', '')             ,
@@ -191,6 +221,41 @@ class Root__Selection__Service(Type_Safe):
     # Folder Scanning
     # ═══════════════════════════════════════════════════════════════════════════════
 
+    def scan_folder_stats(self) -> Root__Folder__Stats:                          # Issue folders, has-issues and child counts in one pass
+        base_path     = str(self.path_handler.base_path)
+        data_prefix   = f"{base_path}/data/" if base_path and base_path != '.' else "data/"
+        issue_suffix  = f'/{FILE_NAME__ISSUE_JSON}'
+        stats         = Root__Folder__Stats()
+        issue_folders = set()
+        top_level     = set()
+        has_issues    = set()
+        child_folders = {}                                                       # owner folder -> set of descendant issue folders
+
+        for path in self.repository.storage_fs.files__paths():
+            path     = str(path)
+            parts    = path.split('/')
+            is_issue = path.endswith(issue_suffix)
+            folder   = path[:-len(issue_suffix)] if is_issue else None
+
+            for i in range(1, len(parts) - 1):                                   # every ".../issues/..." segment owns a folder
+                if parts[i] != 'issues':
+                    continue
+                owner = '/'.join(parts[:i])
+                has_issues.add(owner)
+                if is_issue:                                                     # issue.json below owner/issues/
+                    child_folders.setdefault(owner, set()).add(folder)
+
+            if is_issue and path.startswith(data_prefix):                        # Phase 2: issue.json only
+                top_level.add(folder)
+                if folder != base_path and folder != '.':
+                    issue_folders.add(folder)
+
+        stats.issue_folders   = list(issue_folders)
+        stats.has_issues      = has_issues
+        stats.child_counts    = {owner: len(folders) for owner, folders in child_folders.items()}
+        stats.top_level_count = len(top_level)
+        return stats
+
     def scan_for_issue_folders(self) -> List[str]:                               # Find all folders with issue.json
         folders     = set()
         all_paths   = self.repository.storage_fs.files__paths()
@@ -256,6 +321,17 @@ class Root__Selection__Service(Type_Safe):
         issue_path = f"{folder_path}/{FILE_NAME__ISSUE_JSON}"
         return self.load_issue_from_path(issue_path)                             # Phase 2: issue.json only
 
+    def load_issue_summaries(self, folders: List[str]) -> dict:                  # folder -> issue data, one read per folder, no exists checks
+        summaries = {}
+        storage   = self.repository.storage_fs
+        for folder_path in folders:
+            content = storage.file__str(f"{folder_path}/{FILE_NAME__ISSUE_JSON}")
+            if content:
+                data = json_loads(content)
+                if data is not None:
+                    summaries[folder_path] = data
+        return summaries
+
     def load_issue_from_path(self, file_path: str) -> dict:                      # Load issue data from specific path
         if self.repository.storage_fs.file__exists(file_path) is False:
             return None
@@ -1,8 +1,16 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Git__Status__Service - Git repository integration status
 # Detects git repository and provides integration information
+#
+# get_status() costs one `git status --porcelain=v2 --branch -z` call plus one
+# read of .git/config (and a `git ls-files` when no .issues entry is changed);
+# the result is cached until .git/HEAD, .git/index, the current branch ref or
+# the config file change (mtime_ns), so dashboard polling is a handful of
+# stat() calls. The per-field helpers below are kept for callers that need a
+# single value.
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
 import subprocess
 from osbot_utils.type_safe.Type_Safe                                                                        import Type_Safe
 from osbot_utils.type_safe.primitives.core.Safe_UInt                                                        import Safe_UInt
@@ -11,41 +19,182 @@ from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Pat
 
 from issues_fs.schemas.status.Schema__Git__Status import Schema__Git__Status
 
+GIT__ISSUES_FOLDER = '.issues'
+GIT__SHORT_COMMIT  = 7                                                           # same length as `rev-parse --short` by default
+
 
 class Git__Status__Service(Type_Safe):                                           # Git status service
-    root_path : Safe_Str__File__Path = ''                                              # Path to check for git
+    root_path    : Safe_Str__File__Path = ''                                           # Path to check for git
+    cache_key    : tuple                = None                                   # (git_dir, mtimes...) the cached status was built for
+    cache_status : Schema__Git__Status  = None                                   # Last status (returned while cache_key matches)
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Main Status Method
     # ═══════════════════════════════════════════════════════════════════════════════
 
     def get_status(self) -> Schema__Git__Status:                                 # Get git status
-        work_dir = str(self.root_path) if self.root_path else None
+        work_dir  = os.path.realpath(str(self.root_path) if self.root_path else os.getcwd())
+        git_paths = self._find_git_paths(work_dir)
+        if git_paths is None:                                                    # no .git above work_dir: no subprocess needed
+            return Schema__Git__Status(is_git_repo = False)
 
-        is_git_repo = self._is_git_repository(work_dir)
-        if not is_git_repo:
+        git_root, git_dir, common_dir = git_paths
+        cache_key = self._cache_key(work_dir, git_dir, common_dir)
+        if cache_key == self.cache_key and self.cache_status is not None:
+            return self.cache_status
+
+        output = self._run_git_command(['-c', 'status.relativePaths=false',     # paths relative to git_root
+                                        'status', '--porcelain=v2', '--branch', '--untracked-files=all', '-z'], work_dir)
+        if not output and self._is_git_repository(work_dir) is False:           # e.g. .git folder git doesn't accept
             return Schema__Git__Status(is_git_repo = False)
 
-        git_root       = self._get_git_root(work_dir)
-        current_branch = self._get_current_branch(work_dir)
-        current_commit = self._get_current_commit(work_dir)
-        is_dirty       = self._is_dirty(work_dir)
-        issues_tracked = self._is_issues_tracked(work_dir)
-        untracked      = self._count_untracked_issues(work_dir)
-        modified       = self._count_modified_issues(work_dir)
-        remote_name    = self._get_remote_name(work_dir)
-        remote_url     = self._get_remote_url(work_dir, remote_name)
-
-        return Schema__Git__Status(is_git_repo      = True                                  ,
-                                   git_root         = Safe_Str__Text(git_root)              ,
-                                   current_branch   = Safe_Str__Text(current_branch)        ,
-                                   current_commit   = Safe_Str__Text(current_commit)        ,
-                                   is_dirty         = is_dirty                              ,
-                                   issues_tracked   = issues_tracked                        ,
-                                   untracked_issues = Safe_UInt(untracked)                  ,
-                                   modified_issues  = Safe_UInt(modified)                   ,
-                                   remote_name      = Safe_Str__Text(remote_name)           ,
-                                   remote_url       = Safe_Str__Text(remote_url)            )
+        issues_prefix          = self._issues_prefix(work_dir, git_root)
+        status                 = self._parse_porcelain_v2(output, issues_prefix)
+        remote_name, remote_url = self._read_remote(common_dir)
+
+        status.git_root    = Safe_Str__Text(git_root)
+        status.remote_name = Safe_Str__Text(remote_name)
+        status.remote_url  = Safe_Str__Text(remote_url)
+        if status.issues_tracked is False:                                       # clean tracked files don't show in status
+            status.issues_tracked = self._is_issues_tracked(work_dir)
+
+        self.cache_key    = self._cache_key(work_dir, git_dir, common_dir)       # re-read: git status may refresh the index
+        self.cache_status = status
+        return status
+
+    def cache_invalidate(self) -> None:                                          # Force the next get_status() to call git
+        self.cache_key    = None
+        self.cache_status = None
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Batched Status Helpers
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def _find_git_paths(self, work_dir: str):                                    # (git_root, git_dir, common_dir) or None
+        folder = work_dir
+        while True:
+            dot_git = os.path.join(folder, '.git')
+            if os.path.isdir(dot_git):
+                return folder, dot_git, dot_git
+            if os.path.isfile(dot_git):                                          # worktree / submodule: "gitdir: <path>"
+                git_dir = self._read_gitdir_file(folder, dot_git)
+                if git_dir:
+                    return folder, git_dir, self._read_common_dir(git_dir)
+            parent = os.path.dirname(folder)
+            if parent == folder:
+                return None
+            folder = parent
+
+    def _read_gitdir_file(self, folder: str, dot_git: str) -> str:
+        try:
+            with open(dot_git, 'r') as file:
+                content = file.read().strip()
+        except OSError:
+            return ''
+        if content.startswith('gitdir:') is False:
+            return ''
+        return os.path.normpath(os.path.join(folder, content[len('gitdir:'):].strip()))
+
+    def _read_common_dir(self, git_dir: str) -> str:                             # linked worktrees share config + refs
+        try:
+            with open(os.path.join(git_dir, 'commondir'), 'r') as file:
+                return os.path.normpath(os.path.join(git_dir, file.read().strip()))
+        except OSError:
+            return git_dir
+
+    def _cache_key(self, work_dir: str, git_dir: str, common_dir: str) -> tuple:
+        head_ref = ''
+        try:
+            with open(os.path.join(git_dir, 'HEAD'), 'r') as file:
+                head = file.read().strip()
+            if head.startswith('ref:'):                                          # commits move the branch ref, not HEAD
+                head_ref = os.path.join(common_dir, head[len('ref:'):].strip())
+        except OSError:
+            pass
+        paths = [os.path.join(git_dir, 'HEAD'), os.path.join(git_dir, 'index'), os.path.join(common_dir, 'config')]
+        if head_ref:
+            paths.append(head_ref)
+        return (work_dir, git_dir) + tuple(self._mtime_ns(path) for path in paths)
+
+    def _mtime_ns(self, path: str) -> int:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+    def _issues_prefix(self, work_dir: str, git_root: str) -> str:               # .issues folder relative to git_root, with trailing '/'
+        relative = os.path.relpath(work_dir, os.path.realpath(git_root))
+        if relative == '.':
+            return f'{GIT__ISSUES_FOLDER}/'
+        return f'{relative.replace(os.sep, "/")}/{GIT__ISSUES_FOLDER}/'
+
+    def _parse_porcelain_v2(self, output: str, issues_prefix: str) -> Schema__Git__Status:    # -z output: NUL-separated, paths unquoted
+        branch    = ''
+        commit    = ''
+        is_dirty  = False
+        tracked   = False
+        untracked = 0
+        modified  = 0
+        records   = iter(output.split('\0'))
+        for line in records:
+            if line.startswith('# branch.head '):
+                branch = line[len('# branch.head '):]
+                if branch == '(detached)':                                       # rev-parse --abbrev-ref HEAD prints HEAD
+                    branch = 'HEAD'
+            elif line.startswith('# branch.oid '):
+                oid    = line[len('# branch.oid '):]
+                commit = '' if oid == '(initial)' else oid[:GIT__SHORT_COMMIT]
+            elif line.startswith('#'):
+                continue
+            elif line.startswith('? '):                                          # untracked
+                is_dirty = True
+                if line[2:].startswith(issues_prefix):
+                    untracked += 1
+            elif line[:2] in ('1 ', '2 ', 'u '):                                 # changed tracked entry: "<kind> XY ... <path>"
+                is_dirty = True
+                path     = self._entry_path(line)
+                if line[0] == '2':                                               # renames/copies: original path is the next record
+                    next(records, None)
+                if path.startswith(issues_prefix):
+                    tracked = True
+                    if line[3] != '.':                                           # Y: worktree differs from index (git diff)
+                        modified += 1
+        return Schema__Git__Status(is_git_repo      = True                      ,
+                                   current_branch   = Safe_Str__Text(branch)    ,
+                                   current_commit   = Safe_Str__Text(commit)    ,
+                                   is_dirty         = is_dirty                  ,
+                                   issues_tracked   = tracked                   ,
+                                   untracked_issues = Safe_UInt(untracked)      ,
+                                   modified_issues  = Safe_UInt(modified)       )
+
+    def _entry_path(self, line: str) -> str:                                     # path field of a porcelain v2 entry
+        fields = {'1': 8, '2': 9, 'u': 10}[line[0]]                              # fields before the path
+        return line.split(' ', fields)[-1]
+
+    def _read_remote(self, common_dir: str) -> tuple:                            # (first remote name, its url) from .git/config
+        remote_name = ''
+        remote_url  = ''
+        section     = None
+        try:
+            with open(os.path.join(common_dir, 'config'), 'r') as file:
+                lines = file.readlines()
+        except OSError:
+            return remote_name, remote_url
+        for line in lines:
+            line = line.strip()
+            if line.startswith('['):
+                section = None
+                header  = line.strip('[]').strip()
+                if header.startswith('remote ') and remote_name in ('', self._section_name(header)):
+                    section = self._section_name(header)
+                    if not remote_name:
+                        remote_name = section
+            elif section and remote_url == '' and line.split('=', 1)[0].strip().lower() == 'url':
+                remote_url = line.split('=', 1)[1].strip()
+        return remote_name, remote_url
+
+    def _section_name(self, header: str) -> str:                                 # 'remote "origin"' -> 'origin'
+        return header[len('remote '):].strip().strip('"')
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Git Command Helpers
@@ -86,7 +235,7 @@ class Git__Status__Service(Type_Safe):
         return bool(result)
 
     def _is_issues_tracked(self, work_dir: str = None) -> bool:                  # Check if .issues is tracked
-        result = self._run_git_command(['ls-files', '.issues'], work_dir)
+        result = self._run_git_command(['ls-files', '--', GIT__ISSUES_FOLDER], work_dir)
         return bool(result)
 
     def _count_untracked_issues(self, work_dir: str = None) -> int:              # Count untracked issue files
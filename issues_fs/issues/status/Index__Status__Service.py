@@ -1,6 +1,10 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Index__Status__Service - Index and node count statistics
 # Reports on global index and per-type node counts
+#
+# get_status() reads the global index once and every type index in one pass
+# (repository.type_indexes_load); count and next_index come from the same
+# objects. Loads go through the repository's registry cache when enabled.
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from typing                                                                                                 import List
@@ -27,11 +31,12 @@ class Index__Status__Service(Type_Safe):
             return Schema__Index__Status(global_index_exists = False             ,
                                          type_counts         = []                )
 
-        global_exists = self._check_global_index_exists()
+        global_index  = self.repository.global_index_load()                     # one read for exists + last_updated
+        global_exists = global_index is not None
         type_counts   = self._get_type_counts()
         total_nodes   = self._calculate_total_nodes(type_counts)
         #total_links   = self._count_total_links()
-        last_updated  = self._get_last_updated()
+        last_updated  = str(global_index.last_updated or '') if global_index else ''
 
         return Schema__Index__Status(global_index_exists = global_exists                     ,
                                      total_nodes         = Safe_UInt(total_nodes)            ,
@@ -63,15 +68,14 @@ class Index__Status__Service(Type_Safe):
 
 
     def _get_type_counts(self) -> List[Schema__Type__Count]:                     # Get per-type counts
-        counts = []
-
-
-        # Get list of node types
+        counts          = []
         node_type_names = self._get_node_type_names()
+        type_indexes    = self._load_type_indexes(node_type_names)               # one batched pass, one object per type
 
         for type_name in node_type_names:
-            type_count  = self._get_count_for_type(type_name)
-            next_index  = self._get_next_index_for_type(type_name)
+            type_index = type_indexes.get(str(type_name))
+            type_count = int(type_index.count)      if type_index is not None else 0
+            next_index = int(type_index.next_index) if type_index is not None else 1
 
             counts.append(Schema__Type__Count(node_type  = type_name     ,
                                               count      = type_count    ,
@@ -79,10 +83,19 @@ class Index__Status__Service(Type_Safe):
 
         return counts
 
+    def _load_type_indexes(self, type_names: List[str]) -> dict:                 # type name -> Schema__Type__Index
+        try:
+            return self.repository.type_indexes_load(type_names)
+        except Exception:
+            return {}
+
     def _get_node_type_names(self) -> List[str]:                                 # Get all node type names
         names = []
 
-        node_types = self.type_service.list_node_types()
+        if self.type_service is not None:
+            node_types = self.type_service.list_node_types()
+        else:
+            node_types = self.repository.node_types_load()
         if node_types:
             for node_type in node_types:
                 name = node_type.name
@@ -1,15 +1,25 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Server__Status__Service - Main server status orchestrator
 # Aggregates all status components into a comprehensive response
+#
+# get_full_status() runs the storage / git / types / index collectors in a
+# thread pool. Each result is cached for its own TTL; a collector that misses
+# its timeout leaves the last result in place (or None), flagged stale, and
+# keeps running in the background to refresh the cache. A slow git call
+# therefore delays a status request by at most its timeout.
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import sys
+import threading
+import time
+from concurrent.futures                                                                                     import Future, ThreadPoolExecutor, TimeoutError
 from datetime                                                                                               import datetime
 from osbot_utils.type_safe.Type_Safe                                                                        import Type_Safe
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                                import Safe_Str__Text
 from issues_fs.schemas.status.Schema__API__Info                            import Schema__API__Info
 from issues_fs.schemas.status.Schema__Server__Status                       import Schema__Server__Status
 from issues_fs.schemas.status.Schema__Server__Status                       import Schema__Server__Status__Response
+from issues_fs.schemas.status.Schema__Server__Status                       import Schema__Server__Status__Timing
 from issues_fs.issues.status.Git__Status__Service                  import Git__Status__Service
 from issues_fs.issues.status.Index__Status__Service                import Index__Status__Service
 from issues_fs.issues.status.Storage__Status__Service              import Storage__Status__Service
@@ -25,12 +35,27 @@ API_NAME        = 'Graph Issue Tracking API'
 BUILD_DATE      = 'NA'                              # see if we can get this from the .git folder
 ENVIRONMENT     = 'development'
 
+STATUS__COMPONENT_TTL     = {'storage': 5.0, 'git': 10.0, 'types': 30.0, 'index': 5.0}      # seconds a result is reused
+STATUS__COMPONENT_TIMEOUT = {'storage': 2.0, 'git':  2.0, 'types':  2.0, 'index': 2.0}      # seconds a request waits for a collector
+STATUS__MAX_WORKERS       = 4
+STATUS__LOCK              = threading.RLock()                                         # guards component_cache / component_pending
+
 
 class Server__Status__Service(Type_Safe):                                        # Main status service
-    storage_service : Storage__Status__Service  = None                           # Storage status
-    git_service     : Git__Status__Service      = None                           # Git status
-    types_service   : Types__Status__Service    = None                           # Types status
-    index_service   : Index__Status__Service    = None                           # Index status
+    storage_service   : Storage__Status__Service  = None                         # Storage status
+    git_service       : Git__Status__Service      = None                         # Git status
+    types_service     : Types__Status__Service    = None                         # Types status
+    index_service     : Index__Status__Service    = None                         # Index status
+    component_ttl     : dict                                                     # component -> seconds (defaults: STATUS__COMPONENT_TTL)
+    component_timeout : dict                                                     # component -> seconds (defaults: STATUS__COMPONENT_TIMEOUT)
+    component_cache   : dict                                                     # component -> (result, time.monotonic() collected)
+    component_pending : dict                                                     # component -> Future still running
+    executor          : ThreadPoolExecutor        = None                         # Created on first get_full_status()
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.component_ttl     = {**STATUS__COMPONENT_TTL    , **self.component_ttl    }
+        self.component_timeout = {**STATUS__COMPONENT_TIMEOUT, **self.component_timeout}
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Main Status Method
@@ -38,19 +63,18 @@ class Server__Status__Service(Type_Safe):
 
     def get_full_status(self) -> Schema__Server__Status__Response:               # Get comprehensive status
 
-        timestamp      = self._get_timestamp()
-        api_info       = self._get_api_info()
-        storage_status = self._get_storage_status()
-        git_status     = self._get_git_status()
-        types_status   = self._get_types_status()
-        index_status   = self._get_index_status()
+        timestamp           = self._get_timestamp()
+        api_info            = self._get_api_info()
+        components, timings = self._collect_components()
 
         status = Schema__Server__Status(timestamp      = Safe_Str__Text(timestamp)       ,
                                         api            = api_info                        ,
-                                        storage        = storage_status                  ,
-                                        types          = types_status                    ,
-                                        index          = index_status                    ,
-                                        git            = git_status                      )
+                                        storage        = components.get('storage')       ,
+                                        types          = components.get('types'  )       ,
+                                        index          = components.get('index'  )       ,
+                                        git            = components.get('git'    )       ,
+                                        timings        = timings                         ,
+                                        stale          = any(timing.stale for timing in timings))
 
         return Schema__Server__Status__Response(success = True                           ,
                                                 status  = status                         )
@@ -59,6 +83,82 @@ class Server__Status__Service(Type_Safe):
         #     return Schema__Server__Status__Response(success = False                          ,
         #                                             message = Safe_Str__Text(f'Error: {str(e)}'))
 
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Concurrent Collection
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def _collectors(self) -> dict:                                               # component -> collector, configured services only
+        collectors = {'storage': (self.storage_service, self._get_storage_status),
+                      'git'    : (self.git_service    , self._get_git_status    ),
+                      'types'  : (self.types_service  , self._get_types_status  ),
+                      'index'  : (self.index_service  , self._get_index_status  )}
+        return {name: collector for name, (service, collector) in collectors.items() if service is not None}
+
+    def _collect_components(self) -> tuple:                                      # ({component: result}, [timings])
+        now      = time.monotonic()
+        results  = {}
+        timings  = {}
+        running  = {}
+        with STATUS__LOCK:
+            for name, collector in self._collectors().items():
+                cached = self.component_cache.get(name)
+                if cached is not None and now - cached[1] < self.component_ttl.get(name, 0):
+                    results[name] = cached[0]
+                    timings[name] = Schema__Server__Status__Timing(component=name, cached=True)
+                    continue
+                future = self.component_pending.get(name)
+                if future is None:                                               # don't start a second run of a slow collector
+                    future = self._executor().submit(self._run_collector, collector)
+                    self.component_pending[name] = future                       # before the callback: it may run right here
+                    future.add_done_callback(lambda done, name=name: self._collector_done(name, done))
+                running[name] = future
+
+        for name, future in running.items():                                     # all run concurrently: wait on each deadline
+            deadline = now + self.component_timeout.get(name, 0)
+            try:
+                result, duration_ms = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                results[name] = result
+                timings[name] = Schema__Server__Status__Timing(component=name, duration_ms=duration_ms)
+            except TimeoutError:
+                cached        = self.component_cache.get(name)
+                results[name] = cached[0] if cached is not None else None
+                timings[name] = Schema__Server__Status__Timing(component   = name                              ,
+                                                               duration_ms = (time.monotonic() - now) * 1000   ,
+                                                               timed_out   = True                              ,
+                                                               stale       = True                              )
+            except Exception:                                                    # collector failed: keep the last good result
+                cached        = self.component_cache.get(name)
+                results[name] = cached[0] if cached is not None else None
+                timings[name] = Schema__Server__Status__Timing(component=name, stale=True)
+
+        order = [name for name in ('storage', 'git', 'types', 'index') if name in timings]
+        return results, [timings[name] for name in order]
+
+    def _run_collector(self, collector) -> tuple:                                # (result, duration_ms)
+        start  = time.perf_counter()
+        result = collector()
+        return result, (time.perf_counter() - start) * 1000
+
+    def _collector_done(self, name: str, future: Future) -> None:                # cache the result, even after the request gave up
+        with STATUS__LOCK:
+            self.component_pending.pop(name, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            result, _ = future.result()
+            self.component_cache[name] = (result, time.monotonic())
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=STATUS__MAX_WORKERS, thread_name_prefix='server-status')
+        return self.executor
+
+    def cache_invalidate(self, component: str = None) -> None:                  # Drop cached results (None = all)
+        with STATUS__LOCK:
+            if component is None:
+                self.component_cache = {}
+            else:
+                self.component_cache.pop(component, None)
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # Individual Status Getters
     # ═══════════════════════════════════════════════════════════════════════════════
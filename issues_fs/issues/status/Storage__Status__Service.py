@@ -1,33 +1,55 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Storage__Status__Service - Storage backend introspection
 # Inspects Memory-FS configuration and provides detailed status
+#
+# With a repository, counts come from its path index: live file / byte totals
+# kept in sync by file_save / file_delete while a watcher reports external
+# edits (node_cache_enabled), otherwise one fresh listing per get_status(). The
+# write probe is cached for writable_ttl seconds and re-run early only when
+# the repository has seen a failed write since the last probe.
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import time
 from osbot_utils.type_safe.Type_Safe                                                                        import Type_Safe
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                                import Safe_Str__Text
 from memory_fs.storage_fs.Storage_FS                                                                        import Storage_FS
 from issues_fs.schemas.status.Schema__Storage__Status                      import Schema__Storage__Status
+from issues_fs.issues.graph_services.Graph__Repository             import Graph__Repository
+
+WRITABLE__TTL = 300.0                                                            # seconds between write probes
 
 
 class Storage__Status__Service(Type_Safe):                                       # Storage status service
-    storage_fs : Storage_FS = None                                                 # Storage_FS instance
+    storage_fs          : Storage_FS        = None                                 # Storage_FS instance
+    repository          : Graph__Repository = None                               # Optional: live counters + write failures
+    writable_ttl        : float             = WRITABLE__TTL                      # Probe result lifetime
+    writable_cache      : bool              = None                               # Last probe result (None = never probed)
+    writable_checked_at : float             = 0.0                                # time.monotonic() of the last probe
+    writable_failures   : int               = 0                                  # repository.write_failures at the last probe
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # Main Status Method
     # ═══════════════════════════════════════════════════════════════════════════════
 
     def get_status(self) -> Schema__Storage__Status:                             # Get storage status
+        if self.storage_fs is None and self.repository is not None:
+            self.storage_fs = self.repository.storage_fs
         if self.storage_fs is None:
             return Schema__Storage__Status(backend_type  = Safe_Str__Text('not_configured'),
                                            is_connected  = False                            )
 
         backend_type  = type(self.storage_fs).__name__
-
-        return Schema__Storage__Status(backend_type   = backend_type            ,
-                                       root_path      = self._get_root_path   (),
-                                       is_connected   = self._check_connection(),
-                                       is_writable    = self._check_writable  (),
-                                       file_count     = self._count_files     ())
+        index         = self._path_index()                                       # one listing shared by the counters below
+        files_by_prefix, bytes_by_prefix = self._counts_by_prefix(index)
+
+        return Schema__Storage__Status(backend_type    = backend_type            ,
+                                       root_path       = self._get_root_path   (),
+                                       is_connected    = self._check_connection(),
+                                       is_writable     = self._is_writable     (),
+                                       file_count      = self._count_files     (index),
+                                       total_bytes     = self._count_bytes     (index),
+                                       files_by_prefix = files_by_prefix          ,
+                                       bytes_by_prefix = bytes_by_prefix          )
 
     def _get_root_path(self) -> str:                                 # Get configured root path
 
@@ -47,6 +69,17 @@ class Storage__Status__Service(Type_Safe):
         self.storage_fs.file__exists('__connectivity_test__')
         return True
 
+    def _is_writable(self) -> bool:                                  # Cached write probe
+        now      = time.monotonic()
+        failures = self.repository.write_failures if self.repository is not None else 0
+        if (self.writable_cache is None                             or
+            now - self.writable_checked_at >= self.writable_ttl     or
+            failures != self.writable_failures                      ):           # a write failed since the last probe
+            self.writable_cache      = self._check_writable()
+            self.writable_checked_at = now
+            self.writable_failures   = failures
+        return self.writable_cache
+
     def _check_writable(self) -> bool:                               # Test write connectivity
         with self.storage_fs as _:
             test_path = '__write_test_temp__'
@@ -61,9 +94,39 @@ class Storage__Status__Service(Type_Safe):
     # Statistics Methods
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def _count_files(self) -> int:                                   # Count stored files
+    def _path_index(self):                                           # repository path index with sizes (None without a repository)
+        if self.repository is not None:
+            return self.repository.path_index_get(sizes=True)
+        return None
+
+    def _count_files(self, index=None) -> int:                       # Count stored files
+        if index is None:
+            index = self._path_index()
+        if index is not None:
+            return index.count_files()
         return len(self.storage_fs.files__paths())
 
+    def _count_bytes(self, index=None) -> int:                       # Bytes of sized files (repository only)
+        if index is None:
+            index = self._path_index()
+        if index is not None:
+            return index.count_bytes()
+        return 0
+
+    def _counts_by_prefix(self, index=None) -> tuple:                # ({prefix: files}, {prefix: bytes}) per top-level folder
+        if index is None:
+            index = self._path_index()
+        if index is not None:
+            counts = index.counts_by_child()
+            return ({name: files      for name, (files, _    ) in counts.items()},
+                    {name: byte_count for name, (_, byte_count) in counts.items()})
+        files_by_prefix = {}
+        for path in self.storage_fs.files__paths():
+            prefix, separator, _ = str(path).partition('/')
+            if separator:
+                files_by_prefix[prefix] = files_by_prefix.get(prefix, 0) + 1
+        return files_by_prefix, {}
+
     def _count_folders(self) -> int:                                        # Count folders
         for method_name in ['folders__all', 'folders', 'list_folders']:     # todo: find a better way to do this
             if hasattr(self.storage_fs, method_name):
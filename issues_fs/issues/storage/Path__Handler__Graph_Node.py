@@ -7,6 +7,13 @@
 #   data/{node_type}/{Label}/node.json     <- LEGACY: Read-only fallback
 #   data/{node_type}/{Label}/attachments/{filename}
 #   data/{node_type}/_index.json
+#   {parent}/issues/_index.json            <- Next child index per type (child label counters)
+#   {parent}/issues/{Label}.lock           <- Label reserved by a writer until its issue.json exists
+#   indexes/activity/{YYYY-MM-DD}/{seq}.json <- Segment of activity events for one UTC day
+#   indexes/activity/_partitions.json      <- Days that have activity + segments per day
+#   indexes/retype/{old}--{new}.json       <- Plan of an in-flight type rename (labels + label map, written once)
+#   indexes/retype/{old}--{new}.progress.json <- Its progress (position / next index / files moved, per batch)
+#   indexes/issues_files/{md5}.json.zlib   <- Compiled parse of one .issues file (md5 of its path)
 #   config/node-types.json
 #   config/link-types.json
 #   _index.json
@@ -14,6 +21,7 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from osbot_utils.type_safe.Type_Safe                                                         import Type_Safe
+from osbot_utils.utils.Misc                                                                  import str_md5
 from osbot_utils.type_safe.type_safe_core.decorators.type_safe                               import type_safe
 from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path            import Safe_Str__File__Path
 from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Name            import Safe_Str__File__Name
@@ -124,9 +132,41 @@ class Path__Handler__Graph_Node(Type_Safe):
                        ) -> str:
         return f"data/{node_type}/_index.json"
 
+    def path_for_children_index(self, issues_folder: str) -> str:                # Path to child counters of an issues/ folder
+        return f"{issues_folder}/_index.json"
+
+    def path_for_child_label_lock(self, issues_folder: str, label: str) -> str:  # Marker reserving a child label across processes
+        return f"{issues_folder}/{label}.lock"
+
     def path_for_global_index(self) -> str:                                      # Path to global index
         return "_index.json"
 
+    def path_for_activity_segment(self, day: str, seq: int) -> str:              # Path to one segment of a day's activity events
+        return f"indexes/activity/{day}/{seq:05d}.json"
+
+    def path_for_activity_partitions(self) -> str:                               # Path to list of activity days
+        return "indexes/activity/_partitions.json"
+
+    @type_safe
+    def path_for_retype_checkpoint(self                              ,           # Path to retype checkpoint
+                                   old_type : Safe_Str__Node_Type    ,
+                                   new_type : Safe_Str__Node_Type
+                              ) -> str:
+        return f"indexes/retype/{old_type}--{new_type}.json"
+
+    @type_safe
+    def path_for_retype_progress(self                              ,             # Path to retype progress (small, rewritten per batch)
+                                 old_type : Safe_Str__Node_Type    ,
+                                 new_type : Safe_Str__Node_Type
+                            ) -> str:
+        return f"indexes/retype/{old_type}--{new_type}.progress.json"
+
+    def path_for_issues_file_compiled(self, source_path: str) -> str:            # Path to compiled sidecar of a .issues file
+        return f"{self.path_for_issues_files_index()}/{str_md5(source_path)}.json.zlib"
+
+    def path_for_issues_files_index(self) -> str:                                # Folder holding .issues sidecars
+        return "indexes/issues_files"
+
     @type_safe
     def path_for_type_folder(self                              ,                 # Path to type folder
                              node_type : Safe_Str__Node_Type
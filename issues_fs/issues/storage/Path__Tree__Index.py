@@ -0,0 +1,168 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Path__Tree__Index - In-memory directory trie over storage file paths
+# One node per folder segment, holding the file names (and sizes) directly
+# inside it plus file and byte totals for everything below it. Folder checks
+# are O(depth) and child listing is O(children), instead of a files__paths()
+# scan per question; storage statistics are read from the totals.
+#
+# Built from one files__paths() pass; Graph__Repository keeps it in sync with
+# writes made through file_save() / file_delete().
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                     import Callable, Dict, Iterable, List
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+
+
+class Path__Tree__Node:                                                         # plain __slots__ object: one per folder
+    __slots__ = ('children', 'files', 'file_count', 'byte_count')
+
+    def __init__(self):
+        self.children   = {}                                                    # segment -> Path__Tree__Node
+        self.files      = {}                                                    # file name -> size (None = unknown) directly in this folder
+        self.file_count = 0                                                     # files in this folder and below
+        self.byte_count = 0                                                     # bytes of the sized files in this folder and below
+
+
+class Path__Tree__Index(Type_Safe):
+    root          : Path__Tree__Node = None
+    unsized_count : int                                                         # files added without a known size
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.root is None:
+            self.root = Path__Tree__Node()
+
+    def build(self, paths   : Iterable[str]      ,                               # index every path (e.g. storage_fs.files__paths())
+                    size_of : Callable = None                                    # path -> size or None, when sizes are cheap to get
+             ) -> 'Path__Tree__Index':
+        for path in paths:
+            self.add_file(path, size_of(path) if size_of else None)
+        return self
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Updates
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def add_file(self, path: str, size: int = None) -> bool:                    # False if already indexed (size is updated)
+        segments = self.segments(path)
+        if not segments:
+            return False
+        node  = self.root
+        nodes = [node]
+        for segment in segments[:-1]:
+            child = node.children.get(segment)
+            if child is None:
+                child                  = Path__Tree__Node()
+                node.children[segment] = child
+            node = child
+            nodes.append(node)
+        name = segments[-1]
+        if name in node.files:
+            previous = node.files[name]
+            if size is not None or previous is None:                            # a known size replaces the old one
+                node.files[name] = size
+                self.adjust_bytes(nodes, (size or 0) - (previous or 0))
+                self.unsized_count += (size is None) - (previous is None)
+            return False
+        node.files[name] = size
+        for parent in nodes:
+            parent.file_count += 1
+        self.adjust_bytes(nodes, size or 0)
+        if size is None:
+            self.unsized_count += 1
+        return True
+
+    def remove_file(self, path: str) -> bool:                                   # False if not indexed; prunes empty folders
+        segments = self.segments(path)
+        if not segments:
+            return False
+        nodes = [self.root]
+        for segment in segments[:-1]:
+            child = nodes[-1].children.get(segment)
+            if child is None:
+                return False
+            nodes.append(child)
+        if segments[-1] not in nodes[-1].files:
+            return False
+        size = nodes[-1].files.pop(segments[-1])
+        for parent in nodes:
+            parent.file_count -= 1
+        self.adjust_bytes(nodes, -(size or 0))
+        if size is None:
+            self.unsized_count -= 1
+        for depth in range(len(nodes) - 1, 0, -1):                              # drop folders with nothing left below them
+            if nodes[depth].file_count > 0:
+                break
+            del nodes[depth - 1].children[segments[depth - 1]]
+        return True
+
+    def adjust_bytes(self, nodes: List[Path__Tree__Node], delta: int) -> None:
+        if delta:
+            for parent in nodes:
+                parent.byte_count += delta
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Lookups
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def node(self, folder: str) -> Path__Tree__Node:                            # None if no file lives under folder
+        node = self.root
+        for segment in self.segments(folder):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def folder_exists(self, folder: str) -> bool:                               # same meaning as "some path starts with folder/"
+        node = self.node(folder)
+        return node is not None and node.file_count > 0
+
+    def file_exists(self, path: str) -> bool:
+        folder, _, name = str(path).rpartition('/')
+        node            = self.node(folder)
+        return node is not None and name in node.files
+
+    def child_names(self, folder: str) -> List[str]:                            # immediate sub-folder names
+        node = self.node(folder)
+        return list(node.children) if node is not None else []
+
+    def child_folders_with(self, folder: str, file_name: str) -> List[str]:     # sub-folders holding file_name (e.g. issue.json)
+        node = self.node(folder)
+        if node is None:
+            return []
+        return [name for name, child in node.children.items() if file_name in child.files]
+
+    def files_under(self, folder: str) -> List[str]:                            # paths relative to folder, O(subtree)
+        node = self.node(folder)
+        if node is None:
+            return []
+        files = []
+        stack = [('', node)]
+        while stack:
+            prefix, current = stack.pop()
+            files.extend(f'{prefix}{name}' for name in sorted(current.files))
+            for name, child in current.children.items():
+                stack.append((f'{prefix}{name}/', child))
+        return files
+
+    def file_size(self, path: str) -> int:                                      # None if not indexed or size unknown
+        folder, _, name = str(path).rpartition('/')
+        node            = self.node(folder)
+        return node.files.get(name) if node is not None else None
+
+    def count_files(self, folder: str = '') -> int:
+        node = self.node(folder)
+        return node.file_count if node is not None else 0
+
+    def count_bytes(self, folder: str = '') -> int:                             # sized files only (see unsized_count)
+        node = self.node(folder)
+        return node.byte_count if node is not None else 0
+
+    def counts_by_child(self, folder: str = '') -> Dict[str, tuple]:            # sub-folder -> (files, bytes)
+        node = self.node(folder)
+        if node is None:
+            return {}
+        return {name: (child.file_count, child.byte_count) for name, child in node.children.items()}
+
+    def segments(self, path: str) -> List[str]:
+        return [segment for segment in str(path).split('/') if segment]
@@ -0,0 +1,17 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Enum__Activity__Event__Type - Kinds of change recorded in the activity index
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from enum                                                                       import Enum
+
+
+class Enum__Activity__Event__Type(str, Enum):                                    # Activity event types
+    NODE_CREATED    = "node-created"
+    NODE_UPDATED    = "node-updated"
+    NODE_DELETED    = "node-deleted"
+    STATUS_CHANGED  = "status-changed"
+    LINK_CREATED    = "link-created"
+    LINK_DELETED    = "link-deleted"
+    COMMENT_CREATED = "comment-created"
+    COMMENT_UPDATED = "comment-updated"
+    COMMENT_DELETED = "comment-deleted"
@@ -0,0 +1,21 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Activity__Event - One entry in the repository-wide activity feed
+# Stored (as raw dicts) in time-partitioned files under indexes/activity/
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                import Safe_Str__Text
+from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path           import Safe_Str__File__Path
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now            import Timestamp_Now
+from issues_fs.schemas.enums.Enum__Activity__Event__Type                                    import Enum__Activity__Event__Type
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                                          import Safe_Str__Node_Type, Safe_Str__Node_Label
+
+
+class Schema__Activity__Event(Type_Safe):                                        # Activity feed entry
+    timestamp  : Timestamp_Now                                                   # When the change happened
+    event_type : Enum__Activity__Event__Type                                     # What kind of change
+    node_type  : Safe_Str__Node_Type                                             # Type of the changed node
+    label      : Safe_Str__Node_Label                                            # Label of the changed node
+    path       : Safe_Str__File__Path                                            # Folder of the changed node (for subtree filters)
+    author     : Safe_Str__Text                                                  # Who made the change ('' when unknown)
+    detail     : Safe_Str__Text                                                  # Short description, e.g. "todo -> done"
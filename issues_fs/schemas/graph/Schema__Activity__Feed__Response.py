@@ -0,0 +1,16 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Activity__Feed__Response - Response body for a page of the activity feed
+# Events are newest first; next_cursor resumes further back in time
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                                  import List
+from osbot_utils.type_safe.Type_Safe                                                         import Type_Safe
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                 import Safe_Str__Text
+from issues_fs.schemas.graph.Schema__Activity__Event                                         import Schema__Activity__Event
+
+
+class Schema__Activity__Feed__Response(Type_Safe):                               # Activity feed page
+    success     : bool                          = False                          # Operation success
+    events      : List[Schema__Activity__Event]                                  # Events, newest first
+    next_cursor : str                           = ''                             # Cursor for the next (older) page, '' = end
+    message     : Safe_Str__Text                = ''                             # Error message if failed
@@ -0,0 +1,13 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Children__Index - Per issues/ folder counters for child labels
+# Stored at {parent}/issues/_index.json - next free index per child type
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                                  import Dict
+from osbot_utils.type_safe.Type_Safe                                                         import Type_Safe
+from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now             import Timestamp_Now
+
+
+class Schema__Children__Index(Type_Safe):                                        # Child counter file ({parent}/issues/_index.json)
+    next_index    : Dict[str, int]                                               # child type -> next available index
+    last_updated  : Timestamp_Now        = None                                  # Timestamp of last allocation
@@ -0,0 +1,16 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Node__Root__View - Materialized node set under the current root
+# Built once per root by Node__Service, patched by its own writes and dropped
+# when Graph__Repository.issue_paths_version moves on for any other reason
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from typing                                                                                             import List
+from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
+from issues_fs.schemas.graph.Schema__Node__Info                                                         import Schema__Node__Info
+
+
+class Schema__Node__Root__View(Type_Safe):                                        # Root-scoped node set
+    root_path : str                                                               # Root the view was built for
+    version   : int                                                               # repository.issue_paths_version it matches
+    nodes     : List[Schema__Node__Info]                                          # Same order as nodes_list_all()
+    by_type   : dict                                                              # node_type -> [Schema__Node__Info]
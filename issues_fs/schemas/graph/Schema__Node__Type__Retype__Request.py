@@ -0,0 +1,16 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Node__Type__Retype__Request - Request to rename or merge a node type
+# Moves every node of old_type to new_type (relabelling and fixing links)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                                    import Safe_UInt
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type
+
+
+class Schema__Node__Type__Retype__Request(Type_Safe):                            # Retype (rename/merge) request
+    old_type   : Safe_Str__Node_Type                                             # Type being renamed or merged away
+    new_type   : Safe_Str__Node_Type                                             # Target type (created if missing)
+    dry_run    : bool                 = False                                    # Report what would change, write nothing
+    batch_size : Safe_UInt            = Safe_UInt(100)                           # Nodes per write batch / checkpoint
+    resume     : bool                 = True                                     # Continue from a previous checkpoint
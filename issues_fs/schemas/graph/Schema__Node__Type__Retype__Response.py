@@ -0,0 +1,24 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# Schema__Node__Type__Retype__Response - Progress / result of a retype operation
+# Also passed to the on_progress callback after every batch
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
+from osbot_utils.type_safe.primitives.core.Safe_UInt                                                    import Safe_UInt
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                            import Safe_Str__Text
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type
+
+
+class Schema__Node__Type__Retype__Response(Type_Safe):                           # Retype result
+    success         : bool                = False                                # Whether the operation succeeded
+    completed       : bool                = False                                # All nodes processed (checkpoint removed)
+    dry_run         : bool                = False                                # Nothing was written
+    old_type        : Safe_Str__Node_Type                                        # Source type
+    new_type        : Safe_Str__Node_Type                                        # Target type
+    total           : Safe_UInt                                                  # Nodes of old_type found
+    processed       : Safe_UInt                                                  # Nodes moved (including resumed ones)
+    relabelled      : Safe_UInt                                                  # Nodes whose index changed (merge collisions)
+    files_moved     : Safe_UInt                                                  # Files moved to the new type folder
+    links_updated   : Safe_UInt                                                  # Link target_labels rewritten
+    batches_written : Safe_UInt                                                  # Batches flushed to storage
+    message         : Safe_Str__Text                                             # Status / error message
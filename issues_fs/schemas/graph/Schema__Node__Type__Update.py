@@ -6,11 +6,12 @@
 from typing                                                                                             import List
 from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                            import Safe_Str__Text
-from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type_Display, Safe_Str__Status
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type, Safe_Str__Node_Type_Display, Safe_Str__Status
 from issues_fs.schemas.safe_str.Safe_Str__Hex_Color                                                     import Safe_Str__Hex_Color
 
 
 class Schema__Node__Type__Update(Type_Safe):                                     # Node type update payload
+    name           : Safe_Str__Node_Type         = None                          # New name: renames (or merges into) a type
     display_name   : Safe_Str__Node_Type_Display = None                          # Updated display name
     description    : Safe_Str__Text              = None                          # Updated description
     icon           : Safe_Str__Text              = None                          # Updated icon
@@ -5,9 +5,11 @@
 
 from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                            import Safe_Str__Text
+from issues_fs.schemas.graph.Schema__Node__Type__Retype__Response                                       import Schema__Node__Type__Retype__Response
 
 
 class Schema__Node__Type__Update__Response(Type_Safe):                           # Response for node type update
     success   : bool             = False                                         # Whether update succeeded
     node_type : object           = None                                          # Updated node type (Schema__Node__Type)
     message   : Safe_Str__Text                                                   # Status message
+    retype    : Schema__Node__Type__Retype__Response = None                      # Set when the update renamed the type
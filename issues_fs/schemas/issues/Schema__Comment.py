@@ -48,10 +48,11 @@ class Schema__Comment__Response(Type_Safe):
 
 
 class Schema__Comment__List__Response(Type_Safe):                                # List comments response
-    success    : bool                   = False
-    comments   : List[Schema__Comment]  = None
-    total      : int                    = 0
-    message    : str                    = ''
+    success     : bool                   = False
+    comments    : List[Schema__Comment]  = None
+    total       : int                    = 0                                     # Total comments on the node (not page size)
+    next_cursor : str                    = ''                                    # Comment id to resume after ('' = no more pages)
+    message     : str                    = ''
 
 
 class Schema__Comment__Delete__Response(Type_Safe):                              # Delete comment response
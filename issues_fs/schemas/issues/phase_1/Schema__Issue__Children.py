@@ -69,6 +69,32 @@ class Schema__Issue__Convert__Response(Type_Safe):
     message     : Safe_Str__Text                                                    # Status message
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Subtree Response
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Schema__Issue__Subtree__Response(Type_Safe):                               # Nested issue hierarchy under one root
+    success : bool                  = False
+    tree    : dict                                                               # {path, <fields>, children: [...]} per node
+    total   : Safe_UInt             = Safe_UInt(0)                               # Issues in the tree (root included)
+    message : Safe_Str__Text        = ''                                         # Error message if failed
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Move Subtree Response
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class Schema__Issue__Move__Response(Type_Safe):                                  # Response after moving an issue + descendants
+    success       : bool
+    path          : Safe_Str__File__Path                                         # New relative path
+    previous_path : Safe_Str__File__Path                                         # Old relative path
+    label         : Safe_Str__Text                                               # Label at the new location (relabelled on collision)
+    files_moved   : Safe_UInt            = Safe_UInt(0)                          # Files in the moved subtree
+    links_updated : Safe_UInt            = Safe_UInt(0)                          # Link ends repointed at the new label (relabel only)
+    renamed       : bool                                                         # True if a native folder rename was used
+    message       : Safe_Str__Text                                               # Error / status message
+
+
 class Schema__Add_Child__Request(Type_Safe):                                     # Request body for adding child
     parent_path : Safe_Str__File__Path                                           # Path to parent issue
     issue_type  : Safe_Str__Text                                                 # Child issue type
@@ -83,3 +109,14 @@ class Schema__List_Children__Request(Type_Safe):
 
 class Schema__Convert__Request(Type_Safe):                                       # Request for converting issue
     issue_path : Safe_Str__File__Path                                            # Path to issue to convert
+
+
+class Schema__Move_Subtree__Request(Type_Safe):                                  # Request for moving an issue subtree
+    source_path     : Safe_Str__File__Path                                       # Issue to move (with its descendants)
+    new_parent_path : Safe_Str__File__Path                                       # New parent ('' = top level)
+
+
+class Schema__Load_Subtree__Request(Type_Safe):                                  # Request for loading a nested subtree
+    root_path : Safe_Str__File__Path                                             # Issue at the top ('' = whole repository)
+    max_depth : int                  = -1                                        # levels below root (-1 = unlimited)
+    fields    : List[str]                                                        # issue.json fields to include (empty = summary fields)
@@ -1,8 +1,11 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 # Schema__Server__Status - Comprehensive server status information
 # Aggregates all status components into a single response
+# timings: one entry per collected component (duration, cache hit, timeout)
+# stale  : True when any component timed out and an older (or no) result is shown
 # ═══════════════════════════════════════════════════════════════════════════════
 
+from typing                                                                                 import List
 from osbot_utils.type_safe.Type_Safe                                                        import Type_Safe
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text                import Safe_Str__Text
 from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now            import Timestamp_Now
@@ -13,6 +16,14 @@ from issues_fs.schemas.status.Schema__Storage__Status      import Schema__Storag
 from issues_fs.schemas.status.Schema__Types__Status        import Schema__Types__Status
 
 
+class Schema__Server__Status__Timing(Type_Safe):                                 # How one component was collected
+    component   : Safe_Str__Text          = ''                                   # storage, git, types, index
+    duration_ms : float                   = 0.0                                  # Collector run time (0 when served from cache)
+    cached      : bool                    = False                                # Served from the component cache
+    timed_out   : bool                    = False                                # Collector missed its timeout
+    stale       : bool                    = False                                # Result is older than its TTL, or missing
+
+
 class Schema__Server__Status(Type_Safe):                                         # Full server status
     timestamp         : Timestamp_Now                                            # Status check timestamp
     api               : Schema__API__Info       = None                           # API version info
@@ -20,6 +31,8 @@ class Schema__Server__Status(Type_Safe):
     types             : Schema__Types__Status   = None                           # Type configuration
     index             : Schema__Index__Status   = None                           # Index statistics
     git               : Schema__Git__Status     = None                           # Git integration status
+    timings           : List[Schema__Server__Status__Timing]                     # Per-component collection info
+    stale             : bool                    = False                          # Some component timed out
 
 
 class Schema__Server__Status__Response(Type_Safe):                               # API response wrapper
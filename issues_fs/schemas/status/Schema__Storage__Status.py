@@ -2,7 +2,7 @@
 # Schema__Storage__Status - Memory-FS storage backend information
 # ═══════════════════════════════════════════════════════════════════════════════
 
-from typing                                                                      import List
+from typing                                                                      import Dict, List
 from osbot_utils.type_safe.Type_Safe                                             import Type_Safe
 from osbot_utils.type_safe.primitives.core.Safe_UInt                             import Safe_UInt
 from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text     import Safe_Str__Text
@@ -16,8 +16,11 @@ class Schema__Storage__Capability(Type_Safe):
 
 
 class Schema__Storage__Status(Type_Safe):                        # Memory-FS status info
-    backend_type  : Safe_Str__Text                               # memory, local_disk, sqlite, zip
-    root_path     : Safe_Str__File__Path = None                  # Root path (if applicable)
-    is_connected  : bool                                         # Storage accessible
-    is_writable   : bool                                         # Can write to storage
-    file_count    : Safe_UInt                                    # Number of files
+    backend_type    : Safe_Str__Text                             # memory, local_disk, sqlite, zip
+    root_path       : Safe_Str__File__Path = None                # Root path (if applicable)
+    is_connected    : bool                                       # Storage accessible
+    is_writable     : bool                                       # Can write to storage
+    file_count      : Safe_UInt                                  # Number of files
+    total_bytes     : Safe_UInt                                  # Bytes of files with a known size
+    files_by_prefix : Dict[str, int]                             # top-level folder -> files
+    bytes_by_prefix : Dict[str, int]                             # top-level folder -> bytes
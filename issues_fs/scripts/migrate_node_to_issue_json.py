@@ -15,6 +15,7 @@ from osbot_utils.type_safe.type_safe_core.decorators.type_safe
 
 class Migration__Node_To_Issue_Json(Type_Safe):                                  # Migration runner
     storage_fs : object                                                          # Storage filesystem
+    repository : object = None                                                   # Graph__Repository sharing storage_fs: writes go through it
 
     @type_safe
     def run(self) -> dict:                                                       # Execute migration
@@ -30,19 +31,29 @@ class Migration__Node_To_Issue_Json(Type_Safe):
             try:
                 if self.storage_fs.file__exists(issue_path) is True:
                     # issue.json already exists, just delete node.json
-                    self.storage_fs.file__delete(path)
+                    self.file_delete(path)
                     results['deleted'] += 1
                 else:
                     # Copy node.json → issue.json, then delete node.json
                     content = self.storage_fs.file__bytes(path)
-                    self.storage_fs.file__save(issue_path, content)
-                    self.storage_fs.file__delete(path)
+                    self.file_save(issue_path, content)
+                    self.file_delete(path)
                     results['converted'] += 1
             except Exception as e:
                 results['errors'].append(f'{path}: {str(e)}')
 
         return results
 
+    def file_save(self, path: str, data: bytes) -> bool:                         # keeps the repository's path index in sync
+        if self.repository is not None:
+            return self.repository.file_save(path, data)
+        return self.storage_fs.file__save(path, data)
+
+    def file_delete(self, path: str) -> bool:
+        if self.repository is not None:
+            return self.repository.file_delete(path)
+        return self.storage_fs.file__delete(path)
+
     @type_safe
     def dry_run(self) -> dict:                                                   # Preview migration
         all_paths = self.storage_fs.files__paths()
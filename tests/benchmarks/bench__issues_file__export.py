@@ -0,0 +1,53 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# bench__issues_file__export - Cost of exporting a JSON issue tree to .issues
+# Not collected by pytest. Run with:  python tests/benchmarks/bench__issues_file__export.py [issues]
+#
+# Builds a tree in Storage_FS__Memory (default 50k issues: parents with two
+# children each), then measures:
+#   export   - Issues_File__Export__Service.export_to_stream into a StringIO
+#   reparse  - Parser__Issues_File.parse_records on the exported text
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import io
+import json
+import sys
+import time
+from memory_fs.storage_fs.providers.Storage_FS__Memory                          import Storage_FS__Memory
+from issues_fs.issues.issues_file.Issues_File__Export__Service                  import Issues_File__Export__Service
+from issues_fs.issues.issues_file.Parser__Issues_File                           import Parser__Issues_File
+
+
+def issue_json(label: str, status: str, title: str, links=()) -> bytes:
+    return json.dumps(dict(label=label, status=status, title=title,
+                           links=[dict(verb='relates-to', target_label=target) for target in links])).encode()
+
+def generate_tree(issue_count: int) -> Storage_FS__Memory:                      # Task-N with Bug-N.1 / Bug-N.2 style children
+    storage = Storage_FS__Memory()
+    for i in range(1, issue_count // 3 + 1):
+        parent = f'data/task/Task-{i}'
+        storage.file__save(f'{parent}/issue.json', issue_json(f'Task-{i}', 'todo', f'Parent {i}', links=[f'Task-{i % 100 + 1}']))
+        for j in (1, 2):
+            label = f'Bug-{i * 2 + j}'
+            storage.file__save(f'{parent}/issues/{label}/issue.json', issue_json(label, 'confirmed', f'Child {j} of {i}'))
+    return storage
+
+def measure(name: str, issue_count: int, action):
+    start    = time.perf_counter()
+    result   = action()
+    duration = time.perf_counter() - start
+    print(f'{name:8} {issue_count:>8} issues  {duration:8.3f}s  {duration / issue_count * 1_000_000:8.2f} us/issue')
+    return result
+
+def main(issue_count: int = 50_000):
+    storage  = generate_tree(issue_count)
+    exporter = Issues_File__Export__Service()
+    parser   = Parser__Issues_File()
+    stream   = io.StringIO()
+
+    lines    = measure('export' , issue_count, lambda: exporter.export_to_stream(storage, stream))
+    records, errors = measure('reparse', lines, lambda: parser.parse_records(stream.getvalue()))
+    assert errors == [] and len(records) == lines                              # exported text round-trips through the parser
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
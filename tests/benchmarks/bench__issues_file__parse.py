@@ -0,0 +1,45 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# bench__issues_file__parse - Per-line cost of the .issues parse pipeline
+# Not collected by pytest. Run with:  python tests/benchmarks/bench__issues_file__parse.py [lines]
+#
+# Compares, on a generated file (default 100k lines):
+#   records  - Parser__Issues_File.parse_records     (Issues_File__Record, __slots__)
+#   lines    - Parser__Issues_File.parse             (Schema__Issues_File__Line, Type_Safe)
+#   nodes    - Issues_File__Loader__Service.load_content (records + Schema__Node), on a sample
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import sys
+import time
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.issues.issues_file.Parser__Issues_File                           import Parser__Issues_File
+
+NODES__SAMPLE_LINES = 10_000                                                    # Schema__Node creation is much slower; sample it
+
+
+def generate_content(line_count: int) -> str:                                   # parents with one indented child each
+    lines = []
+    for i in range(1, line_count // 2 + 1):
+        lines.append(f'Task-{i % 99999 + 1} | todo | Parent task {i} -> Bug-{i % 99999 + 1}')
+        lines.append(f'\tBug-{i % 99999 + 1} | confirmed | Child bug {i}')
+    return '\n'.join(lines)
+
+def measure(name: str, line_count: int, action) -> float:
+    start    = time.perf_counter()
+    action()
+    duration = time.perf_counter() - start
+    print(f'{name:8} {line_count:>8} lines  {duration:8.3f}s  {duration / line_count * 1_000_000:8.2f} us/line')
+    return duration
+
+def main(line_count: int = 100_000):
+    parser  = Parser__Issues_File()
+    loader  = Issues_File__Loader__Service(parallel_workers=1)
+    content = generate_content(line_count)
+    sample  = generate_content(min(line_count, NODES__SAMPLE_LINES))
+
+    measure('records', line_count                        , lambda: parser.parse_records(content)       )
+    measure('lines'  , line_count                        , lambda: parser.parse(content)               )
+    measure('nodes'  , min(line_count, NODES__SAMPLE_LINES), lambda: loader.load_content(sample, 'b.issues'))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
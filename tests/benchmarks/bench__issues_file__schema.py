@@ -0,0 +1,46 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# bench__issues_file__schema - Throughput of .issues schema validation
+# Not collected by pytest. Run with:  python tests/benchmarks/bench__issues_file__schema.py [issues]
+#
+# On a generated file (default 100k issues, ~10% with an invalid status):
+#   stream   - Issues_File__Schema__Service.check_content   (parser records, no nodes)
+#   nodes    - Issues_File__Schema__Service.check_nodes     (nodes already loaded; load time excluded), on a sample
+#   multiple - Issues_File__Schema__Service.check_multiple  (same issues split over 100 files)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import sys
+import time
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.issues.issues_file.Issues_File__Schema__Service                  import Issues_File__Schema__Service
+
+NODES__SAMPLE_ISSUES = 10_000                                                   # loading Schema__Node is the slow part; sample it
+FILES__COUNT         = 100
+
+
+def generate_lines(issue_count: int) -> list:
+    statuses = ['todo', 'in-progress', 'done', 'review', 'backlog', 'todo', 'done', 'todo', 'review', 'confirmed']
+    return [f'Task-{i % 99999 + 1} | {statuses[i % len(statuses)]} | Task number {i}' for i in range(issue_count)]
+
+def measure(name: str, issue_count: int, action):
+    start    = time.perf_counter()
+    summary  = action()
+    duration = time.perf_counter() - start
+    print(f'{name:8} {issue_count:>8} issues  {duration:8.3f}s  {issue_count / duration:12,.0f} issues/s  ({summary.total_errors} errors)')
+    return summary
+
+def main(issue_count: int = 100_000):
+    checker  = Issues_File__Schema__Service()
+    lines    = generate_lines(issue_count)
+    content  = '\n'.join(lines)
+    per_file = max(1, issue_count // FILES__COUNT)
+    files    = [('\n'.join(lines[i:i + per_file]), f'file-{i}.issues') for i in range(0, issue_count, per_file)]
+    sample   = min(issue_count, NODES__SAMPLE_ISSUES)
+    nodes    = Issues_File__Loader__Service().load_content('\n'.join(lines[:sample]), 'sample.issues').nodes
+
+    measure('stream'  , issue_count, lambda: checker.check_content(content, 'all.issues'))
+    measure('nodes'   , len(nodes)  , lambda: checker.check_nodes(nodes, 'sample.issues') )
+    measure('multiple', issue_count, lambda: checker.check_multiple(files)               )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
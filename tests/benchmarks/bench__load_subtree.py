@@ -0,0 +1,62 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# bench__load_subtree - Cost of loading a nested issue hierarchy in one call
+# Not collected by pytest. Run with:  python tests/benchmarks/bench__load_subtree.py [fan_out]
+#
+# Builds a 5-level tree in memory (one root, fan_out children per node; the
+# default of 10 gives 11,111 issues), then measures:
+#   subtree  - Issue__Children__Service.load_subtree with the summary fields
+#   walk     - the previous approach: list_children recursively, level by level
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import sys
+import time
+from memory_fs.helpers.Memory_FS__In_Memory                                     import Memory_FS__In_Memory
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
+from issues_fs.issues.phase_1.Issue__Children__Service                          import Issue__Children__Service
+from issues_fs.issues.storage.Path__Handler__Graph_Node                         import Path__Handler__Graph_Node
+
+LEVELS = 5
+
+
+def generate_tree(service: Issue__Children__Service, fan_out: int) -> int:      # returns the issue count
+    storage = service.repository.storage_fs
+    level   = ['.issues/data/feature/Feature-1']
+    count   = 0
+    for depth in range(LEVELS):
+        next_level = []
+        for folder in level:
+            label = folder.rsplit('/', 1)[-1]
+            storage.file__save(f'{folder}/issue.json', json.dumps(dict(label=label, title=f'Issue {label}', node_type='task',
+                                                                         status='todo', description='x' * 200)).encode())
+            count += 1
+            if depth < LEVELS - 1:
+                next_level.extend(f'{folder}/issues/Task-{i}' for i in range(1, fan_out + 1))
+        level = next_level
+    return count
+
+def walk(service: Issue__Children__Service, path: str) -> int:
+    children = service.list_children(path).children
+    return 1 + sum(walk(service, child['path']) for child in children)
+
+def measure(name: str, issue_count: int, action):
+    start    = time.perf_counter()
+    result   = action()
+    duration = time.perf_counter() - start
+    print(f'{name:8} {issue_count:>8} issues  {duration:8.3f}s  {duration / issue_count * 1_000_000:8.2f} us/issue')
+    return result
+
+def main(fan_out: int = 10):
+    path_handler = Path__Handler__Graph_Node()
+    repository   = Graph__Repository(memory_fs=Memory_FS__In_Memory(), path_handler=path_handler)
+    service      = Issue__Children__Service(repository=repository, path_handler=path_handler)
+    issue_count  = generate_tree(service, fan_out)
+
+    response = measure('subtree', issue_count, lambda: service.load_subtree('data/feature/Feature-1'))
+    assert response.total == issue_count
+    if issue_count <= 2_000:                                                    # the per-level walk is far too slow for 10k
+        assert measure('walk', issue_count, lambda: walk(service, 'data/feature/Feature-1')) == issue_count
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,190 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# test_Activity__Service - Tests for the time-partitioned activity feed
+# Covers recording, backwards paging, filters and write-path integration
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from concurrent.futures                                                         import ThreadPoolExecutor
+from unittest                                                                   import TestCase
+from unittest.mock                                                              import patch
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from issues_fs.issues.graph_services                                            import Activity__Service as activity_module
+from issues_fs.issues.graph_services.Activity__Service                          import Activity__Service
+from issues_fs.issues.graph_services.Comments__Service                          import Comments__Service
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Link__Service                               import Link__Service
+from issues_fs.issues.graph_services.Node__Service                               import Node__Service
+from issues_fs.issues.graph_services.Type__Service                               import Type__Service
+from issues_fs.schemas.enums.Enum__Activity__Event__Type                        import Enum__Activity__Event__Type
+from issues_fs.schemas.graph.Schema__Link__Create__Request                      import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                      import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                      import Schema__Node__Update__Request
+from issues_fs.schemas.issues.Schema__Comment                                   import Schema__Comment__Create__Request
+
+DAY_1 = 1767225600000                                                           # 2026-01-01T00:00:00Z
+DAY_2 = DAY_1 + 86_400_000                                                      # 2026-01-02T00:00:00Z
+
+
+class test_Activity__Service(TestCase):
+
+    def setUp(self):
+        self.repository       = Graph__Repository__Factory.create_memory()
+        self.activity_service = Activity__Service(repository=self.repository)
+
+    def record(self, label, timestamp, event_type=Enum__Activity__Event__Type.NODE_UPDATED, author=''):
+        return self.activity_service.record_event(event_type = event_type ,
+                                                  node_type  = 'task'     ,
+                                                  label      = label      ,
+                                                  author     = author     ,
+                                                  timestamp  = timestamp  )
+
+    def labels(self, response):
+        return [str(e.label) for e in response.events]
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Recording
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__init__(self):
+        with self.activity_service as _:
+            assert type(_)         is Activity__Service
+            assert base_classes(_) == [Type_Safe, object]
+
+    def test_record_event__partitions_by_day(self):
+        self.record('Task-1', DAY_1)
+        self.record('Task-2', DAY_1 + 1000)
+        self.record('Task-3', DAY_2)
+
+        assert self.repository.activity_partitions_load()                  == ['2026-01-01', '2026-01-02']
+        assert len(self.repository.activity_partition_load('2026-01-01'))  == 2
+        assert len(self.repository.activity_partition_load('2026-01-02'))  == 1
+        assert self.repository.storage_fs.file__exists('indexes/activity/2026-01-02/00000.json') is True
+
+    def test_record_event__bounded_segments(self):                               # a write touches one segment, not the whole day
+        with patch.object(activity_module, 'ACTIVITY__SEGMENT_SIZE', 2):
+            for i in range(1, 6):
+                self.record(f'Task-{i}', DAY_1 + i)
+
+            assert self.repository.activity_manifest_load()['segments'] == {'2026-01-01': 3}
+            assert [len(self.repository.activity_segment_load('2026-01-01', seq)) for seq in range(3)] == [2, 2, 1]
+            assert [e['label'] for e in self.repository.activity_partition_load('2026-01-01')] == ['Task-1', 'Task-2', 'Task-3', 'Task-4', 'Task-5']
+
+            page_1 = self.activity_service.get_feed(limit=3)
+            page_2 = self.activity_service.get_feed(limit=3, cursor=page_1.next_cursor)
+            assert self.labels(page_1)  == ['Task-5', 'Task-4', 'Task-3']
+            assert page_1.next_cursor   == '2026-01-01:2'
+            assert self.labels(page_2)  == ['Task-2', 'Task-1']
+            assert page_2.next_cursor   == ''
+
+    def test_record_event__concurrent_writers_keep_every_event(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: self.record(f'Task-{i}', DAY_1 + i), range(1, 41)))
+
+        assert len(self.repository.activity_partition_load('2026-01-01')) == 40
+
+    def test_record_event__stores_node_path(self):
+        event = self.record('Task-1', DAY_1)
+        assert str(event.path)       == 'data/task/Task-1'
+        assert event.event_type      == Enum__Activity__Event__Type.NODE_UPDATED
+
+    def test_record_event__stores_nested_node_path(self):                        # hierarchical .../issues/{Label} nodes
+        self.repository.storage_fs.file__save('data/task/Task-1/issue.json'                , b'{}')
+        self.repository.storage_fs.file__save('data/task/Task-1/issues/Task-2/issue.json'  , b'{}')
+        event = self.record('Task-2', DAY_1)
+
+        assert str(event.path)                                                          == 'data/task/Task-1/issues/Task-2'
+        assert self.labels(self.activity_service.get_feed(subtree='data/task/Task-1')) == ['Task-2']
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Feed Paging
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_get_feed__empty(self):
+        response = self.activity_service.get_feed()
+        assert response.success     is True
+        assert response.events      == []
+        assert response.next_cursor == ''
+
+    def test_get_feed__pages_backwards_across_partitions(self):
+        for i in range(1, 4):
+            self.record(f'Task-{i}', DAY_1 + i)
+        for i in range(4, 6):
+            self.record(f'Task-{i}', DAY_2 + i)
+
+        page_1 = self.activity_service.get_feed(limit=2)
+        assert self.labels(page_1)  == ['Task-5', 'Task-4']
+        assert page_1.next_cursor   == '2026-01-02:0'
+
+        page_2 = self.activity_service.get_feed(limit=2, cursor=page_1.next_cursor)
+        assert self.labels(page_2)  == ['Task-3', 'Task-2']
+
+        page_3 = self.activity_service.get_feed(limit=2, cursor=page_2.next_cursor)
+        assert self.labels(page_3)  == ['Task-1']
+        assert page_3.next_cursor   == ''
+
+    def test_get_feed__invalid_cursor(self):
+        response = self.activity_service.get_feed(cursor='not-a-cursor')
+        assert response.success is False
+
+    def test_get_feed__filters(self):
+        self.record('Task-1', DAY_1    , author='human'                                       )
+        self.record('Task-2', DAY_1 + 1, author='claude-code'                                 )
+        self.record('Task-3', DAY_2    , Enum__Activity__Event__Type.STATUS_CHANGED, 'human'  )
+
+        assert self.labels(self.activity_service.get_feed(author='human'))                      == ['Task-3', 'Task-1']
+        assert self.labels(self.activity_service.get_feed(event_type='status-changed'))         == ['Task-3']
+        assert self.labels(self.activity_service.get_feed(subtree='data/task/Task-2'))          == ['Task-2']
+        assert self.labels(self.activity_service.get_feed(subtree='data/task'))                 == ['Task-3', 'Task-2', 'Task-1']
+        assert self.labels(self.activity_service.get_feed(subtree='data/task/Task-'))           == []
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Write Path Integration
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test_write_paths__record_events(self):
+        type_service     = Type__Service    (repository=self.repository)
+        node_service     = Node__Service    (repository=self.repository, activity_service=self.activity_service)
+        link_service     = Link__Service    (repository=self.repository, activity_service=self.activity_service)
+        comments_service = Comments__Service(repository=self.repository, activity_service=self.activity_service)
+        type_service.initialize_default_types()
+
+        bug  = node_service.create_node(Schema__Node__Create__Request(node_type='bug' , title='A bug' )).node
+        task = node_service.create_node(Schema__Node__Create__Request(node_type='task', title='A task'), author='editor').node
+        node_service.update_node(node_type=task.node_type, label=task.label,
+                                 request=Schema__Node__Update__Request(status='done'), author='editor')
+        link_service.create_link(source_type=bug.node_type, source_label=bug.label,
+                                 request=Schema__Link__Create__Request(verb='blocks', target_label=task.label))
+        comments_service.create_comment(node_type=task.node_type, label=task.label,
+                                        request=Schema__Comment__Create__Request(author='human', text='hello'))
+
+        feed = self.activity_service.get_feed()
+        assert [e.event_type.value for e in feed.events] == ['comment-created', 'link-created', 'status-changed',
+                                                             'node-created'   , 'node-created']
+        assert str(feed.events[0].author) == 'human'
+        assert str(feed.events[1].detail) == 'blocks Task-1'
+        assert str(feed.events[2].detail) == 'backlog to done'
+        assert self.labels(self.activity_service.get_feed(author='editor')) == ['Task-1', 'Task-1']
+
+    def test_delete_node__records_nested_folder(self):                          # NODE_DELETED carries the real .../issues/{Label} path
+        type_service = Type__Service(repository=self.repository)
+        node_service = Node__Service(repository=self.repository, activity_service=self.activity_service)
+        type_service.initialize_default_types()
+        self.repository.storage_fs.file__save('data/task/Task-1/issue.json'               , b'{"node_type": "task", "label": "Task-1"}')
+        self.repository.storage_fs.file__save('data/task/Task-1/issues/Task-2/issue.json' , b'{"node_type": "task", "label": "Task-2"}')
+
+        response = node_service.delete_node(node_type='task', label='Task-2')
+        event    = self.activity_service.get_feed().events[0]
+
+        assert response.deleted                                                              is True
+        assert self.repository.storage_fs.file__exists('data/task/Task-1/issues/Task-2/issue.json') is False
+        assert event.event_type                                                              == Enum__Activity__Event__Type.NODE_DELETED
+        assert str(event.path)                                                               == 'data/task/Task-1/issues/Task-2'
+        assert node_service.delete_node(node_type='bug', label='Task-1').deleted             is False   # label of another type
+
+    def test_write_paths__no_activity_service(self):
+        type_service = Type__Service(repository=self.repository)
+        node_service = Node__Service(repository=self.repository)
+        type_service.initialize_default_types()
+        node_service.create_node(Schema__Node__Create__Request(node_type='task', title='Quiet'))
+
+        assert self.repository.activity_partitions_load() == []
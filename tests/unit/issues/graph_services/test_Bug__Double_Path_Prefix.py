@@ -157,7 +157,18 @@ class test__bug__Double_Path_Prefix(TestCase):
                                    path_handler        =__(base_path='.issues')         ,
                                    issues_file_loader  = None                           ,
                                    issues_file_nodes   = None                           ,
-                                   issues_file_loaded  = False                          )
+                                   issues_file_loaded  = False                          ,
+                                   issues_file_cache   = __()                           ,
+                                   issues_file_by_label = None                          ,
+                                   issues_file_by_type  = None                          ,
+                                   issues_file_compiled = False                         ,
+                                   issues_file_stats    = __()                          ,
+                                   node_cache_enabled   = False                         ,
+                                   node_path_cache      = __()                          ,
+                                   node_type_cache      = __()                          ,
+                                   registry_cache       = __()                          ,
+                                   issue_paths_version  = 0                             ,
+                                   write_failures       = 0                             )
 
             assert type(_.memory_fs ) is Memory_FS
             assert type(_.storage_fs) is Storage_FS__Local_Disk                                 # confirm storage type
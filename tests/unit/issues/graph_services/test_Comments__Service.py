@@ -212,4 +212,91 @@ class test_Comments__Service(TestCase):
         )
 
         assert response.success is False
-        assert response.deleted is False
\ No newline at end of file
+        assert response.deleted is False
+
+class test_Comments__Service__Paging(TestCase):
+    """Test paged list_comments and the id -> offset index."""
+
+    def setUp(self):
+        self.repository       = Graph__Repository__Factory.create_memory()
+        self.type_service     = Type__Service    (repository=self.repository)
+        self.node_service     = Node__Service    (repository=self.repository)
+        self.comments_service = Comments__Service(repository=self.repository)
+        self.type_service.initialize_default_types()
+
+        create_response = self.node_service.create_node(Schema__Node__Create__Request(title     = 'Paged comments',
+                                                                                      node_type = 'task'          ))
+        self.node_type   = create_response.node.node_type
+        self.label       = create_response.node.label
+        self.comment_ids = []
+        for i in range(5):
+            request  = Schema__Comment__Create__Request(author = 'human', text = f'comment {i}')
+            response = self.comments_service.create_comment(node_type = self.node_type ,
+                                                            label     = self.label     ,
+                                                            request   = request        )
+            self.comment_ids.append(str(response.comment.id))
+
+    def texts(self, response):
+        return [str(c.text) for c in response.comments]
+
+    def test_list_comments__no_limit_returns_all(self):
+        response = self.comments_service.list_comments(node_type=self.node_type, label=self.label)
+        assert response.success     is True
+        assert response.total       == 5
+        assert response.next_cursor == ''
+        assert self.texts(response) == ['comment 0', 'comment 1', 'comment 2', 'comment 3', 'comment 4']
+
+    def test_list_comments__limit_and_cursor(self):
+        page_1 = self.comments_service.list_comments(node_type=self.node_type, label=self.label, limit=2)
+        assert self.texts(page_1)  == ['comment 0', 'comment 1']
+        assert page_1.total        == 5
+        assert page_1.next_cursor  == self.comment_ids[1]
+
+        page_2 = self.comments_service.list_comments(node_type=self.node_type, label=self.label, limit=2, cursor=page_1.next_cursor)
+        assert self.texts(page_2)  == ['comment 2', 'comment 3']
+
+        page_3 = self.comments_service.list_comments(node_type=self.node_type, label=self.label, limit=2, cursor=page_2.next_cursor)
+        assert self.texts(page_3)  == ['comment 4']
+        assert page_3.next_cursor  == ''
+
+    def test_list_comments__newest_first(self):
+        page_1 = self.comments_service.list_comments(node_type=self.node_type, label=self.label, limit=3, newest_first=True)
+        assert self.texts(page_1)  == ['comment 4', 'comment 3', 'comment 2']
+        assert page_1.next_cursor  == self.comment_ids[2]
+
+        page_2 = self.comments_service.list_comments(node_type=self.node_type, label=self.label, limit=3,
+                                                     cursor=page_1.next_cursor, newest_first=True)
+        assert self.texts(page_2)  == ['comment 1', 'comment 0']
+        assert page_2.next_cursor  == ''
+
+    def test_list_comments__unknown_cursor(self):
+        response = self.comments_service.list_comments(node_type=self.node_type, label=self.label, cursor='abcdef12')
+        assert response.success is False
+        assert 'not found' in response.message.lower()
+
+    def test_comment_offsets__index_used_and_kept_in_sync(self):
+        key = (str(self.node_type), str(self.label))
+        self.comments_service.get_comment(node_type=self.node_type, label=self.label, comment_id=self.comment_ids[3])
+        assert self.comments_service.comment_offsets[key] == {cid: i for i, cid in enumerate(self.comment_ids)}
+
+        self.comments_service.delete_comment(node_type=self.node_type, label=self.label, comment_id=self.comment_ids[1])
+        assert key not in self.comments_service.comment_offsets                   # shifted offsets are dropped
+
+        response = self.comments_service.get_comment(node_type=self.node_type, label=self.label, comment_id=self.comment_ids[4])
+        assert str(response.comment.text)                              == 'comment 4'
+        assert self.comments_service.comment_offsets[key][self.comment_ids[4]] == 3
+
+    def test_comment_offsets__stale_index_is_rebuilt(self):
+        self.comments_service.get_comment(node_type=self.node_type, label=self.label, comment_id=self.comment_ids[0])
+
+        node = self.repository.node_load(node_type=self.node_type, label=self.label)    # edit outside the service
+        node.properties['comments'].reverse()
+        self.repository.node_save(node)
+
+        response = self.comments_service.update_comment(node_type  = self.node_type                                 ,
+                                                        label      = self.label                                     ,
+                                                        comment_id = self.comment_ids[0]                            ,
+                                                        request    = Schema__Comment__Update__Request(text='edited'))
+        assert response.success is True
+        node = self.repository.node_load(node_type=self.node_type, label=self.label)
+        assert node.properties['comments'][4]['text'] == 'edited'
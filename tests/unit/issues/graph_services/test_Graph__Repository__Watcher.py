@@ -0,0 +1,138 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# test_Graph__Repository__Watcher - Tests for local disk change detection
+# Uses a temporary folder via Graph__Repository__Factory.create_local_disk
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest                                                                   import TestCase, skipUnless
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Graph__Repository__Watcher                 import Graph__Repository__Watcher, WATCH__MODE_POLLING, WATCH__MODE_INOTIFY, WATCH__MODE_NONE
+
+
+class test_Graph__Repository__Watcher(TestCase):
+
+    def setUp(self):
+        self.root       = tempfile.mkdtemp()
+        self.repository = Graph__Repository__Factory.create_local_disk(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def write(self, path, content):
+        full_path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w') as file:
+            file.write(content)
+
+    def write_issue(self, folder, label, node_type):
+        self.write(f'{folder}/issue.json', json.dumps(dict(label=label, node_type=node_type)))
+
+    def test__init__(self):
+        with Graph__Repository__Watcher(repository=self.repository) as _:
+            assert type(_)         is Graph__Repository__Watcher
+            assert base_classes(_) == [Type_Safe, object]
+            assert _.debounce_ms   == 200
+
+    def test_open__memory_backend_is_not_watched(self):
+        watcher = Graph__Repository__Watcher(repository=Graph__Repository__Factory.create_memory())
+        assert watcher.open()                          == WATCH__MODE_NONE
+        assert watcher.poll()                          == []
+        assert watcher.repository.node_cache_enabled   is False
+
+    def test_polling__targeted_invalidation(self):
+        self.write_issue('data/task/Task-1', 'Task-1', 'task')
+        self.write_issue('data/bug/Bug-1'  , 'Bug-1' , 'bug' )
+        self.write('plan.issues', 'Task-9 | todo | From file')
+
+        watcher = Graph__Repository__Watcher(repository=self.repository, use_inotify=False, debounce_ms=0)
+        assert watcher.open()                                      == WATCH__MODE_POLLING
+        assert sorted(watcher.snapshot)                            == ['data/bug/Bug-1/issue.json', 'data/task/Task-1/issue.json', 'plan.issues']
+
+        self.repository.nodes_list_all()                                         # fill caches
+        assert self.repository.node_find_path_by_label('Task-1')   == 'data/task/Task-1'
+        assert self.repository.node_type_cache                     == {'data/bug/Bug-1/issue.json'  : 'bug' ,
+                                                                       'data/task/Task-1/issue.json': 'task'}
+        assert self.repository.issues_files_find_node_by_label('Task-9') is not None
+
+        time.sleep(0.01)                                                         # make sure mtime_ns moves
+        self.write_issue('data/task/Task-1', 'Task-1', 'feature')                # edited outside the server
+        self.write('plan.issues', 'Task-10 | todo | Renamed')
+
+        assert watcher.poll()                                      == ['data/task/Task-1/issue.json', 'plan.issues']
+        assert self.repository.node_type_cache                     == {'data/bug/Bug-1/issue.json': 'bug'}     # untouched entry kept
+        assert 'Task-1' not in self.repository.node_path_cache
+        assert self.repository.issues_files_find_node_by_label('Task-9')  is None
+        assert self.repository.issues_files_find_node_by_label('Task-10') is not None
+        assert {str(n.label): str(n.node_type) for n in self.repository.nodes_list_all(include_issues_files=False)} == {'Bug-1': 'bug', 'Task-1': 'feature'}
+        assert watcher.poll()                                      == []                                         # nothing new
+
+    def test_polling__registry_files(self):                                     # external edits to type / index JSON drop the registry cache
+        self.write('config/node-types.json', json.dumps({'types': [{'name': 'task'}]}))
+        watcher = Graph__Repository__Watcher(repository=self.repository, use_inotify=False, debounce_ms=0)
+        watcher.open()
+        assert [str(t.name) for t in self.repository.node_types_load()] == ['task']
+
+        time.sleep(0.01)
+        self.write('config/node-types.json', json.dumps({'types': [{'name': 'task'}, {'name': 'bug'}]}))
+        assert [str(t.name) for t in self.repository.node_types_load()] == ['task']         # cached until the watcher reports it
+        assert watcher.poll()                                           == ['config/node-types.json']
+        assert [str(t.name) for t in self.repository.node_types_load()] == ['task', 'bug']
+
+    def test_polling__other_files_refresh_path_index_only(self):                # comments / attachments change the storage counts
+        self.write_issue('data/task/Task-1', 'Task-1', 'task')
+        watcher = Graph__Repository__Watcher(repository=self.repository, use_inotify=False, debounce_ms=0)
+        watcher.open()
+        self.repository.nodes_list_all()                                         # fill caches
+        assert self.repository.path_index_get().count_files() == 1
+
+        self.write('data/task/Task-1/comments/c-1.json', '{"text": "hi"}')
+        assert watcher.poll()                                     == ['data/task/Task-1/comments/c-1.json']
+        assert self.repository.path_index_get().count_files()     == 2
+        assert self.repository.node_type_cache                    == {'data/task/Task-1/issue.json': 'task'}    # node caches untouched
+
+    def test_polling__debounce(self):
+        self.write('plan.issues', 'Task-1 | todo | A')
+        watcher = Graph__Repository__Watcher(repository=self.repository, use_inotify=False, debounce_ms=60_000)
+        watcher.open()
+        self.write('later.issues', 'Task-2 | todo | B')
+
+        assert watcher.poll()          == []                                     # still inside the debounce window
+        assert list(watcher.pending)   == ['later.issues']
+        assert watcher.flush()         == ['later.issues']
+        assert watcher.pending         == {}
+
+    def test_node_cache_invalidate__folder(self):
+        self.repository.node_path_cache = {'Task-1': 'data/task/Task-1', 'Bug-1': 'data/task/Task-1/issues/Bug-1', 'Bug-2': 'data/bug/Bug-2'}
+        self.repository.node_type_cache = {'data/task/Task-1/issue.json': 'task', 'data/task/Task-1/issues/Bug-1/issue.json': 'bug'}
+
+        assert self.repository.node_cache_invalidate('data/task/Task-1/') == 4
+        assert self.repository.node_path_cache                           == {'Bug-2': 'data/bug/Bug-2'}
+        assert self.repository.node_type_cache                           == {}
+
+    @skipUnless(sys.platform.startswith('linux'), 'inotify is Linux only')
+    def test_inotify__start_stop(self):
+        self.write_issue('data/task/Task-1', 'Task-1', 'task')
+        watcher = Graph__Repository__Watcher(repository=self.repository, debounce_ms=20, poll_interval_ms=20)
+        assert watcher.start() == WATCH__MODE_INOTIFY
+        try:
+            self.repository.nodes_list_all()
+            assert 'data/task/Task-1/issue.json' in self.repository.node_type_cache
+
+            self.write_issue('data/task/Task-2', 'Task-2', 'task')               # new folder: watched recursively
+            self.write_issue('data/task/Task-1', 'Task-1', 'bug')
+            deadline = time.monotonic() + 5
+            while 'data/task/Task-1/issue.json' in self.repository.node_type_cache and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert 'data/task/Task-1/issue.json' not in self.repository.node_type_cache
+        finally:
+            watcher.stop()
+        assert watcher.thread                          is None
+        assert self.repository.node_cache_enabled      is False
+        assert watcher.stats['events']                 >= 2
@@ -0,0 +1,190 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# test_Type__Retype__Service - Unit tests for streaming type rename / merge
+# Covers relabelling, link fixes, attachment moves, dry runs and resume
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from unittest                                                                                            import TestCase
+from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                       import Safe_Str__Node_Type, Safe_Str__Node_Label, Safe_Str__Link_Verb
+from issues_fs.schemas.graph.Schema__Link__Create__Request                                               import Schema__Link__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Create__Request                                               import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Type__Retype__Request                                         import Schema__Node__Type__Retype__Request
+from issues_fs.schemas.graph.Schema__Node__Type__Update                                                  import Schema__Node__Type__Update
+from issues_fs.issues.graph_services.Graph__Repository__Factory                                          import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Link__Service                                                       import Link__Service
+from issues_fs.issues.graph_services.Node__Service                                                       import Node__Service
+from issues_fs.issues.graph_services.Type__Retype__Service                                               import Type__Retype__Service
+from issues_fs.issues.graph_services.Type__Service                                                       import Type__Service
+
+
+class test_Type__Retype__Service(TestCase):
+
+    @classmethod
+    def setUpClass(cls):                                                         # Shared setup - create once
+        cls.repository     = Graph__Repository__Factory.create_memory()
+        cls.type_service   = Type__Service        (repository=cls.repository)
+        cls.node_service   = Node__Service        (repository=cls.repository)
+        cls.link_service   = Link__Service        (repository=cls.repository)
+        cls.retype_service = Type__Retype__Service(repository=cls.repository)
+
+    def setUp(self):                                                             # Fresh types + sample graph
+        self.repository.clear_storage()
+        self.type_service.initialize_default_types()
+        self.create_node('bug' , 'First bug' )
+        self.create_node('bug' , 'Second bug')
+        self.create_node('task', 'First task')
+        self.link_service.create_link(source_type  = Safe_Str__Node_Type('bug')   ,
+                                      source_label = Safe_Str__Node_Label('Bug-1'),
+                                      request      = Schema__Link__Create__Request(verb         = Safe_Str__Link_Verb('blocks'),
+                                                                                   target_label = Safe_Str__Node_Label('Task-1')))
+
+    def create_node(self, node_type, title):
+        return self.node_service.create_node(Schema__Node__Create__Request(node_type=node_type, title=title))
+
+    def retype(self, old_type, new_type, **kwargs):
+        request = Schema__Node__Type__Retype__Request(old_type=old_type, new_type=new_type, **kwargs)
+        return self.retype_service.retype(request)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Rename
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__retype__rename(self):                                              # New type name, labels keep their index
+        response = self.retype('bug', 'defect')
+
+        assert response.success       is True
+        assert response.completed     is True
+        assert int(response.total)      == 2
+        assert int(response.processed)  == 2
+        assert int(response.relabelled) == 0
+
+        defect = self.repository.node_load(Safe_Str__Node_Type('defect'), Safe_Str__Node_Label('Defect-1'))
+        assert defect                   is not None
+        assert str(defect.node_type)    == 'defect'
+        assert str(defect.title)        == 'First bug'
+        assert self.repository.node_exists(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1')) is False
+
+        type_names = [str(t.name) for t in self.type_service.list_node_types()]
+        assert 'defect'    in type_names
+        assert 'bug'   not in type_names
+
+        blocks = self.type_service.get_link_type(Safe_Str__Link_Verb('blocks'))
+        assert 'defect' in [str(t) for t in blocks.source_types]
+        assert 'bug'    not in [str(t) for t in blocks.source_types]
+
+        assert int(self.repository.type_index_load(Safe_Str__Node_Type('defect')).count) == 2
+        assert self.repository.retype_checkpoint_load('bug', 'defect')                   is None
+
+    def test__retype__fixes_inbound_links(self):                                 # Other end of each link points at the new label
+        response = self.retype('bug', 'defect')
+        task     = self.repository.node_load(Safe_Str__Node_Type('task'), Safe_Str__Node_Label('Task-1'))
+
+        assert [str(l.target_label) for l in task.links] == ['Defect-1']
+        assert int(response.links_updated)               == 1
+
+    def test__retype__merge_relabels_collisions(self):                           # Merge into existing type with clashing indices
+        response = self.retype('bug', 'task')
+        task_1   = self.repository.node_load(Safe_Str__Node_Type('task'), Safe_Str__Node_Label('Task-1'))
+        moved    = [self.repository.node_load(Safe_Str__Node_Type('task'), Safe_Str__Node_Label(label))
+                    for label in ('Task-2', 'Task-3')]
+
+        assert response.success          is True
+        assert int(response.relabelled) == 1                                    # Bug-1 clashes with Task-1, Bug-2 keeps 2
+        assert str(task_1.title)         == 'First task'
+        assert sorted(str(n.title) for n in moved) == ['First bug', 'Second bug']
+        assert [str(l.target_label) for l in task_1.links] == ['Task-3']
+        assert 'bug' not in [str(t.name) for t in self.type_service.list_node_types()]
+        assert int(self.repository.type_index_load(Safe_Str__Node_Type('task')).count) == 3
+
+    def test__retype__moves_extra_files(self):                                   # Attachments follow their node
+        self.repository.storage_fs.file__save('data/bug/Bug-1/notes.txt', b'hello')
+
+        response = self.retype('bug', 'defect')
+
+        assert self.repository.storage_fs.file__bytes ('data/defect/Defect-1/notes.txt') == b'hello'
+        assert self.repository.storage_fs.file__exists('data/bug/Bug-1/notes.txt')       is False
+        assert int(response.files_moved) == 3                                    # 2 x issue.json + notes.txt
+
+    def test__retype__dry_run(self):                                             # Nothing written
+        response = self.retype('bug', 'defect', dry_run=True)
+
+        assert response.success         is True
+        assert response.completed       is False
+        assert int(response.processed)  == 2
+        assert self.repository.node_exists(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1')) is True
+        assert self.type_service.get_node_type(Safe_Str__Node_Type('defect'))                           is None
+
+    def test__retype__batches_and_progress(self):                                # One callback per batch
+        seen     = []
+        request  = Schema__Node__Type__Retype__Request(old_type='bug', new_type='defect', batch_size=1)
+        response = self.retype_service.retype(request, on_progress=lambda r: seen.append(int(r.processed)))
+
+        assert seen                           == [1, 2]
+        assert int(response.batches_written)  == 2
+
+    def test__retype__resume_from_checkpoint(self):                              # Interrupted run continues where it stopped
+        class Interrupt(Exception): pass
+        def stop(progress):
+            raise Interrupt()
+
+        request = Schema__Node__Type__Retype__Request(old_type='bug', new_type='defect', batch_size=1)
+        with self.assertRaises(Interrupt):
+            self.retype_service.retype(request, on_progress=stop)
+
+        checkpoint = self.repository.retype_checkpoint_load('bug', 'defect')
+        assert checkpoint['position'] == 1
+
+        response = self.retype_service.retype(request)
+        assert response.completed      is True
+        assert int(response.processed) == 2
+        assert self.repository.node_exists(Safe_Str__Node_Type('defect'), Safe_Str__Node_Label('Defect-2')) is True
+        assert self.repository.retype_checkpoint_load('bug', 'defect')                                      is None
+
+    def test__retype__plan_saved_once(self):                                     # per batch only the small progress record is rewritten
+        from unittest.mock import patch
+        repository = self.repository
+        with patch.object(repository, 'retype_checkpoint_save', wraps=repository.retype_checkpoint_save) as plan_save, \
+             patch.object(repository, 'retype_progress_save'  , wraps=repository.retype_progress_save  ) as progress_save:
+            self.retype('bug', 'defect', batch_size=1)
+        assert plan_save.call_count     == 1
+        assert progress_save.call_count == 2
+        assert sorted(progress_save.call_args.args[2]) == ['files_moved', 'next_index', 'position']
+
+    def test__retype__fixes_links_on_nested_targets(self):                       # inverse link lives in a child issue folder
+        flat   = 'data/task/Task-1/issue.json'
+        nested = 'data/feature/Feature-1/issues/Task-1/issue.json'
+        self.repository.file_save(nested, self.repository.storage_fs.file__bytes(flat))
+        self.repository.file_delete(flat)
+
+        response = self.retype('bug', 'defect')
+        task     = self.repository.node_load_by_path('data/feature/Feature-1/issues/Task-1')
+
+        assert response.success                                  is True
+        assert [str(link.target_label) for link in task.links]  == ['Defect-1']
+        assert self.repository.storage_fs.file__exists(flat)     is False        # not written back to the flat path
+
+    def test__retype__refused_while_nested_nodes_of_type_exist(self):           # they would keep a type the config no longer has
+        self.repository.file_save('data/task/Task-1/issues/Bug-3/issue.json', b'{"label": "Bug-3", "node_type": "bug"}')
+
+        response = self.retype('bug', 'task')
+        assert response.success is False
+        assert '1 nested bug node' in str(response.message) and 'Bug-3' in str(response.message)
+        assert 'bug' in [str(t.name) for t in self.type_service.list_node_types()]
+        assert self.repository.node_exists(Safe_Str__Node_Type('bug'), Safe_Str__Node_Label('Bug-1')) is True
+
+    def test__retype__unknown_type(self):
+        response = self.retype('missing', 'defect')
+        assert response.success is False
+        assert 'not found' in str(response.message)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Type__Service integration
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__update_node_type__with_name(self):                                 # Renaming through the update API
+        updates  = Schema__Node__Type__Update(name='defect', display_name='Defect')
+        response = self.type_service.update_node_type(Safe_Str__Node_Type('bug'), updates)
+
+        assert response.success                 is True
+        assert str(response.node_type.name)     == 'defect'
+        assert str(response.node_type.display_name) == 'Defect'
+        assert int(response.retype.processed)   == 2
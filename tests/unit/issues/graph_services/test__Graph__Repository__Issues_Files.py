@@ -5,6 +5,7 @@
 
 import json
 from unittest                                                                   import TestCase
+from issues_fs.issues.graph_services.Graph__Repository                          import Graph__Repository
 from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
 
 
@@ -92,6 +93,40 @@ class test__Graph__Repository__Issues_Files(TestCase):
         nodes2 = self.repository.issues_files_get_cached_nodes()
         assert len(nodes2) == 2
 
+    def test__issues_files_refresh__only_changed_files(self):
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First')
+        self.repository.storage_fs.file__save('bugs.issues',  b'Bug-1 | confirmed | A bug')
+
+        assert sorted(self.repository.issues_files_refresh()) == ['bugs.issues', 'tasks.issues']
+        bug_node = self.repository.issues_files_find_node_by_label('Bug-1')
+
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First\nTask-2 | todo | Second')
+        assert self.repository.issues_files_refresh() == ['tasks.issues']        # bugs.issues not re-parsed
+        assert self.repository.issues_files_refresh() == []
+
+        labels = [str(n.label) for n in self.repository.issues_files_get_cached_nodes()]
+        assert sorted(labels) == ['Bug-1', 'Task-1', 'Task-2']
+        assert self.repository.issues_files_find_node_by_label('Bug-1') is bug_node  # spliced, not rebuilt
+
+    def test__issues_files_refresh__removed_file(self):
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First')
+        self.repository.storage_fs.file__save('bugs.issues',  b'Bug-1 | confirmed | A bug')
+        self.repository.issues_files_refresh()
+
+        self.repository.storage_fs.file__delete('bugs.issues')
+        self.repository.issues_files_refresh()
+
+        assert [str(n.label) for n in self.repository.issues_file_nodes] == ['Task-1']
+        assert list(self.repository.issues_file_cache.keys())            == ['tasks.issues']
+
+    def test__issues_files_invalidate_cache__single_path(self):
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First')
+        self.repository.storage_fs.file__save('bugs.issues',  b'Bug-1 | confirmed | A bug')
+        self.repository.issues_files_refresh()
+
+        self.repository.issues_files_invalidate_cache('bugs.issues')             # Same content, forced re-parse
+        assert self.repository.issues_files_refresh() == ['bugs.issues']
+
     # ═══════════════════════════════════════════════════════════════════════════
     # Find Node by Label
     # ═══════════════════════════════════════════════════════════════════════════
@@ -143,3 +178,99 @@ class test__Graph__Repository__Issues_Files(TestCase):
         all_nodes = self.repository.nodes_list_all(include_issues_files=False)
         labels    = [str(n.label) for n in all_nodes]
         assert 'Task-1' not in labels
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Label / Type Views
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__issues_files_views__built_on_load(self):
+        self.repository.storage_fs.file__save('mixed.issues',
+            b'Task-1 | todo | First\nBug-1 | confirmed | A bug\nTask-2 | done | Second')
+        self.repository.issues_files_load()
+
+        assert sorted(self.repository.issues_file_by_label.keys()) == ['Bug-1', 'Task-1', 'Task-2']
+        assert [str(n.label) for n in self.repository.issues_files_nodes_for_type('task')] == ['Task-1', 'Task-2']
+        assert self.repository.issues_files_nodes_for_type('feature') == []
+
+    def test__issues_files_views__replaced_on_reload(self):
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First')
+        by_label = self.repository.issues_files_get_cached_nodes() and self.repository.issues_file_by_label
+
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-2 | todo | Replaced')
+        self.repository.issues_files_invalidate_cache()
+
+        assert self.repository.issues_files_find_node_by_label('Task-1') is None
+        assert self.repository.issues_files_find_node_by_label('Task-2') is not None
+        assert self.repository.issues_file_by_label is not by_label             # new dict swapped in, old one untouched
+        assert list(by_label.keys()) == ['Task-1']
+
+    def test__issues_files_views__first_occurrence_wins(self):
+        self.repository.storage_fs.file__save('a.issues', b'Task-1 | todo | From a')
+        self.repository.storage_fs.file__save('b.issues', b'Task-1 | done | From b')
+
+        node     = self.repository.issues_files_find_node_by_label('Task-1')
+        expected = self.repository.issues_files_get_cached_nodes()[0]
+        assert node is expected
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Compiled Sidecar Cache
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def fresh_repository(self):                                                  # new process, same storage
+        return Graph__Repository(memory_fs            = self.repository.memory_fs   ,
+                                 path_handler         = self.repository.path_handler,
+                                 issues_file_compiled = True                        )
+
+    def test__issues_files_compiled__hits_on_restart(self):
+        self.repository.issues_file_compiled = True
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First\n\tTask-2 | todo | Child')
+        self.repository.storage_fs.file__save('bugs.issues' , b'Bug-1 | confirmed | A bug')
+        self.repository.issues_files_load()
+        assert self.repository.issues_file_stats == dict(parsed=2, memory_hits=0, compiled_hits=0)
+
+        restarted = self.fresh_repository()
+        nodes     = restarted.issues_files_load()
+        assert restarted.issues_file_stats      == dict(parsed=0, memory_hits=0, compiled_hits=2)
+        assert [str(n.label) for n in nodes]    == [str(n.label) for n in self.repository.issues_file_nodes]
+        assert str(restarted.issues_files_find_node_by_label('Task-1').links[0].target_label) == 'Task-2'
+
+    def test__issues_files_compiled__stale_file_is_parsed(self):
+        self.repository.issues_file_compiled = True
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First')
+        self.repository.storage_fs.file__save('bugs.issues' , b'Bug-1 | confirmed | A bug')
+        self.repository.issues_files_load()
+        self.repository.storage_fs.file__save('bugs.issues' , b'Bug-1 | closed | A bug')
+
+        restarted = self.fresh_repository()
+        restarted.issues_files_load()
+        assert restarted.issues_file_stats                               == dict(parsed=1, memory_hits=0, compiled_hits=1)
+        assert str(restarted.issues_files_find_node_by_label('Bug-1').status) == 'closed'
+
+    def test__issues_files_compiled__orphan_sidecars_deleted(self):
+        self.repository.issues_file_compiled = True
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First')
+        self.repository.storage_fs.file__save('bugs.issues' , b'Bug-1 | confirmed | A bug')
+        self.repository.issues_files_load()
+        bugs_sidecar = self.repository.path_handler.path_for_issues_file_compiled('bugs.issues')
+        assert self.repository.storage_fs.file__exists(bugs_sidecar)   is True
+        assert bugs_sidecar.endswith('.json.zlib')                     is True
+
+        self.repository.file_delete('bugs.issues')
+        restarted = self.fresh_repository()
+        restarted.issues_files_load()
+        assert restarted.storage_fs.file__exists(bugs_sidecar)         is False
+        assert restarted.storage_fs.file__exists(restarted.path_handler.path_for_issues_file_compiled('tasks.issues')) is True
+
+    def test__issues_files_compiled__off_by_default(self):
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First')
+        self.repository.issues_files_load()
+
+        assert [p for p in self.repository.storage_fs.files__paths() if p.startswith('indexes/')] == []
+
+    def test__issues_files_reload__is_idempotent(self):                          # ids + timestamps survive a full reload
+        self.repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | First\n\tTask-2 | todo | Child')
+        before = [n.json() for n in self.repository.issues_files_load()]
+
+        self.repository.issues_file_cache = {}                                   # drop everything, force a re-parse
+        after  = [n.json() for n in self.repository.issues_files_load()]
+        assert before == after
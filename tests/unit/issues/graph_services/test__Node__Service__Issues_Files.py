@@ -95,3 +95,16 @@ class test__Node__Service__Issues_Files(TestCase):
         task_1_entries = [n for n in response.nodes if str(n.label) == 'Task-1']
         assert len(task_1_entries) == 1                                          # no duplicates
         assert str(task_1_entries[0].title) == 'JSON task'                       # JSON version wins
+
+    def test__list_nodes__by_type_uses_issues_file_type_index(self):           # no scan of every cached .issues node
+        from unittest.mock                                                      import patch
+
+        self.repository.storage_fs.file__save('mixed.issues',
+            b'Task-1 | todo | A task\nBug-1 | confirmed | A bug\nTask-2 | done | Another')
+        self.repository.issues_files_invalidate_cache()
+
+        with patch.object(self.repository, 'issues_files_get_cached_nodes', side_effect=AssertionError('full scan')):
+            with patch.object(self.repository, 'issues_files_find_node_by_label', side_effect=AssertionError('per-label lookup')):
+                response = self.node_service.list_nodes(node_type='task')
+
+        assert [(str(n.label), str(n.status)) for n in response.nodes] == [('Task-1', 'todo'), ('Task-2', 'done')]
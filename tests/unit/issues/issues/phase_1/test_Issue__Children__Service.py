@@ -3,7 +3,9 @@
 # Tests add_child_issue, convert_to_new_structure, and list_children
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
 from unittest                                                                                           import TestCase
+from unittest.mock                                                                                      import patch
 from memory_fs.helpers.Memory_FS__In_Memory                                                             import Memory_FS__In_Memory
 from osbot_utils.utils.Json                                                                             import json_dumps
 from issues_fs.schemas.issues.phase_1.Schema__Issue__Children          import Schema__Issue__Child__Create
@@ -24,6 +26,7 @@ class test_Issue__Children__Service(TestCase):
                                                     path_handler = cls.path_handler)
 
     def setUp(self):                                                             # Reset storage before each test
+        self.repository.node_cache_enabled = False
         self.repository.clear_storage()
 
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -318,4 +321,275 @@ class test_Issue__Children__Service(TestCase):
 
         task_children = self.service.list_children(task_path)                    # List grandchildren
         assert int(task_children.total) == 1
-        assert task_children.children[0].get('label') == 'Bug-1'
\ No newline at end of file
+        assert task_children.children[0].get('label') == 'Bug-1'
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Path Index Consistency
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__path_index__kept_in_sync_with_writes(self):                        # No rebuild between child adds
+        self.repository.node_cache_enabled = True                                # external edits reported: index is kept
+        parent_path = self.create_parent_issue(node_type='feature', label='Feature-1')
+        index       = self.repository.path_index_get()
+
+        first  = self.service.add_child_issue(parent_path, Schema__Issue__Child__Create(issue_type='task', title='One'))
+        second = self.service.add_child_issue(parent_path, Schema__Issue__Child__Create(issue_type='task', title='Two'))
+
+        assert self.repository.path_index          is index
+        assert str(first.label)                    == 'Task-1'
+        assert str(second.label)                   == 'Task-2'
+        assert sorted(index.child_folders_with('.issues/data/feature/Feature-1/issues', 'issue.json')) == ['Task-1', 'Task-2']
+
+        self.repository.file_delete('.issues/data/feature/Feature-1/issues/Task-2/issue.json')
+        assert index.child_names('.issues/data/feature/Feature-1/issues') == ['Task-1']
+        assert self.service.list_children(parent_path).total               == 1
+
+    def test__path_index__not_kept_without_node_cache(self):                     # nothing reports external edits: list fresh
+        import tempfile, shutil
+        from issues_fs.issues.graph_services.Graph__Repository__Factory import Graph__Repository__Factory
+        root = tempfile.mkdtemp()
+        try:
+            repository = Graph__Repository__Factory.create_local_disk(root)
+            service    = Issue__Children__Service(repository=repository, path_handler=Path__Handler__Graph_Node())
+            issues     = '.issues/data/feature/Feature-1/issues'
+            repository.storage_fs.file__save(f'{issues}/Task-1/issue.json', json_dumps({'label': 'Task-1'}).encode())
+            assert len(service.scan_child_folders(issues)) == 1
+
+            os.makedirs(os.path.join(root, issues, 'Task-2'))                    # written by another process
+            with open(os.path.join(root, issues, 'Task-2', 'issue.json'), 'w') as file:
+                file.write(json_dumps({'label': 'Task-2'}))
+
+            assert len(service.scan_child_folders(issues)) == 2
+            assert repository.path_index                   is None
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Child Counter File
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__generate_child_label__uses_counter_file(self):                     # O(1): no scan once the counter exists
+        issues_folder = '.issues/data/feature/F1/issues'
+        assert self.service.generate_child_label(issues_folder, 'task') == 'Task-1'
+
+        counters = self.repository.children_index_load(issues_folder)
+        assert counters.next_index == {'task': 2}
+
+        with patch.object(Issue__Children__Service, 'get_existing_indices', side_effect=AssertionError('scanned')):
+            assert self.service.generate_child_label(issues_folder, 'task') == 'Task-2'
+
+    def test__generate_child_label__rebuilds_missing_counter(self):              # Fallback: scan existing children
+        self.create_issue_at_path('.issues/data/feature/F1/issues/Task-4/issue.json', label='Task-4')
+        self.create_issue_at_path('.issues/data/feature/F1/issues/Task-7/issue.json', label='Task-7')
+
+        assert self.service.generate_child_label('.issues/data/feature/F1/issues', 'task') == 'Task-8'
+        assert self.service.generate_child_label('.issues/data/feature/F1/issues', 'bug')  == 'Bug-1'
+
+    def test__generate_child_label__skips_taken_labels(self):                    # Counter behind the folder contents
+        issues_folder = '.issues/data/feature/F1/issues'
+        self.service.generate_child_label(issues_folder, 'task')
+        self.create_issue_at_path(f'{issues_folder}/Task-2/issue.json', label='Task-2')   # written by someone else
+
+        assert self.service.generate_child_label(issues_folder, 'task') == 'Task-3'
+
+    def test__add_child_issue__concurrent_adds_get_unique_labels(self):
+        from concurrent.futures import ThreadPoolExecutor
+        parent_path = self.create_parent_issue(node_type='feature', label='Feature-1')
+
+        def add(i):
+            return str(self.service.add_child_issue(parent_path, Schema__Issue__Child__Create(issue_type='task', title=f'T{i}')).label)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            labels = list(pool.map(add, range(20)))
+
+        assert sorted(labels, key=lambda l: int(l.split('-')[1])) == [f'Task-{i}' for i in range(1, 21)]
+        assert self.service.list_children(parent_path).total      == 20
+
+    def test__add_child_issue__releases_label_marker(self):                      # {Label}.lock only lives until issue.json is written
+        parent_path = self.create_parent_issue(node_type='feature', label='Feature-1')
+        self.service.add_child_issue(parent_path, Schema__Issue__Child__Create(issue_type='task', title='T1'))
+
+        issues_folder = '.issues/data/feature/Feature-1/issues'
+        assert self.repository.storage_fs.file__exists(f'{issues_folder}/Task-1/issue.json') is True
+        assert self.repository.storage_fs.file__exists(f'{issues_folder}/Task-1.lock')       is False
+
+    def test__generate_child_label__separate_processes_get_unique_labels(self):  # per-process lock + stale counter: the marker decides
+        import tempfile, shutil
+        from issues_fs.issues.graph_services.Graph__Repository__Factory import Graph__Repository__Factory
+        root = tempfile.mkdtemp()
+        try:
+            services = [Issue__Children__Service(repository   = Graph__Repository__Factory.create_local_disk(root),
+                                                 path_handler = Path__Handler__Graph_Node())
+                        for _ in range(2)]
+            issues   = '.issues/data/feature/Feature-1/issues'
+            stale    = services[0].repository.children_index_load(issues)     # both read the counter before either saves
+
+            with patch.object(Graph__Repository, 'children_index_load', return_value=stale):
+                labels = [service.generate_child_label(issues, 'task') for service in services]
+
+            assert labels                                                   == ['Task-1', 'Task-2']
+            assert sorted(os.listdir(os.path.join(root, issues)))          == ['Task-1.lock', 'Task-2.lock', '_index.json']
+            assert services[1].repository.file_create_exclusive(f'{issues}/Task-1.lock') is False
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # move_subtree Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def create_tree(self):                                                       # Feature-1 > Task-1 > Bug-1 (+ attachment), Feature-2
+        self.create_parent_issue(node_type='feature', label='Feature-1')
+        self.create_parent_issue(node_type='feature', label='Feature-2')
+        self.create_issue_at_path('.issues/data/feature/Feature-1/issues/Task-1/issue.json'              , label='Task-1')
+        self.create_issue_at_path('.issues/data/feature/Feature-1/issues/Task-1/issues/Bug-1/issue.json' , label='Bug-1', node_type='bug')
+        self.repository.storage_fs.file__save('.issues/data/feature/Feature-1/issues/Task-1/attachments/log.txt', b'log')
+
+    def test__move_subtree__moves_descendants_and_attachments(self):
+        self.create_tree()
+        response = self.service.move_subtree('data/feature/Feature-1/issues/Task-1', 'data/feature/Feature-2')
+
+        assert response.success                is True
+        assert str(response.path)              == 'data/feature/Feature-2/issues/Task-1'
+        assert str(response.previous_path)     == 'data/feature/Feature-1/issues/Task-1'
+        assert int(response.files_moved)       == 3
+        assert response.renamed                is False                          # memory backend: copy + delete
+        assert self.repository.storage_fs.file__bytes('.issues/data/feature/Feature-2/issues/Task-1/attachments/log.txt') == b'log'
+        assert self.repository.storage_fs.file__exists('.issues/data/feature/Feature-2/issues/Task-1/issues/Bug-1/issue.json') is True
+        assert self.repository.storage_fs.file__exists('.issues/data/feature/Feature-1/issues/Task-1/issue.json')             is False
+        assert self.service.list_children('data/feature/Feature-1').total == 0
+        assert self.service.list_children('data/feature/Feature-2').total == 1
+        assert self.repository.node_find_path_by_label('Bug-1') == '.issues/data/feature/Feature-2/issues/Task-1/issues/Bug-1'
+
+    def test__move_subtree__relabels_on_collision(self):
+        self.create_tree()
+        self.create_issue_at_path('.issues/data/feature/Feature-2/issues/Task-1/issue.json', label='Task-1')
+        response = self.service.move_subtree('data/feature/Feature-1/issues/Task-1', 'data/feature/Feature-2')
+
+        assert str(response.label) == 'Task-2'
+        moved = self.service.load_issue_from_path('.issues/data/feature/Feature-2/issues/Task-2/issue.json')
+        assert moved['label']      == 'Task-2'
+        assert moved['node_index'] == 2
+
+    def test__move_subtree__relabel_repoints_link_counterparts(self):           # other end of each link follows the new label
+        self.create_tree()
+        self.create_issue_at_path('.issues/data/feature/Feature-2/issues/Task-1/issue.json', label='Task-1')
+        moving = self.service.load_issue_from_path('.issues/data/feature/Feature-1/issues/Task-1/issue.json')
+        moving.update(node_id='n-task', links=[{'verb': 'blocks', 'target_id': 'n-bug', 'target_label': 'Bug-1'}])
+        self.repository.storage_fs.file__save('.issues/data/feature/Feature-1/issues/Task-1/issue.json', json_dumps(moving).encode())
+        bug = self.service.load_issue_from_path('.issues/data/feature/Feature-1/issues/Task-1/issues/Bug-1/issue.json')
+        bug.update(node_id='n-bug', links=[{'verb': 'blocked-by', 'target_id': 'n-task', 'target_label': 'Task-1'}])
+        self.repository.storage_fs.file__save('.issues/data/feature/Feature-1/issues/Task-1/issues/Bug-1/issue.json', json_dumps(bug).encode())
+
+        response = self.service.move_subtree('data/feature/Feature-1/issues/Task-1', 'data/feature/Feature-2')
+        bug      = self.service.load_issue_from_path('.issues/data/feature/Feature-2/issues/Task-2/issues/Bug-1/issue.json')
+
+        assert str(response.label)        == 'Task-2'
+        assert int(response.links_updated) == 1
+        assert bug['links'][0]['target_label'] == 'Task-2'
+        other = self.service.load_issue_from_path('.issues/data/feature/Feature-2/issues/Task-1/issue.json')
+        assert other['label']             == 'Task-1'                            # the issue that kept the label is untouched
+
+    def test__move_subtree__keeps_child_counter_ahead(self):
+        self.create_tree()
+        self.create_issue_at_path('.issues/data/feature/Feature-1/issues/Task-9/issue.json', label='Task-9')
+        self.service.generate_child_label('.issues/data/feature/Feature-2/issues', 'task')       # counter: task -> 2
+        self.service.move_subtree('data/feature/Feature-1/issues/Task-9', 'data/feature/Feature-2')
+
+        assert self.repository.children_index_load('.issues/data/feature/Feature-2/issues').next_index == {'task': 10}
+
+    def test__move_subtree__to_top_level(self):
+        self.create_tree()
+        response = self.service.move_subtree('data/feature/Feature-1/issues/Task-1/issues/Bug-1', '')
+
+        assert response.success   is True
+        assert str(response.path) == 'data/bug/Bug-1'
+        assert self.repository.storage_fs.file__exists('.issues/data/bug/Bug-1/issue.json') is True
+
+    def test__move_subtree__rejects_invalid_moves(self):
+        self.create_tree()
+        into_self = self.service.move_subtree('data/feature/Feature-1', 'data/feature/Feature-1/issues/Task-1')
+        missing   = self.service.move_subtree('data/feature/Feature-9', 'data/feature/Feature-2')
+        no_parent = self.service.move_subtree('data/feature/Feature-1', 'data/feature/Feature-9')
+
+        assert into_self.success is False and 'own subtree'      in str(into_self.message)
+        assert missing.success   is False and 'Issue not found'  in str(missing.message)
+        assert no_parent.success is False and 'Parent not found' in str(no_parent.message)
+
+    def test__move_subtree__native_rename_on_local_disk(self):
+        import tempfile, shutil
+        from issues_fs.issues.graph_services.Graph__Repository__Factory import Graph__Repository__Factory
+        root = tempfile.mkdtemp()
+        try:
+            repository = Graph__Repository__Factory.create_local_disk(root)
+            repository.node_cache_enabled = True                                 # kept index follows the rename
+            service    = Issue__Children__Service(repository=repository, path_handler=Path__Handler__Graph_Node())
+            for path, label in [('.issues/data/feature/Feature-1/issue.json'               , 'Feature-1'),
+                                ('.issues/data/feature/Feature-2/issue.json'               , 'Feature-2'),
+                                ('.issues/data/feature/Feature-1/issues/Task-1/issue.json' , 'Task-1'   )]:
+                repository.storage_fs.file__save(path, json_dumps({'label': label, 'node_type': 'task'}).encode())
+
+            response = service.move_subtree('data/feature/Feature-1/issues/Task-1', 'data/feature/Feature-2')
+            assert response.renamed            is True
+            assert int(response.files_moved)   == 1
+            assert repository.storage_fs.file__exists('.issues/data/feature/Feature-2/issues/Task-1/issue.json') is True
+            assert repository.path_index.file_exists  ('.issues/data/feature/Feature-2/issues/Task-1/issue.json') is True
+            assert repository.path_index.folder_exists('.issues/data/feature/Feature-1/issues')                    is False
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # load_subtree Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def create_subtree(self) -> str:                                             # Feature-1 > Task-1 > Bug-1, Feature-1 > Task-2
+        parent_path = self.create_parent_issue(node_type='feature', label='Feature-1')
+        base        = f".issues/{parent_path}/issues"
+        self.create_issue_at_path(f"{base}/Task-1/issue.json"              , label='Task-1', title='First' )
+        self.create_issue_at_path(f"{base}/Task-2/issue.json"              , label='Task-2', title='Second')
+        self.create_issue_at_path(f"{base}/Task-1/issues/Bug-1/issue.json" , label='Bug-1' , node_type='bug')
+        return parent_path
+
+    def test__load_subtree__nested_hierarchy(self):                              # Children nested under each node, in label order
+        parent_path = self.create_subtree()
+        response    = self.service.load_subtree(parent_path)
+
+        assert response.success    is True
+        assert response.total      == 4
+        tree = response.tree
+        assert tree['label']       == 'Feature-1'
+        assert tree['path']        == parent_path
+        assert [child['label'] for child in tree['children']] == ['Task-1', 'Task-2']
+        task_1 = tree['children'][0]
+        assert task_1['title']     == 'First'
+        assert task_1['path']      == f"{parent_path}/issues/Task-1"
+        assert [child['label'] for child in task_1['children']] == ['Bug-1']
+        assert task_1['children'][0]['children'] == []
+
+    def test__load_subtree__max_depth_and_fields(self):                          # Depth limit and field projection
+        parent_path = self.create_subtree()
+        response    = self.service.load_subtree(parent_path, max_depth=1, fields=['title'])
+
+        assert response.total == 3
+        assert response.tree['children'][0] == {'title'   : 'First'                         ,
+                                                 'path'    : f"{parent_path}/issues/Task-1"  ,
+                                                 'children': []                              }
+
+    def test__load_subtree__whole_repository(self):                              # '' = every top-level issue under a root node
+        self.create_subtree()
+        self.create_parent_issue(node_type='bug', label='Bug-9')
+        tree = self.service.load_subtree('').tree
+
+        assert tree['label'] == 'Root'
+        assert [child['path'] for child in tree['children']] == ['data/bug/Bug-9', 'data/feature/Feature-1']
+
+    def test__load_subtree__one_listing_one_read_per_issue(self):                # No per-level listings or repeated reads
+        parent_path = self.create_subtree()
+        storage     = self.repository.storage_fs
+        with patch.object(storage, 'files__paths', wraps=storage.files__paths) as files__paths, \
+             patch.object(storage, 'file__str'   , wraps=storage.file__str   ) as file__str   :
+            self.service.load_subtree(parent_path)
+        assert files__paths.call_count <= 1
+        assert file__str   .call_count == 4
+
+    def test__load_subtree__not_found(self):
+        response = self.service.load_subtree('data/feature/Feature-404')
+        assert response.success is False
+        assert 'not found' in response.message
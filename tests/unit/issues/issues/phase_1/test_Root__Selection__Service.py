@@ -295,4 +295,34 @@ class test_Root__Selection__Service(TestCase):
 
         assert feature_root                    is not None
         assert feature_root.has_issues         is True
-        assert int(feature_root.has_children)  == 2
\ No newline at end of file
+        assert int(feature_root.has_children)  == 2
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Single-Pass Folder Stats
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__scan_folder_stats__matches_per_folder_checks(self):                # One pass gives the same answers as the per-folder scans
+        self.create_standard_issue(node_type='feature', label='Feature-1')
+        self.create_issue_at_path('.issues/data/feature/Feature-1/issues/Task-1/issue.json'              , label='Task-1')
+        self.create_issue_at_path('.issues/data/feature/Feature-1/issues/Task-1/issues/Bug-1/issue.json' , label='Bug-1' )
+        self.create_issue_at_path('.issues/data/feature/Feature-1/issues/Task-2/issue.json'              , label='Task-2')
+        self.create_standard_issue(node_type='bug', label='Bug-7')
+        self.repository.storage_fs.file__save('.issues/data/bug/Bug-7/issues/.gitkeep', b'')
+        self.repository.storage_fs.file__save('.issues/config/node-types.json'        , b'[]')
+
+        stats   = self.service.scan_folder_stats()
+        folders = self.service.scan_for_issue_folders()
+
+        assert sorted(stats.issue_folders) == sorted(folders)
+        assert stats.top_level_count       == self.service.count_top_level_issues() == 5
+        for folder in folders:
+            assert (folder in stats.has_issues)          == self.service.has_issues_folder(folder)
+            assert stats.child_counts.get(folder, 0)     == self.service.count_children_in_folder(folder)
+        assert stats.child_counts['.issues/data/feature/Feature-1'] == 3
+        assert '.issues/data/bug/Bug-7' in stats.has_issues                      # placeholder only, no children
+        assert '.issues/data/bug/Bug-7' not in stats.child_counts
+
+        roots = {str(root.path): root for root in self.service.get_available_roots().roots}
+        assert int(roots['data/feature/Feature-1'].has_children)                  == 3
+        assert int(roots['data/feature/Feature-1/issues/Task-1'].has_children)    == 1
+        assert roots['data/bug/Bug-7'].has_issues                                 is True
+        assert int(roots[''].has_children)                                        == 5
@@ -314,6 +314,18 @@ class test_B13__Migration__Node_To_Issue_Json(TestCase):
         assert self.memory_fs.storage_fs.file__exists('data/bug/Bug-1/issue.json') is True
         assert self.memory_fs.storage_fs.file__exists('data/bug/Bug-1/node.json')  is False
 
+    def test__run__through_repository_keeps_path_index(self):                    # Writes go through Graph__Repository
+        self.write_raw_bytes_to_path('data/bug/Bug-1/node.json',
+                                      {'node_type': 'bug', 'title': 'Bug One'})
+        repository = Graph__Repository(memory_fs=self.memory_fs, node_cache_enabled=True)
+        path_index = repository.path_index_get()
+
+        results = Migration__Node_To_Issue_Json(storage_fs=self.memory_fs.storage_fs, repository=repository).run()
+
+        assert results['converted']                                 == 1
+        assert path_index.file_exists('data/bug/Bug-1/issue.json') is True
+        assert path_index.file_exists('data/bug/Bug-1/node.json')  is False
+
     def test__run__deletes_node_json_when_issue_json_exists(self):               # Test deletion when both exist
         self.write_raw_bytes_to_path('data/bug/Bug-2/node.json'  ,
                                       {'node_type': 'bug', 'title': 'Old'})
@@ -5,6 +5,7 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from unittest                                                                                           import TestCase
+from unittest.mock                                                                                      import patch
 from memory_fs.helpers.Memory_FS__In_Memory                                                             import Memory_FS__In_Memory
 from osbot_utils.type_safe.Type_Safe                                                                    import Type_Safe
 from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path                       import Safe_Str__File__Path
@@ -13,9 +14,13 @@ from osbot_utils.type_safe.primitives.domains.identifiers.safe_int.Timestamp_Now
 from osbot_utils.utils.Json                                                                             import json_dumps
 from issues_fs.schemas.graph.Safe_Str__Graph_Types                                                      import Safe_Str__Node_Type, Safe_Str__Node_Label
 from issues_fs.schemas.graph.Schema__Node                                                               import Schema__Node
+from issues_fs.schemas.graph.Schema__Node__Create__Request                                              import Schema__Node__Create__Request
+from issues_fs.schemas.graph.Schema__Node__Update__Request                                              import Schema__Node__Update__Request
+from issues_fs.schemas.issues.phase_1.Schema__Root                                                      import Schema__Root__Select__Request
 from issues_fs.issues.graph_services.Graph__Repository                                                  import Graph__Repository
 from issues_fs.issues.graph_services.Node__Service                                                      import Node__Service
 from issues_fs.issues.graph_services.Type__Service                                                      import Type__Service
+from issues_fs.issues.phase_1.Root__Selection__Service                                                  import Root__Selection__Service
 from issues_fs.issues.storage.Path__Handler__Graph_Node                                                 import Path__Handler__Graph_Node
 
 
@@ -35,6 +40,7 @@ class test_Node__Service__B17__Root_Scoping(TestCase):
 
     def setUp(self):                                                         # Reset storage before each test
         self.repository.clear_storage()
+        self.repository.node_cache_enabled = False
         self.type_service.initialize_default_types()                         # Re-initialize after clear
         self.type_service.create_node_type(name         = Safe_Str__Node_Type('project'),  # Register project type for tests
                                             display_name = 'Project'                     ,
@@ -226,3 +232,80 @@ class test_Node__Service__B17__Root_Scoping(TestCase):
         assert response.success is True
         assert response.total   == len(response.nodes)
         assert response.total   == 2
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Root View Tests
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def create_scoped_service(self, root=".issues/data/project/Project-1",   # Project-1 > Task-1, plus an unscoped Task-2
+                                    cached=True):                            # root view needs node_cache_enabled (e.g. a watcher)
+        self.repository.node_cache_enabled = cached
+        self.create_issue_at_path(".issues/data/project/Project-1/issue.json"              , "project", "Project-1", "Project")
+        self.create_issue_at_path(".issues/data/project/Project-1/issues/Task-1/issue.json", "task"   , "Task-1"   , "Scoped task")
+        self.create_issue_at_path(".issues/data/task/Task-2/issue.json"                    , "task"   , "Task-2"   , "Unscoped task")
+        mock_root              = Mock__Root__Selection__Service()
+        mock_root.current_root = Safe_Str__File__Path(root)
+        return Node__Service(repository             = self.repository,
+                             root_selection_service = mock_root      )
+
+    def test__root_view__scoped_listings_filter_once(self):                  # Repeated scoped listings reuse the view
+        service = self.create_scoped_service()
+        with patch.object(self.repository, 'nodes_list_all', wraps=self.repository.nodes_list_all) as nodes_list_all:
+            for _ in range(3):
+                labels = sorted(str(n.label) for n in service.list_nodes().nodes)
+                assert labels == ['Project-1', 'Task-1']
+            assert [str(n.label) for n in service.list_nodes(node_type=Safe_Str__Node_Type("task")).nodes] == ['Task-1']
+        assert nodes_list_all.call_count == 1
+        assert service.root_view.root_path == ".issues/data/project/Project-1"
+        assert sorted(service.root_view.by_type) == ['project', 'task']
+
+    def test__root_view__rebuilt_when_root_changes(self):                    # A different root means a new view
+        service = self.create_scoped_service()
+        service.list_nodes()
+        service.root_selection_service.current_root = Safe_Str__File__Path(".issues/data/task/Task-2")
+        assert [str(n.label) for n in service.list_nodes().nodes] == ['Task-2']
+        assert service.root_view.root_path == ".issues/data/task/Task-2"
+
+    def test__root_view__rebuilt_by_set_current_root(self):                  # Root__Selection__Service notifies the node service
+        self.create_issue_at_path(".issues/data/project/Project-1/issue.json", "project", "Project-1", "Project")
+        root_service = Root__Selection__Service(repository   = self.repository  ,
+                                                path_handler = Path__Handler__Graph_Node())
+        self.repository.node_cache_enabled = True
+        service      = Node__Service(repository             = self.repository ,
+                                     root_selection_service = root_service    )
+        assert service.root_view is None
+        root_service.set_current_root(Schema__Root__Select__Request(path='data/project/Project-1'))
+        assert service.root_view           is not None
+        assert service.root_view.root_path == 'data/project/Project-1'
+        root_service.set_current_root(Schema__Root__Select__Request(path=''))
+        assert service.root_view is None
+
+    def test__root_view__own_writes_patch_without_rebuild(self):             # create/update/delete keep the view current
+        service = self.create_scoped_service(root="data/project/Project-9")
+        self.create_issue_at_path("data/project/Project-9/issue.json", "project", "Project-9", "Root")
+        service.list_nodes()
+        with patch.object(self.repository, 'nodes_list_all', wraps=self.repository.nodes_list_all) as nodes_list_all:
+            service.create_node(Schema__Node__Create__Request(node_type='bug', title='Outside the root'))
+            service.update_node(Safe_Str__Node_Type('project'), Safe_Str__Node_Label('Project-9'),
+                                Schema__Node__Update__Request(title='Renamed root'))
+            assert [str(n.title) for n in service.list_nodes().nodes] == ['Renamed root']
+            service.delete_node(Safe_Str__Node_Type('project'), Safe_Str__Node_Label('Project-9'))
+            assert service.root_view.nodes == []
+        assert nodes_list_all.call_count == 0
+
+    def test__root_view__rebuilt_after_other_writers(self):                  # Writes outside Node__Service bump the repository version
+        service = self.create_scoped_service()
+        service.list_nodes()
+        self.repository.file_save(".issues/data/project/Project-1/issues/Bug-1/issue.json",
+                                  json_dumps({"node_type": "bug", "label": "Bug-1", "title": "Child", "status": "backlog"}).encode())
+        labels = sorted(str(n.label) for n in service.list_nodes().nodes)
+        assert labels == ['Bug-1', 'Project-1', 'Task-1']
+
+    def test__root_view__not_used_without_node_cache(self):                  # No watcher: external edits must show up
+        service = self.create_scoped_service(cached=False)
+        service.list_nodes()
+        self.repository.storage_fs.file__save(".issues/data/project/Project-1/issues/Task-3/issue.json",
+                                              json_dumps({"node_type": "task", "label": "Task-3", "title": "External", "status": "backlog"}).encode())
+        labels = sorted(str(n.label) for n in service.list_nodes().nodes)
+        assert labels            == ['Project-1', 'Task-1', 'Task-3']
+        assert service.root_view is None
@@ -3,7 +3,13 @@
 # Tests git repository detection and status reporting
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import os
+import shutil
+import subprocess
+import tempfile
 from unittest                                                                              import TestCase
+from unittest.mock                                                                         import patch
+from osbot_utils.type_safe.primitives.domains.common.safe_str.Safe_Str__Text              import Safe_Str__Text
 from osbot_utils.type_safe.primitives.domains.files.safe_str.Safe_Str__File__Path          import Safe_Str__File__Path
 from issues_fs.schemas.status.Schema__Git__Status         import Schema__Git__Status
 from issues_fs.issues.status.Git__Status__Service import Git__Status__Service
@@ -179,3 +185,103 @@ class test_Git__Status__Service(TestCase):
             assert str(status.current_branch) != ''
             assert str(status.current_commit) != ''
             assert str(status.git_root)       != ''
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Batched Status + Cache Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def create_git_repo(self) -> str:                                            # repo with one tracked, one modified, one untracked .issues file
+        root = tempfile.mkdtemp()
+        def git(*args):
+            subprocess.run(['git', *args], cwd=root, capture_output=True, check=True)
+        os.makedirs(os.path.join(root, '.issues', 'data'))
+        with open(os.path.join(root, '.issues', 'data', 'a.json'), 'w') as file:
+            file.write('a')
+        git('init', '-q', '-b', 'main')
+        git('-c', 'user.email=a@b', '-c', 'user.name=a', 'add', '.')
+        git('-c', 'user.email=a@b', '-c', 'user.name=a', 'commit', '-q', '-m', 'init')
+        git('remote', 'add', 'origin', 'git@example.com:org/repo.git')
+        with open(os.path.join(root, '.issues', 'data', 'a.json'), 'w') as file:
+            file.write('changed')
+        with open(os.path.join(root, '.issues', 'data', 'b.json'), 'w') as file:
+            file.write('new')
+        return root
+
+    def test__get_status__batched_porcelain(self):                               # One git call, values match the per-field helpers
+        root    = self.create_git_repo()
+        service = Git__Status__Service(root_path=Safe_Str__File__Path(root))
+        try:
+            with patch.object(service, '_run_git_command', wraps=service._run_git_command) as run_git:
+                status = service.get_status()
+            assert run_git.call_count          == 1
+            assert status.is_git_repo          is True
+            assert str(status.current_branch)  == service._get_current_branch(root)
+            assert str(status.current_commit)  == service._get_current_commit(root)
+            assert status.is_dirty             is True
+            assert status.issues_tracked       is True
+            assert int(status.untracked_issues) == service._count_untracked_issues(root) == 1
+            assert int(status.modified_issues)  == service._count_modified_issues (root) == 1
+            assert str(status.remote_name)     == 'origin'
+            assert str(status.remote_url)      == str(Safe_Str__Text(service._get_remote_url(root, 'origin')))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test__get_status__cached_until_index_changes(self):                      # Polling costs stat() calls only
+        root    = self.create_git_repo()
+        service = Git__Status__Service(root_path=Safe_Str__File__Path(root))
+        try:
+            first = service.get_status()
+            with patch.object(service, '_run_git_command', wraps=service._run_git_command) as run_git:
+                assert service.get_status() is first
+                assert run_git.call_count == 0
+                index = os.path.join(root, '.git', 'index')
+                stat  = os.stat(index)
+                os.utime(index, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+                assert service.get_status() is not first
+                assert run_git.call_count == 1
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test__get_status__unusual_paths_and_clean_tracked(self):                 # -z keeps paths unquoted; clean .issues found via ls-files
+        root    = self.create_git_repo()
+        service = Git__Status__Service(root_path=Safe_Str__File__Path(root))
+        try:
+            with open(os.path.join(root, '.issues', 'data', 'b.json'), 'w') as file:
+                file.write('a')
+            subprocess.run(['git', 'add', '.'], cwd=root, capture_output=True, check=True)
+            subprocess.run(['git', '-c', 'user.email=a@b', '-c', 'user.name=a', 'commit', '-q', '-m', 'clean'],
+                           cwd=root, capture_output=True, check=True)
+            with open(os.path.join(root, '.issues', 'data', 'caf\u00e9 "x".json'), 'w') as file:
+                file.write('new')
+            status = service.get_status()
+            assert status.issues_tracked        is True                          # no tracked .issues entry in the status output
+            assert int(status.untracked_issues) == 1                             # git would quote this path without -z
+            assert int(status.modified_issues)  == 0
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test___parse_porcelain_v2(self):                                         # Branch, commit and .issues counts from one output
+        output = '\0'.join(['# branch.oid 0ffbe3c7fcd1a9396fb7c91bf94d472f419ed073'                                  ,
+                             '# branch.head (detached)'                                                             ,
+                             '1 .M N... 100644 100644 100644 7898192 7898192 .issues/data/a.json'                     ,
+                             '1 M. N... 100644 100644 100644 7898192 7898193 .issues/data/c.json'                     ,
+                             '2 R. N... 100644 100644 100644 7898192 7898192 R100 .issues/data/d.json'               ,
+                             '? .issues/old.json'                                                                   ,  # origPath record (a folder named '? .issues'), not an entry
+                             '1 .M N... 100644 100644 100644 7898192 7898192 src/code.py'                             ,
+                             '? .issues/data/b.json'                                                                ,
+                             '? notes.txt'                                                                          , ''])
+        status = Git__Status__Service()._parse_porcelain_v2(output, '.issues/')
+
+        assert str(status.current_branch)   == 'HEAD'
+        assert str(status.current_commit)   == '0ffbe3c'
+        assert status.is_dirty              is True
+        assert status.issues_tracked        is True
+        assert int(status.untracked_issues) == 1
+        assert int(status.modified_issues)  == 1
+
+    def test___parse_porcelain_v2__clean_initial(self):                          # Fresh repo: no commit yet, nothing dirty
+        status = Git__Status__Service()._parse_porcelain_v2('# branch.oid (initial)\0# branch.head main\0', '.issues/')
+
+        assert str(status.current_branch) == 'main'
+        assert str(status.current_commit) == ''
+        assert status.is_dirty            is False
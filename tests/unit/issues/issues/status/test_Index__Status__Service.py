@@ -4,6 +4,7 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from unittest                                                                                               import TestCase
+from unittest.mock                                                                                          import patch
 
 from osbot_utils.testing.__ import __, __SKIP__
 from osbot_utils.type_safe.primitives.core.Safe_UInt                                                        import Safe_UInt
@@ -196,3 +197,33 @@ class test_Index__Status__Service(TestCase):
         result = self.index_status__service._calculate_total_nodes(counts)      # todo: review the need to pass this counts var here
 
         assert result == 1
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Batched + Cached Reads Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def test__get_status__one_read_per_index(self):                              # Each type index and the global index read once
+        repository = self.graph_repository
+        with patch.object(repository, 'type_index_load'  , wraps=repository.type_index_load  ) as type_index_load  , \
+             patch.object(repository, 'global_index_load', wraps=repository.global_index_load) as global_index_load:
+            self.index_status__service.get_status()
+        assert type_index_load  .call_count == 2                                 # bug + task
+        assert global_index_load.call_count == 1
+
+    def test__get_status__registry_cache(self):                                  # With caches enabled, repeat status reads skip storage
+        memory_fs    = Memory_FS__In_Memory()
+        repository   = Graph__Repository(memory_fs=memory_fs, node_cache_enabled=True)
+        type_service = Type__Service(repository=repository)
+        node_service = Node__Service(repository=repository)
+        type_service.create_node_type(name='bug', display_name='Bug')
+        node_service.create_node(Schema__Node__Create__Request(node_type='bug', title='a bug'))
+        service      = Index__Status__Service(type_service=type_service, repository=repository)
+
+        first = service.get_status()
+        with patch.object(repository.storage_fs, 'file__str', wraps=repository.storage_fs.file__str) as file__str:
+            assert service.get_status().obj() == first.obj()
+            assert file__str.call_count == 0
+
+            node_service.create_node(Schema__Node__Create__Request(node_type='bug', title='another bug'))  # saves drop cached entries
+            status = service.get_status()
+        assert status.type_counts[0].obj() == __(node_type='bug', count=2, next_index=3)
@@ -3,7 +3,9 @@
 # Tests comprehensive status aggregation and health calculation
 # ═══════════════════════════════════════════════════════════════════════════════
 import sys
+import time
 from unittest                                                                                               import TestCase
+from unittest.mock                                                                                          import patch
 from osbot_utils.testing.__                                                                                 import __, __SKIP__
 from memory_fs.helpers.Memory_FS__In_Memory                                                                 import Memory_FS__In_Memory
 from issues_fs.schemas.status.Schema__API__Info                            import Schema__API__Info
@@ -94,11 +96,16 @@ class test_Server__Status__Service(TestCase):
                                                          root_path='',
                                                          is_connected=True,
                                                          is_writable=True,
-                                                         file_count=0),
+                                                         file_count=0,
+                                                         total_bytes=0,
+                                                         files_by_prefix=__(),
+                                                         bytes_by_prefix=__()),
                                               types=None,
                                               index=None,
                                               git=None,
-                                              timestamp=__SKIP__),
+                                              timestamp=__SKIP__,
+                                              timings=__SKIP__,
+                                              stale=False),
                                     message='')
 
 
@@ -119,6 +126,57 @@ class test_Server__Status__Service(TestCase):
         assert status.types     is not None
         assert status.index     is not None
 
+    def test__get_full_status__timings(self):                                    # One timing per configured component
+        service = Server__Status__Service(storage_service = self.storage_status__service,
+                                          types_service   = self.types_status__service)
+
+        timings = service.get_full_status().status.timings
+
+        assert [str(timing.component) for timing in timings] == ['storage', 'types']
+        assert all(timing.cached is False and timing.stale is False for timing in timings)
+
+    def test__get_full_status__component_cache(self):                            # Fresh results are reused until their TTL
+        service = Server__Status__Service(storage_service = self.storage_status__service)
+        with patch.object(Storage__Status__Service, 'get_status', wraps=self.storage_status__service.get_status) as get_status:
+            first  = service.get_full_status().status
+            second = service.get_full_status().status
+            assert get_status.call_count        == 1
+            assert first.timings[0].cached       is False
+            assert second.timings[0].cached      is True
+            assert second.storage.obj()          == first.storage.obj()
+
+            service.cache_invalidate('storage')
+            service.get_full_status()
+            assert get_status.call_count        == 2
+
+    def test__get_full_status__slow_component_is_stale(self):                    # A slow git collector doesn't hold up the response
+        service = Server__Status__Service(storage_service   = self.storage_status__service,
+                                          git_service       = self.git_status__service    ,
+                                          component_timeout = {'git': 0.1}                ,
+                                          component_ttl     = {'git': 0  }                )
+        def slow_status():
+            time.sleep(0.5)
+            return previous
+        previous = self.git_status__service.get_status()
+        with patch.object(Git__Status__Service, 'get_status', side_effect=slow_status):
+            start    = time.monotonic()
+            status   = service.get_full_status().status
+            duration = time.monotonic() - start
+            timings  = {str(timing.component): timing for timing in status.timings}
+
+            assert duration                     < 0.4
+            assert status.stale                 is True
+            assert status.git                   is None                          # nothing cached yet
+            assert timings['git'    ].timed_out is True
+            assert timings['storage'].stale     is False
+            assert status.storage               is not None
+
+            time.sleep(0.6)                                                      # background run finished and filled the cache
+            service.component_timeout['git'] = 0.0
+            status = service.get_full_status().status                            # new run starts, times out at once
+            assert status.stale                 is True
+            assert status.git                   is not None                      # last known result served
+
     def test__get_full_status__missing_services(self):                           # Test with missing services
         service = Server__Status__Service()                                      # No services configured
 
@@ -4,11 +4,14 @@
 # ═══════════════════════════════════════════════════════════════════════════════
 
 from unittest                                                                                               import TestCase
+from unittest.mock                                                                                          import patch
 
 from osbot_utils.testing.__ import __
 from osbot_utils.utils.Files                                                                                import temp_folder, folder_delete_recursively
 from memory_fs.storage_fs.providers.Storage_FS__Local_Disk                                                  import Storage_FS__Local_Disk
 from memory_fs.storage_fs.providers.Storage_FS__Memory                                                      import Storage_FS__Memory
+from memory_fs.helpers.Memory_FS__In_Memory                                                                 import Memory_FS__In_Memory
+from issues_fs.issues.graph_services.Graph__Repository             import Graph__Repository
 from issues_fs.schemas.status.Schema__Storage__Status                      import Schema__Storage__Status
 from issues_fs.issues.status.Storage__Status__Service              import Storage__Status__Service
 
@@ -92,7 +95,10 @@ class test_Storage__Status__Service(TestCase):
                                       root_path='',
                                       is_connected=True,
                                       is_writable=True,
-                                      file_count=3)
+                                      file_count=3,
+                                      total_bytes=0,
+                                      files_by_prefix=__(),
+                                      bytes_by_prefix=__())
 
 
 
@@ -118,4 +124,71 @@ class test_Storage__Status__Service(TestCase):
     def test___check_connection__success(self):                                  # Test successful connection
         with self.storage_status__memory as _:
             assert _._check_connection() is True
-            assert _._check_writable() is True                                   # Test writable success
\ No newline at end of file
+            assert _._check_writable() is True                                   # Test writable success
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # Live Counter + Cached Probe Tests
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    def create_repository_service(self):                                        # Status service backed by a repository
+        repository = Graph__Repository(memory_fs=Memory_FS__In_Memory())
+        return repository, Storage__Status__Service(storage_fs=repository.storage_fs, repository=repository)
+
+    def test__get_status__repository_counters(self):                             # Counts come from the path index, kept live by writes
+        repository, service = self.create_repository_service()
+        repository.node_cache_enabled = True                                     # kept index (as with a watcher)
+        repository.file_save('data/task/Task-1/issue.json', b'12345')
+        repository.file_save('data/task/Task-2/issue.json', b'123'  )
+        repository.file_save('config/types.json'         , b'12'   )
+
+        status = service.get_status()
+        assert int(status.file_count)  == 3
+        assert int(status.total_bytes) == 10
+        assert status.files_by_prefix  == {'data': 2, 'config': 1}
+        assert status.bytes_by_prefix  == {'data': 8, 'config': 2}
+
+        with patch.object(repository.storage_fs, 'files__paths') as files__paths:   # no listing once the index exists
+            repository.file_save  ('data/task/Task-1/issue.json', b'1')              # overwrite adjusts bytes
+            repository.file_delete('config/types.json')
+            status = service.get_status()
+        assert files__paths.call_count == 0
+        assert int(status.file_count)  == 2
+        assert int(status.total_bytes) == 4
+        assert status.files_by_prefix  == {'data': 2}
+
+    def test__get_status__repository_counters__sizes_from_existing_files(self): # Index built over files written before it existed
+        repository, service = self.create_repository_service()
+        repository.storage_fs.file__save('data/a.json', b'1234')
+        assert int(service.get_status().total_bytes) == 4
+
+    def test__get_status__repository_counters__without_watcher(self):          # no kept index: each status lists storage once
+        repository, service = self.create_repository_service()
+        repository.file_save('data/task/Task-1/issue.json', b'12345')
+        assert int(service.get_status().file_count) == 1
+
+        repository.storage_fs.file__save('data/task/Task-1/comments/c-1.json', b'123')   # not through the repository
+        with patch.object(repository.storage_fs, 'files__paths', wraps=repository.storage_fs.files__paths) as files__paths:
+            status = service.get_status()
+        assert files__paths.call_count == 1
+        assert int(status.file_count)  == 2
+        assert int(status.total_bytes) == 8
+        assert status.files_by_prefix  == {'data': 2}
+
+    def test___is_writable__probe_cached(self):                                  # One probe per TTL
+        repository, service = self.create_repository_service()
+        with patch.object(service, '_check_writable', return_value=True) as check_writable:
+            for _ in range(5):
+                assert service.get_status().is_writable is True
+            assert check_writable.call_count == 1
+            service.writable_ttl = 0                                             # expired
+            service.get_status()
+            assert check_writable.call_count == 2
+
+    def test___is_writable__reprobe_after_write_failure(self):                   # A failed write re-runs the probe early
+        repository, service = self.create_repository_service()
+        with patch.object(service, '_check_writable', return_value=True) as check_writable:
+            service.get_status()
+            with patch.object(repository.storage_fs, 'file__save', return_value=False):
+                assert repository.file_save('data/x.json', b'x') is False
+            check_writable.return_value = False
+            assert service.get_status().is_writable is False
+            assert check_writable.call_count == 2
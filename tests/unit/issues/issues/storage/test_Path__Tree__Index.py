@@ -0,0 +1,78 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# test_Path__Tree__Index - Tests for the directory trie over storage paths
+# ═══════════════════════════════════════════════════════════════════════════════
+
+from unittest                                                                                import TestCase
+from osbot_utils.type_safe.Type_Safe                                                         import Type_Safe
+from osbot_utils.utils.Objects                                                               import base_types
+from issues_fs.issues.storage.Path__Tree__Index                                              import Path__Tree__Index, Path__Tree__Node
+
+PATHS = ['data/task/Task-1/issue.json'                      ,
+         'data/task/Task-1/issues/Bug-1/issue.json'         ,
+         'data/task/Task-1/issues/Bug-2/attachments/log.txt',
+         'data/task/Task-1/issues/.gitkeep'                 ,
+         'config/node-types.json'                           ]
+
+
+class test_Path__Tree__Index(TestCase):
+
+    def setUp(self):
+        self.index = Path__Tree__Index().build(PATHS)
+
+    def test__init__(self):
+        with Path__Tree__Index() as _:
+            assert type(_)         is Path__Tree__Index
+            assert base_types(_)   == [Type_Safe, object]
+            assert type(_.root)    is Path__Tree__Node
+            assert _.count_files() == 0
+
+    def test_lookups(self):
+        with self.index as _:
+            assert _.count_files()                                             == 5
+            assert _.count_files('data/task/Task-1/issues')                    == 3
+            assert _.folder_exists('data/task/Task-1/issues')                  is True
+            assert _.folder_exists('data/task/Task-9')                         is False
+            assert _.folder_exists('data/task/Task-1/issue.json')              is False     # a file, not a folder
+            assert _.file_exists  ('data/task/Task-1/issue.json')              is True
+            assert _.file_exists  ('config/link-types.json')                   is False
+            assert sorted(_.child_names('data/task/Task-1/issues'))            == ['Bug-1', 'Bug-2']
+            assert _.child_folders_with('data/task/Task-1/issues', 'issue.json') == ['Bug-1']  # Bug-2 has no issue marker
+            assert _.child_names('missing')                                    == []
+
+    def test_add_file__idempotent(self):
+        assert self.index.add_file('data/task/Task-1/issue.json') is False
+        assert self.index.add_file('/data/bug/Bug-3/issue.json')  is True       # leading / ignored
+        assert self.index.count_files()                            == 6
+        assert self.index.file_exists('data/bug/Bug-3/issue.json') is True
+
+    def test_remove_file__prunes_empty_folders(self):
+        assert self.index.remove_file('data/task/Task-1/issues/Bug-2/attachments/log.txt') is True
+        assert self.index.remove_file('data/task/Task-1/issues/Bug-2/attachments/log.txt') is False
+        assert self.index.folder_exists('data/task/Task-1/issues/Bug-2')                   is False
+        assert sorted(self.index.child_names('data/task/Task-1/issues'))                   == ['Bug-1']
+        assert self.index.count_files()                                                    == 4
+
+        self.index.remove_file('config/node-types.json')
+        assert self.index.child_names('') == ['data']
+
+    def test_files_under(self):
+        assert sorted(self.index.files_under('data/task/Task-1/issues')) == ['.gitkeep', 'Bug-1/issue.json', 'Bug-2/attachments/log.txt']
+        assert self.index.files_under('missing')                         == []
+
+    def test_byte_counts(self):                                                  # sizes roll up to every parent folder
+        index = Path__Tree__Index()
+        index.add_file('data/a.json'       , 10)
+        index.add_file('data/task/b.json'  , 5 )
+        index.add_file('config/types.json' , None)                               # unknown size: counted as a file only
+        assert index.count_bytes()               == 15
+        assert index.count_bytes('data/task')    == 5
+        assert index.unsized_count               == 1
+        assert index.counts_by_child()           == {'data': (2, 15), 'config': (1, 0)}
+
+        assert index.add_file('data/task/b.json', 7) is False                    # overwrite
+        assert index.count_bytes('data')         == 17
+        index.remove_file('data/a.json')
+        assert index.count_bytes()               == 7
+        assert index.file_size('data/task/b.json') == 7
+        index.remove_file('config/types.json')
+        assert index.unsized_count               == 0
@@ -194,3 +194,29 @@ class test__Factory__Issues_File__Nodes(TestCase):
 
         assert len(task.links) == 1                                             # has-task -> Sub-Task-1
         assert str(task.links[0].target_label) == 'Sub-Task-1'
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Deterministic Identity
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__create_nodes__deterministic(self):                                # same input -> identical nodes
+        lines = [Schema__Issues_File__Line(label='Task-1', status='todo', description='Parent', line_number=1, issue_type='task'),
+                 Schema__Issues_File__Line(label='Bug-1' , status='todo', description='Child -> Task-1', indent_level=1,
+                                           parent_label='Task-1', cross_refs=['Task-1'], line_number=2, issue_type='bug')]
+
+        nodes_1, _ = self.factory.create_nodes(lines, 'a.issues', 1700000000000)
+        nodes_2, _ = self.factory.create_nodes(lines, 'a.issues', 1700000000000)
+
+        assert [n.json() for n in nodes_1] == [n.json() for n in nodes_2]
+        assert int(nodes_1[0].created_at)  == 1700000000000
+        assert int(nodes_1[0].links[0].created_at) == 1700000000000
+        assert str(nodes_1[1].links[0].target_id)  == str(nodes_1[0].node_id)
+
+    def test__create_nodes__id_depends_on_source_file(self):
+        line     = Schema__Issues_File__Line(label='Task-1', status='todo', description='A', line_number=1, issue_type='task')
+        node_a,_ = self.factory.create_node(line, 'a.issues')
+        node_b,_ = self.factory.create_node(line, 'b.issues')
+
+        assert str(node_a.node_id)    != str(node_b.node_id)
+        assert str(node_a.node_id)    == str(self.factory.node_id('a.issues', 'Task-1'))
+        assert str(node_a.created_by) == str(self.factory.created_by('a.issues'))
@@ -7,6 +7,10 @@ from osbot_utils.type_safe.Type_Safe
 from osbot_utils.utils.Objects                                                  import base_classes
 from issues_fs.issues.issues_file.Issues_File__Check__Service                   import Issues_File__Check__Service
 from issues_fs.issues.issues_file.Issues_File__Check__Service                   import Schema__Issues_File__Check__Summary
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.issues.issues_file.Parser__Issues_File                           import Parser__Issues_File
+from issues_fs.issues.issues_file.Factory__Issues_File__Nodes                   import Factory__Issues_File__Nodes
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
 
 
 class test__Issues_File__Check__Service(TestCase):
@@ -190,3 +194,64 @@ class test__Issues_File__Check__Service(TestCase):
         summary = self.checker.check_content(content)
         assert summary.is_valid     is True
         assert summary.total_issues == 0
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Single Pass + Repository Checks
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__check_multiple__parses_each_file_once(self):
+        parsed = []
+        class Parser(Parser__Issues_File):
+            def parse_records(self, content, indent_seen=None):
+                parsed.append(content)
+                return super().parse_records(content, indent_seen)
+
+        checker = Issues_File__Check__Service(loader=Issues_File__Loader__Service(parser=Parser()))
+        summary = checker.check_multiple([('Task-1 | todo | Needs -> Bug-9'     , 'tasks.issues'),
+                                          ('Bug-1 | confirmed | A\n\tBug-1 | x | B', 'bugs.issues' )])
+
+        assert len(parsed)               == 2
+        assert summary.broken_refs       == ['Bug-9']
+        assert summary.duplicate_labels  == ['Bug-1']
+        assert summary.files_checked     == ['tasks.issues', 'bugs.issues']
+
+    def test__check_multiple__builds_no_nodes(self):                             # counts come from the records-only path
+        class Factory(Factory__Issues_File__Nodes):
+            def create_nodes(self, *args, **kwargs):
+                raise AssertionError('create_nodes should not be called')
+
+        files   = [('Task-1 | todo | Needs -> Bug-9\nbad line\nTask-x | todo | No index', 'tasks.issues'),
+                   ('Bug-1 | confirmed | A\n\tBug-1 | x | B'                         , 'bugs.issues' )]
+        checker = Issues_File__Check__Service(loader=Issues_File__Loader__Service(node_factory=Factory()))
+        summary = checker.check_multiple(files)
+        eager   = self.checker.check_results(self.checker.loader.load_each(files))     # same answers as the full load
+
+        assert summary.json() == eager.json()
+        assert summary.total_errors == 2
+
+    def test__check_repository__reuses_cached_parses(self):
+        repository = Graph__Repository__Factory.create_memory()
+        repository.storage_fs.file__save('tasks.issues', b'Task-1 | todo | Needs -> Bug-1')
+        repository.storage_fs.file__save('bugs.issues' , b'Bug-1 | confirmed | The bug')
+        repository.issues_files_load()
+
+        summary = self.checker.check_repository(repository)
+        assert summary.is_valid      is True
+        assert summary.total_issues  == 2
+        assert repository.issues_files_refresh() == []                          # nothing re-parsed
+
+        repository.storage_fs.file__save('bugs.issues', b'Bug-2 | confirmed | Renamed')
+        summary = self.checker.check_repository(repository)
+        assert summary.broken_refs   == ['Bug-1']
+
+    def test__check_repository__follows_discovery_order(self):
+        repository = Graph__Repository__Factory.create_memory()
+        repository.storage_fs.file__save('a.issues', b'Task-1 | todo | First')
+        repository.storage_fs.file__save('b.issues', b'Task-2 | todo | Second')
+        repository.issues_files_load()
+        discovered = repository.issues_files_discover()
+
+        repository.storage_fs.file__save(discovered[0], b'Task-3 | todo | Edited')   # re-parsed, must keep its place
+        results = repository.issues_files_results()
+        assert [result.files_loaded[0] for result in results] == discovered
+        assert list(repository.issues_file_cache)             == discovered
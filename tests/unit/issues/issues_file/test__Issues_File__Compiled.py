@@ -0,0 +1,61 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# test__Issues_File__Compiled - Tests for the JSON encoding of load results
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import json
+import pickle
+import zlib
+from unittest                                                                   import TestCase
+from issues_fs.issues.issues_file.Issues_File__Compiled                         import Issues_File__Compiled
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.issues.issues_file.Parser__Issues_File                           import PARSER_VERSION
+
+
+class test__Issues_File__Compiled(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.compiled = Issues_File__Compiled()
+        cls.result   = Issues_File__Loader__Service().load_content('Task-1 | todo | A -> Task-2\n\tTask-2 | done | B', 'a.issues')
+
+    def test__encode_decode__round_trip(self):
+        data    = self.compiled.encode(self.result, '10:abc')
+        decoded = self.compiled.decode(data, '10:abc')
+
+        assert data.startswith(f'{PARSER_VERSION}\n10:abc\n'.encode()) is True
+        assert decoded.json() == self.result.json()
+
+    def test__decode__fingerprint_mismatch(self):
+        data = self.compiled.encode(self.result, '10:abc')
+        assert self.compiled.decode(data, '10:xyz') is None
+        assert self.compiled.decode(b''  , '10:abc') is None
+
+    def test__decode__corrupt_payload(self):
+        header = f'{PARSER_VERSION}\n10:abc\n'.encode()
+        assert self.compiled.decode(header + b'not zlib', '10:abc') is None
+
+    def test__decode__rejects_pickles(self):                                    # sidecars are JSON only
+        payload = pickle.dumps(self.result.json())
+        data    = f'{PARSER_VERSION}\n10:abc\n'.encode() + zlib.compress(payload)
+        assert self.compiled.decode(data, '10:abc') is None
+
+    def test__decode__values_go_through_declared_types(self):                   # the schema, not the file, picks the classes
+        raw = self.result.json()
+        raw['nodes'][0]['status'] = 'Not A Valid Status'
+        assert self.compiled.decode(self.encode_raw(raw), '10:abc') is None
+
+        raw = self.result.json()
+        raw['nodes'][0]['links'] = [{'py/object': 'os.system'}]
+        assert self.compiled.decode(self.encode_raw(raw), '10:abc') is None
+
+        raw = self.result.json()
+        del raw['nodes'][0]['label']
+        assert self.compiled.decode(self.encode_raw(raw), '10:abc') is None
+
+    def test__decode__collections_stay_type_safe(self):
+        decoded = self.compiled.decode(self.compiled.encode(self.result, '10:abc'), '10:abc')
+        with self.assertRaises(TypeError):
+            decoded.nodes[0].links.append('not a link')
+
+    def encode_raw(self, raw: dict) -> bytes:
+        return f'{PARSER_VERSION}\n10:abc\n'.encode() + zlib.compress(json.dumps(raw).encode())
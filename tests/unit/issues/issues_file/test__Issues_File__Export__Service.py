@@ -0,0 +1,94 @@
+# ═══════════════════════════════════════════════════════════════════════════════
+# test__Issues_File__Export__Service - Tests for JSON tree -> .issues export
+# ═══════════════════════════════════════════════════════════════════════════════
+
+import io
+import json
+from unittest                                                                   import TestCase
+from memory_fs.storage_fs.providers.Storage_FS__Memory                          import Storage_FS__Memory
+from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
+from osbot_utils.utils.Objects                                                  import base_classes
+from issues_fs.issues.issues_file.Issues_File__Export__Service                  import Issues_File__Export__Service
+from issues_fs.issues.issues_file.Issues_File__Normalise__Service               import Issues_File__Normalise__Service
+from issues_fs.issues.issues_file.Parser__Issues_File                           import Parser__Issues_File
+
+
+class test__Issues_File__Export__Service(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.exporter = Issues_File__Export__Service()
+        cls.parser   = Parser__Issues_File()
+
+    def setUp(self):
+        self.storage = Storage_FS__Memory()
+
+    def save_issue(self, folder, label, status, title, links=()):
+        data = dict(label=label, status=status, title=title,
+                    links=[dict(verb='relates-to', target_label=target) for target in links])
+        self.storage.file__save(f'{folder}/issue.json', json.dumps(data).encode())
+
+    def test__init__(self):
+        with self.exporter as _:
+            assert type(_)         is Issues_File__Export__Service
+            assert base_classes(_) == [Type_Safe, object]
+
+    def test__export__hierarchy_and_refs(self):
+        self.save_issue('data/task/Task-1'                       , 'Task-1'    , 'todo'     , 'Parent'     , links=['Task-1-x', 'Sub-Task-1', 'Bug-10'])
+        self.save_issue('data/task/Task-1/issues/Sub-Task-1'     , 'Sub-Task-1', 'done'     , 'Child'      )
+        self.save_issue('data/task/Task-1/issues/Sub-Task-1/issues/Note-1', 'Note-1', 'open', 'Grandchild' )
+        self.save_issue('data/task/Task-2'                       , 'Task-2'    , 'todo'     , 'Second'     )
+        self.save_issue('data/bug/Bug-10'                        , 'Bug-10'    , 'confirmed', 'Multi\nline')
+        self.save_issue('data/bug/Bug-2'                         , 'Bug-2'     , ''         , 'No status'  )
+        self.storage.file__save('data/task/_index.json', b'{}')
+
+        assert self.exporter.export_to_str(self.storage).split('\n') == ['Bug-2 | backlog | No status'       ,
+                                                                         'Bug-10 | confirmed | Multi line'   ,
+                                                                         'Task-1 | todo | Parent -> Bug-10'  ,
+                                                                         '\tSub-Task-1 | done | Child'        ,
+                                                                         '\t\tNote-1 | open | Grandchild'     ,
+                                                                         'Task-2 | todo | Second'            ]
+
+    def test__export__round_trip(self):                                          # .issues -> JSON -> .issues
+        content = ('Workstream-1 | todo | Observability\n'
+                   '\tTask-1 | in-progress | Enable logs\n'
+                   '\tTask-2 | todo | Ship dashboards -> Bug-1\n'
+                   'Bug-1 | confirmed | Missing metrics')
+        Issues_File__Normalise__Service().normalise_to_storage([(content, 'ws.issues')], self.storage)
+        for child in ('Task-1', 'Task-2'):                                      # move children under their parent folder
+            data = self.storage.file__bytes(f'data/task/{child}/issue.json')
+            self.storage.file__delete(f'data/task/{child}/issue.json')
+            self.storage.file__save(f'data/workstream/Workstream-1/issues/{child}/issue.json', data)
+
+        exported = self.exporter.export_to_str(self.storage)
+        original = self.parser.parse(content)
+        reparsed = self.parser.parse(exported)
+
+        def summary(result):                                                    # titles are sanitised on save ('>' -> '_'), so not compared
+            return sorted((i.label, i.status, i.parent_label, tuple(i.cross_refs)) for i in result.issues)
+        assert reparsed.errors     == []
+        assert summary(reparsed)   == summary(original)
+        assert 'Task-1 | in-progress | Enable logs' in exported
+
+    def test__export__unreadable_issue_keeps_subtree(self):                     # broken parent: placeholder + error line, children kept
+        self.save_issue('data/task/Task-1/issues/Sub-Task-1', 'Sub-Task-1', 'done', 'Child')
+        self.save_issue('data/task/Task-2'                  , 'Task-2'    , 'todo', 'Second')
+        self.storage.file__save('data/task/Task-1/issue.json', b'{not json')
+        self.storage.file__save('data/task/Task-2/issue.json', b'')
+
+        exported = self.exporter.export_to_str(self.storage)
+        reparsed = self.parser.parse(exported)
+
+        assert exported.split('\n') == ['# unreadable: data/task/Task-1/issue.json',
+                                        'Task-1 | unreadable | '                   ,
+                                        '\tSub-Task-1 | done | Child'              ,
+                                        '# unreadable: data/task/Task-2/issue.json',
+                                        'Task-2 | unreadable | '                   ]
+        assert [(i.label, i.parent_label) for i in reparsed.issues if i.label == 'Sub-Task-1'] == [('Sub-Task-1', 'Task-1')]
+
+    def test__export_to_stream(self):
+        self.save_issue('data/task/Task-1', 'Task-1', 'todo', 'Only')
+        stream = io.StringIO()
+
+        assert self.exporter.export_to_stream(self.storage, stream) == 1
+        assert stream.getvalue()                                     == 'Task-1 | todo | Only\n'
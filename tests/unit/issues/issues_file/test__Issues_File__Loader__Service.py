@@ -7,6 +7,15 @@ from osbot_utils.type_safe.Type_Safe
 from osbot_utils.utils.Objects                                                  import base_classes
 from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
 from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Schema__Issues_File__Load__Result
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Schema__Issues_File__Records__Result
+from issues_fs.issues.issues_file.Factory__Issues_File__Nodes                   import Factory__Issues_File__Nodes
+
+
+class Factory__Upper_Status(Factory__Issues_File__Nodes):                       # customised factory: parallel must honour it
+    def line_fields(self, line):
+        fields = super().line_fields(line)
+        fields['title'] = fields['title'].upper()
+        return fields
 
 
 class test__Issues_File__Loader__Service(TestCase):
@@ -75,6 +84,21 @@ class test__Issues_File__Loader__Service(TestCase):
         assert str(task.links[0].verb)      == 'relates-to'
         assert str(task.links[0].target_label) == 'Bug-1'
 
+    def test__load_records__matches_load_content(self):                         # same counts/errors/refs, no Schema__Node
+        content = ('Task-1 | todo | Fix login -> Bug-1\n'
+                   'bad line no pipes\n'
+                   '\tBug-1 | confirmed | Login broken\n'
+                   '    Bug-2 | c@nfirmed! | Bad status')
+        result  = self.loader.load_records(content, 'refs.issues')
+        nodes   = self.loader.load_content(content, 'refs.issues')
+
+        assert type(result)         is Schema__Issues_File__Records__Result
+        assert result.items         == [(str(node.label), str(node.node_type), str(node.status)) for node in nodes.nodes]
+        assert result.total_issues  == nodes.total_issues
+        assert result.cross_refs    == nodes.cross_refs    == ['Bug-1']
+        assert result.mixed_indent  == nodes.mixed_indent  == ['refs.issues']
+        assert [error.json() for error in result.errors] == [error.json() for error in nodes.errors]
+
     def test__load_content__empty(self):
         result = self.loader.load_content('', 'empty.issues')
         assert result.total_issues == 0
@@ -160,3 +184,73 @@ class test__Issues_File__Loader__Service(TestCase):
         assert len(answer.links)                == 1
         assert str(answer.links[0].verb)        == 'relates-to'
         assert str(answer.links[0].target_label) == 'Question-1'
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Parallel Loading
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__load_multiple__parallel_matches_serial(self):
+        files = [(f'Task-{i} | todo | Parent {i}\n'
+                  f'\tBug-{i} | confirmed | Child {i} -> Task-{i}\n'
+                  f'broken line {i}', f'file-{i}.issues') for i in range(1, 7)]
+        serial   = Issues_File__Loader__Service(parallel_workers=1).load_multiple(files)
+        parallel = Issues_File__Loader__Service(parallel_workers=2, parallel_threshold=2).load_multiple(files)
+
+        def summary(result):
+            return [(str(n.label), str(n.status), [(str(l.verb), str(l.target_label)) for l in n.links]) for n in result.nodes]
+
+        assert parallel.files_loaded  == [source for _, source in files]        # merged in input order
+        assert summary(parallel)      == summary(serial)
+        assert parallel.total_issues  == 12
+        assert len(parallel.errors)   == 6
+
+    def test__load_multiple__parallel_results_stay_type_safe(self):
+        files  = [(f'Task-{i} | todo | Item {i}', f'file-{i}.issues') for i in range(1, 3)]
+        loader = Issues_File__Loader__Service(parallel_workers=2, parallel_threshold=2)
+        result = loader.load_multiple(files)
+        node   = result.nodes[0]
+
+        with self.assertRaises(TypeError):
+            node.links.append('not a link')                                      # collections keep their expected_type
+
+    def test__load_each__serial_by_default(self):
+        calls = []
+        class Loader(Issues_File__Loader__Service):
+            def load_each__parallel(self, files, workers):
+                calls.append(len(files))
+                return super().load_each__parallel(files, workers)
+
+        assert Loader().parallel_workers == 1
+        Loader(parallel_threshold=1).load_each([('Task-1 | todo | A', 'a.issues'), ('Task-2 | todo | B', 'b.issues')])
+        assert calls == []
+
+    def test__load_each__parallel_uses_configured_node_factory(self):
+        files    = [(f'Task-{i} | todo | item {i}', f'file-{i}.issues') for i in range(1, 5)]
+        serial   = Issues_File__Loader__Service(node_factory=Factory__Upper_Status()).load_multiple(files)
+        parallel = Issues_File__Loader__Service(node_factory       = Factory__Upper_Status(),
+                                                parallel_workers   = 2                      ,
+                                                parallel_threshold = 2                      ).load_multiple(files)
+
+        assert [str(node.title) for node in parallel.nodes] == [str(node.title) for node in serial.nodes] == ['ITEM 1', 'ITEM 2', 'ITEM 3', 'ITEM 4']
+
+    def test__load_each__unpicklable_loader_falls_back_to_serial(self):
+        class Loader(Issues_File__Loader__Service):                              # local class: can't be sent to a worker
+            pass
+
+        files  = [(f'Task-{i} | todo | Item {i}', f'file-{i}.issues') for i in range(1, 4)]
+        result = Loader(parallel_workers=2, parallel_threshold=2).load_multiple(files)
+        assert result.total_issues == 3
+        assert result.files_loaded == ['file-1.issues', 'file-2.issues', 'file-3.issues']
+
+    def test__load_each__below_threshold_is_serial(self):
+        calls = []
+        class Loader(Issues_File__Loader__Service):
+            def load_each__parallel(self, files, workers):
+                calls.append(len(files))
+                return super().load_each__parallel(files, workers)
+
+        loader = Loader(parallel_workers=2, parallel_threshold=3)
+        loader.load_each([('Task-1 | todo | A', 'a.issues'), ('Task-2 | todo | B', 'b.issues')])
+        assert calls == []
+        loader.load_each([('Task-1 | todo | A', 'a.issues'), ('Task-2 | todo | B', 'b.issues'), ('Task-3 | todo | C', 'c.issues')])
+        assert calls == [3]
@@ -4,9 +4,11 @@
 
 import json
 from unittest                                                                   import TestCase
+from memory_fs.storage_fs.providers.Storage_FS__Memory                          import Storage_FS__Memory
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from osbot_utils.utils.Objects                                                  import base_classes
 from issues_fs.issues.issues_file.Issues_File__Normalise__Service               import Issues_File__Normalise__Service
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
 
 
 class test__Issues_File__Normalise__Service(TestCase):
@@ -148,3 +150,74 @@ class test__Issues_File__Normalise__Service(TestCase):
         file_map, errors = self.normaliser.normalise_to_dict('')
         assert len(file_map) == 0
         assert len(errors)   == 0
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Incremental Sync to Storage
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__normalise_to_storage__first_run(self):
+        storage = Storage_FS__Memory()
+        files   = [('Task-1 | todo | A\nTask-2 | todo | B\nbad line', 'tasks.issues')]
+        result  = self.normaliser.normalise_to_storage(files, storage, batch_size=1)
+
+        assert (result.created, result.updated, result.unchanged, result.removed) == (2, 0, 0, 0)
+        assert result.batches                                                      == 2
+        assert len(result.errors)                                                  == 1
+        assert json.loads(storage.file__str('data/task/Task-1/issue.json'))['title'] == 'A'
+
+    def test__normalise_to_storage__only_changes_written(self):
+        storage = Storage_FS__Memory()
+        self.normaliser.normalise_to_storage([('Task-1 | todo | A\nTask-2 | todo | B\nTask-3 | todo | C', 'tasks.issues')], storage)
+
+        result = self.normaliser.normalise_to_storage([('Task-1 | todo | A\nTask-2 | done | B\nTask-4 | todo | D', 'tasks.issues')], storage)
+
+        assert (result.created, result.updated, result.unchanged, result.removed) == (1, 1, 1, 1)
+        assert storage.file__exists('data/task/Task-3/issue.json')               is False
+        assert json.loads(storage.file__str('data/task/Task-2/issue.json'))['status'] == 'done'
+
+    def test__normalise_to_storage__idempotent(self):
+        storage = Storage_FS__Memory()
+        files   = [('Task-1 | todo | A\n\tBug-1 | todo | B', 'tasks.issues')]
+        self.normaliser.normalise_to_storage(files, storage)
+
+        result = self.normaliser.normalise_to_storage(files, storage)
+        assert (result.created, result.updated, result.unchanged, result.removed) == (0, 0, 2, 0)
+        assert result.batches                                                      == 0
+
+    def test__normalise_to_storage__leaves_other_files(self):                   # only files from the manifest are removed
+        storage = Storage_FS__Memory()
+        storage.file__save('data/task/Task-9/issue.json', b'{}')
+        self.normaliser.normalise_to_storage([('Task-1 | todo | A', 'tasks.issues')], storage)
+        result = self.normaliser.normalise_to_storage([('Task-2 | todo | B', 'tasks.issues')], storage)
+
+        assert result.removed                                      == 1
+        assert storage.file__exists('data/task/Task-9/issue.json') is True
+
+    def test__normalise_to_storage__keeps_edited_files(self):                   # edited since the last sync: reported, not deleted
+        storage = Storage_FS__Memory()
+        self.normaliser.normalise_to_storage([('Task-1 | todo | A\nTask-2 | todo | B', 'tasks.issues')], storage)
+        storage.file__save('data/task/Task-1/issue.json', b'{"label": "Task-1", "links": ["added in the UI"]}')
+
+        result = self.normaliser.normalise_to_storage([('Task-3 | todo | C', 'tasks.issues')], storage)
+
+        assert result.removed                                      == 1          # Task-2 still held what we wrote
+        assert result.conflicts                                    == ['data/task/Task-1/issue.json']
+        assert storage.file__exists('data/task/Task-1/issue.json') is True
+        assert storage.file__exists('data/task/Task-2/issue.json') is False
+
+    def test__normalise_to_storage__needs_a_target(self):
+        result = self.normaliser.normalise_to_storage([('Task-1 | todo | A', 'tasks.issues')])
+        assert result.errors  == ['normalise_to_storage needs a storage_fs or a repository']
+        assert result.created == 0
+
+    def test__normalise_to_storage__through_repository(self):                   # path index sees created / removed files
+        repository = Graph__Repository__Factory.create_memory()
+        repository.node_cache_enabled = True                                     # kept index (as with a watcher)
+        path_index = repository.path_index_get()
+        self.normaliser.normalise_to_storage([('Task-1 | todo | A', 'tasks.issues')], repository=repository)
+
+        assert path_index.file_exists('data/task/Task-1/issue.json') is True
+        assert path_index.child_names('data/task')                    == ['Task-1']
+
+        self.normaliser.normalise_to_storage([('Task-2 | todo | B', 'tasks.issues')], repository=repository)
+        assert path_index.child_names('data/task')                    == ['Task-2']
@@ -2,12 +2,16 @@
 # test__Issues_File__Schema__Service - Tests for schema validation
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import io
 from unittest                                                                   import TestCase
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from osbot_utils.utils.Objects                                                  import base_classes
 from issues_fs.issues.issues_file.Issues_File__Schema__Service                  import Issues_File__Schema__Service
 from issues_fs.issues.issues_file.Issues_File__Schema__Service                  import Schema__Issues_Type__Definition
 from issues_fs.issues.issues_file.Issues_File__Schema__Service                  import PREDEFINED_SCHEMAS
+from issues_fs.issues.issues_file.Issues_File__Loader__Service                  import Issues_File__Loader__Service
+from issues_fs.issues.graph_services.Graph__Repository__Factory                 import Graph__Repository__Factory
+from issues_fs.issues.graph_services.Type__Service                              import Type__Service
 
 
 class test__Issues_File__Schema__Service(TestCase):
@@ -227,3 +231,90 @@ class test__Issues_File__Schema__Service(TestCase):
         summary = self.checker.check_content('')
         assert summary.is_valid      is True
         assert summary.total_checked == 0
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Batch Validation
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__status_sets__compiled_once_and_reset_on_register(self):
+        checker = Issues_File__Schema__Service()
+        assert checker.status_sets is None
+
+        checker.check_content('Task-1 | todo | A task')
+        assert checker.status_sets['task'] == frozenset(PREDEFINED_SCHEMAS['task'].valid_statuses)
+
+        checker.register_schema(Schema__Issues_Type__Definition(name='widget', valid_statuses=['active']))
+        assert checker.status_sets is None
+        assert checker.check_content('Widget-1 | active | ok').unknown_types == []
+
+    def test__check_nodes__already_loaded(self):
+        content = ('Task-1 | todo | Good\n'
+                   'Bug-1 | todo | Wrong status')
+        nodes   = Issues_File__Loader__Service().load_content(content, 'a.issues').nodes
+        summary = self.checker.check_nodes(nodes, 'a.issues')
+
+        assert summary.total_checked    == 2
+        assert summary.total_errors     == 1
+        assert summary.errors[0].label  == 'Bug-1'
+        assert summary.errors[0].source == 'a.issues'
+
+    def test__check_results(self):
+        loader  = Issues_File__Loader__Service()
+        results = loader.load_each([('Task-1 | confirmed | Bad', 'a.issues'),
+                                    ('Widget-1 | active | Custom', 'b.issues')])
+        summary = self.checker.check_results(results)
+
+        assert summary.total_checked    == 2
+        assert summary.errors[0].source == 'a.issues'
+        assert summary.unknown_types    == ['widget']
+
+    def test__check_stream__binary_file(self):
+        stream  = io.BytesIO(b'Task-1 | todo | One\n\tBug-1 | closed | Two\nTask-2 | closed | Three\n')
+        summary = self.checker.check_stream(stream, 'c.issues')
+
+        assert summary.total_checked   == 3
+        assert summary.total_errors    == 1
+        assert summary.errors[0].label == 'Task-2'
+
+    def test__check_content__skips_statuses_the_loader_rejects(self):                # same count as the node-based check
+        content = ('Task-1 | todo | Good\n'
+                   'Task-2 | In Progress | Not a valid status string')
+        summary = self.checker.check_content(content)
+        nodes   = Issues_File__Loader__Service().load_content(content).nodes
+
+        assert summary.total_checked == len(nodes) == 1
+        assert summary.is_valid      is True
+
+    def test__check_content__parity_with_loader_on_invalid_lines(self):         # rejected labels/statuses are not checked
+        content = ('Task-123456 | todo | Index too long\n'
+                   f'Task-2 | {"x" * 60} | Status too long\n'
+                   'Task-3 | todo | Good\n'
+                   'Mytype-1 | whatever | Unknown type\n'
+                   'Task-4 | nope | Bad status')
+        summary = self.checker.check_content(content)
+        nodes   = Issues_File__Loader__Service().load_content(content).nodes
+        by_node = self.checker.check_nodes(nodes)
+
+        assert summary.total_checked == by_node.total_checked == len(nodes) == 3
+        assert summary.total_errors  == by_node.total_errors  == 1
+        assert summary.unknown_types == by_node.unknown_types == ['mytype']
+
+    def test__register_type_service(self):
+        repository   = Graph__Repository__Factory.create_memory()
+        type_service = Type__Service(repository=repository)
+        type_service.create_node_type(name='widget', display_name='Widget', statuses=['active', 'retired'])
+        checker      = Issues_File__Schema__Service()
+        checker.register_type_service(type_service)
+
+        assert checker.get_schema('widget').valid_statuses == ['active', 'retired']
+        assert checker.check_content('Widget-1 | retired | ok').is_valid  is True
+        assert checker.check_content('Widget-1 | broken | no').is_valid   is False
+
+    def test__check_repository(self):
+        repository = Graph__Repository__Factory.create_memory()
+        repository.storage_fs.file__save('a.issues', b'Task-1 | todo | Good\nBug-1 | todo | Bad')
+        summary    = self.checker.check_repository(repository)
+
+        assert summary.total_checked    == 2
+        assert summary.total_errors     == 1
+        assert summary.errors[0].source == 'a.issues'
@@ -2,9 +2,11 @@
 # test__Parser__Issues_File - Tests for full .issues file parser
 # ═══════════════════════════════════════════════════════════════════════════════
 
+import io
 from unittest                                                                   import TestCase
 from osbot_utils.type_safe.Type_Safe                                            import Type_Safe
 from osbot_utils.utils.Objects                                                  import base_classes
+from issues_fs.issues.issues_file.Issues_File__Record                           import Issues_File__Record
 from issues_fs.issues.issues_file.Parser__Issues_File                           import Parser__Issues_File
 from issues_fs.issues.issues_file.Schema__Issues_File__Result                   import Schema__Issues_File__Result
 
@@ -271,3 +273,56 @@ class test__Parser__Issues_File(TestCase):
 
         assert result.issues[2].indent_level == 0
         assert result.issues[2].parent_label == ''
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Streaming (iter_parse)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    CONTENT = ('# header\n'
+               'Task-1 | todo | Parent\n'
+               '\tSub-Task-1 | todo | Child\n'
+               'not a valid line\n'
+               '\n'
+               'Task-2 | done | Sibling\r\n'
+               '    Bug-1 | confirmed | Space indented child')
+
+    def test__iter_parse__matches_parse(self):
+        batch   = self.parser.parse(self.CONTENT)
+        errors  = []
+        records = list(self.parser.iter_parse(self.CONTENT.split('\n'), errors))
+
+        assert [r.json() for r in records] == [r.json() for r in batch.issues]
+        assert [e.json() for e in errors ] == [e.json() for e in batch.errors]
+
+    def test__iter_parse__binary_file_object(self):
+        batch   = self.parser.parse(self.CONTENT)
+        errors  = []
+        records = list(self.parser.iter_parse(io.BytesIO(self.CONTENT.encode()), errors))
+
+        assert [r.json() for r in records] == [r.json() for r in batch.issues]
+        assert len(errors)                 == 1
+        assert errors[0].line_number       == 4
+
+    def test__iter_parse__is_lazy(self):                                        # records arrive before the input is exhausted
+        def lines():
+            yield 'Task-1 | todo | First'
+            raise AssertionError('read too far')
+
+        stream = self.parser.iter_parse(lines())
+        assert next(stream).label == 'Task-1'
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # Record Fast Path
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    def test__parse_records__matches_parse(self):
+        batch           = self.parser.parse(self.CONTENT)
+        records, errors = self.parser.parse_records(self.CONTENT)
+
+        assert type(records[0])                      is Issues_File__Record
+        assert [r.to_line().json() for r in records] == [r.json() for r in batch.issues]
+        assert [e.json() for e in errors]            == [e.json() for e in batch.errors]
+
+    def test__parse_records__no_instance_dict(self):                            # __slots__ keeps records small
+        records, _ = self.parser.parse_records('Task-1 | todo | First')
+        assert hasattr(records[0], '__dict__') is False